@@ -0,0 +1,68 @@
+"""add review rating sum and star histogram to vendors
+
+Revision ID: a1d6e9c3f7b2
+Revises: f3c8a6b2e1d4
+Create Date: 2026-01-21 15:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1d6e9c3f7b2'
+down_revision: Union[str, None] = 'f3c8a6b2e1d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+STAR_COLUMNS = ['rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5']
+
+
+def upgrade() -> None:
+    op.add_column(
+        'vendors',
+        sa.Column('rating_sum', sa.Float(), nullable=False, server_default='0')
+    )
+    for column in STAR_COLUMNS:
+        op.add_column(
+            'vendors',
+            sa.Column(column, sa.Integer(), nullable=False, server_default='0')
+        )
+
+    # --- Rebuild every vendor's aggregates from active reviews ---
+    # Stars round half up, like ReviewService (MySQL's ROUND on a FLOAT may round half to even)
+    op.execute(
+        """
+        UPDATE vendors v
+        LEFT JOIN (
+            SELECT vendor_id,
+                   COUNT(id) AS total_reviews,
+                   SUM(rating) AS rating_sum,
+                   SUM(CASE WHEN LEAST(GREATEST(FLOOR(rating + 0.5), 1), 5) = 1 THEN 1 ELSE 0 END) AS r1,
+                   SUM(CASE WHEN LEAST(GREATEST(FLOOR(rating + 0.5), 1), 5) = 2 THEN 1 ELSE 0 END) AS r2,
+                   SUM(CASE WHEN LEAST(GREATEST(FLOOR(rating + 0.5), 1), 5) = 3 THEN 1 ELSE 0 END) AS r3,
+                   SUM(CASE WHEN LEAST(GREATEST(FLOOR(rating + 0.5), 1), 5) = 4 THEN 1 ELSE 0 END) AS r4,
+                   SUM(CASE WHEN LEAST(GREATEST(FLOOR(rating + 0.5), 1), 5) = 5 THEN 1 ELSE 0 END) AS r5
+            FROM reviews
+            WHERE inactive = 0 OR inactive IS NULL
+            GROUP BY vendor_id
+        ) agg ON agg.vendor_id = v.id
+        SET v.total_reviews = COALESCE(agg.total_reviews, 0),
+            v.rating_sum = COALESCE(agg.rating_sum, 0),
+            v.rating_1 = COALESCE(agg.r1, 0),
+            v.rating_2 = COALESCE(agg.r2, 0),
+            v.rating_3 = COALESCE(agg.r3, 0),
+            v.rating_4 = COALESCE(agg.r4, 0),
+            v.rating_5 = COALESCE(agg.r5, 0),
+            v.rating = CASE WHEN agg.total_reviews > 0 THEN ROUND(agg.rating_sum / agg.total_reviews, 2) ELSE 0 END
+        """
+    )
+
+
+def downgrade() -> None:
+    for column in reversed(STAR_COLUMNS):
+        op.drop_column('vendors', column)
+    op.drop_column('vendors', 'rating_sum')
@@ -0,0 +1,62 @@
+"""add incremental aggregate columns to event_manager_profiles
+
+Revision ID: b3e7c1d2a4f5
+Revises: f12abcde3456
+Create Date: 2026-01-12 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e7c1d2a4f5'
+down_revision: Union[str, None] = 'f12abcde3456'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'event_manager_profiles',
+        sa.Column('total_events_count', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column(
+        'event_manager_profiles',
+        sa.Column('total_budget_managed', sa.Numeric(15, 2), nullable=False, server_default='0')
+    )
+    op.add_column(
+        'event_manager_profiles',
+        sa.Column('total_expected_attendees', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    # --- Backfill from live events ---
+    op.execute(
+        """
+        UPDATE event_manager_profiles p
+        JOIN (
+            SELECT event_manager_id,
+                   COUNT(id) AS total_events,
+                   SUM(CASE WHEN status IN ('PLANNING', 'CONFIRMED', 'ACTIVE') THEN 1 ELSE 0 END) AS active_events,
+                   SUM(CASE WHEN status = 'COMPLETED' THEN 1 ELSE 0 END) AS completed_events,
+                   COALESCE(SUM(budget), 0) AS total_budget,
+                   COALESCE(SUM(expected_attendees), 0) AS total_attendees
+            FROM events
+            WHERE event_manager_id IS NOT NULL AND inactive = 0
+            GROUP BY event_manager_id
+        ) agg ON agg.event_manager_id = p.user_id
+        SET p.total_events_count = agg.total_events,
+            p.active_events_count = agg.active_events,
+            p.completed_events_count = agg.completed_events,
+            p.total_budget_managed = agg.total_budget,
+            p.total_expected_attendees = agg.total_attendees
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('event_manager_profiles', 'total_expected_attendees')
+    op.drop_column('event_manager_profiles', 'total_budget_managed')
+    op.drop_column('event_manager_profiles', 'total_events_count')
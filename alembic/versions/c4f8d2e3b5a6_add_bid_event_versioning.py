@@ -0,0 +1,63 @@
+"""add optimistic lock versions and active bid uniqueness
+
+Revision ID: c4f8d2e3b5a6
+Revises: b3e7c1d2a4f5
+Create Date: 2026-01-14 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8d2e3b5a6'
+down_revision: Union[str, None] = 'b3e7c1d2a4f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # --- Version columns ---
+    op.add_column('vendor_bids', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+    op.add_column('events', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+    # --- Retire duplicate active bids, keeping the latest one ---
+    op.execute(
+        """
+        UPDATE vendor_bids b
+        JOIN (
+            SELECT vendor_id, event_id, MAX(id) AS keep_id
+            FROM vendor_bids
+            WHERE inactive = 0 OR inactive IS NULL
+            GROUP BY vendor_id, event_id
+            HAVING COUNT(*) > 1
+        ) d ON d.vendor_id = b.vendor_id AND d.event_id = b.event_id
+        SET b.inactive = 1
+        WHERE b.id <> d.keep_id AND (b.inactive = 0 OR b.inactive IS NULL)
+        """
+    )
+
+    # --- One active bid per (vendor, event) ---
+    op.add_column(
+        'vendor_bids',
+        sa.Column(
+            'active_marker',
+            sa.Integer(),
+            sa.Computed('CASE WHEN inactive THEN NULL ELSE 1 END', persisted=True),
+            nullable=True
+        )
+    )
+    op.create_unique_constraint(
+        'uq_vendor_bids_active_vendor_event',
+        'vendor_bids',
+        ['vendor_id', 'event_id', 'active_marker']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_vendor_bids_active_vendor_event', 'vendor_bids', type_='unique')
+    op.drop_column('vendor_bids', 'active_marker')
+    op.drop_column('events', 'version')
+    op.drop_column('vendor_bids', 'version')
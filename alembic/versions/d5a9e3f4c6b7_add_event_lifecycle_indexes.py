@@ -0,0 +1,28 @@
+"""add indexes for the event lifecycle sweeper
+
+Revision ID: d5a9e3f4c6b7
+Revises: c4f8d2e3b5a6
+Create Date: 2026-01-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a9e3f4c6b7'
+down_revision: Union[str, None] = 'c4f8d2e3b5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_events_bidding_status_deadline', 'events', ['bidding_status', 'bidding_deadline'], unique=False)
+    op.create_index('ix_events_status_event_date', 'events', ['status', 'event_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_status_event_date', table_name='events')
+    op.drop_index('ix_events_bidding_status_deadline', table_name='events')
@@ -0,0 +1,51 @@
+"""add denormalized bid counters to vendors
+
+Revision ID: e7b1f4a5d8c9
+Revises: d5a9e3f4c6b7
+Create Date: 2026-01-16 11:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b1f4a5d8c9'
+down_revision: Union[str, None] = 'd5a9e3f4c6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'vendors',
+        sa.Column('total_bids', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column(
+        'vendors',
+        sa.Column('won_bids', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    # --- Backfill from active bids ---
+    op.execute(
+        """
+        UPDATE vendors v
+        JOIN (
+            SELECT vendor_id,
+                   COUNT(id) AS total_bids,
+                   SUM(CASE WHEN status IN ('won', 'selected', 'accepted') THEN 1 ELSE 0 END) AS won_bids
+            FROM vendor_bids
+            WHERE inactive = 0
+            GROUP BY vendor_id
+        ) agg ON agg.vendor_id = v.id
+        SET v.total_bids = agg.total_bids,
+            v.won_bids = agg.won_bids
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('vendors', 'won_bids')
+    op.drop_column('vendors', 'total_bids')
@@ -0,0 +1,65 @@
+"""add vendor_ledgers payment summary table
+
+Revision ID: f3c8a6b2e1d4
+Revises: e7b1f4a5d8c9
+Create Date: 2026-01-19 09:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8a6b2e1d4'
+down_revision: Union[str, None] = 'e7b1f4a5d8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('vendor_ledgers',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('vendor_id', sa.Integer(), nullable=False),
+        sa.Column('completed_amount', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('pending_amount', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('total_transactions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('pending_transactions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_transactions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_by', sa.String(length=100), nullable=True),
+        sa.Column('modified_by', sa.String(length=100), nullable=True),
+        sa.Column('inactive', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['vendor_id'], ['vendors.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('vendor_id')
+    )
+    op.create_index(op.f('ix_vendor_ledgers_id'), 'vendor_ledgers', ['id'], unique=False)
+
+    # --- Backfill from existing payments ---
+    op.execute(
+        """
+        INSERT INTO vendor_ledgers (
+            vendor_id, completed_amount, pending_amount,
+            total_transactions, pending_transactions, completed_transactions,
+            created_by, inactive
+        )
+        SELECT vendor_id,
+               COALESCE(SUM(CASE WHEN status = 'completed' THEN amount ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN status = 'pending' THEN amount ELSE 0 END), 0),
+               COUNT(id),
+               SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END),
+               'migration', 0
+        FROM vendor_payments
+        GROUP BY vendor_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_vendor_ledgers_id'), table_name='vendor_ledgers')
+    op.drop_table('vendor_ledgers')
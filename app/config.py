@@ -1,11 +1,17 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
+from typing import List
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
     SECRET_KEY: str
 
+    # Optional read replica for read-only routes (see get_read_db)
+    READ_REPLICA_URL: str = ""
+    READ_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    READ_REPLICA_CHECK_INTERVAL_SECONDS: float = 10.0
+
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
@@ -17,6 +23,45 @@ class Settings(BaseSettings):
     # RAZORPAY SETTINGS
     RAZORPAY_KEY_ID: str = ""
     RAZORPAY_KEY_SECRET: str = ""
+    RAZORPAY_BASE_URL: str = ""  # e.g. http://127.0.0.1:9010 for benchmarks/fake_gateway.py
+    PAYMENT_GATEWAY_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    PAYMENT_GATEWAY_READ_TIMEOUT_SECONDS: float = 10.0
+    PAYMENT_GATEWAY_MAX_ATTEMPTS: int = 3
+    PAYMENT_GATEWAY_BACKOFF_BASE_SECONDS: float = 0.25
+    PAYMENT_GATEWAY_POOL_SIZE: int = 20
+
+    # BULK ADMIN OPERATIONS (max ids per request / transaction)
+    BULK_OPERATION_MAX_ITEMS: int = 500
+
+    # BACKGROUND JOBS
+    MANAGER_STATS_RECONCILE_INTERVAL_SECONDS: int = 3600
+    EVENT_SWEEP_INTERVAL_SECONDS: int = 60
+    EVENT_SWEEP_BATCH_SIZE: int = 500
+    LEADERBOARD_RESYNC_INTERVAL_SECONDS: int = 900
+    VENDOR_BID_COUNTERS_RECONCILE_INTERVAL_SECONDS: int = 3600
+    BID_VIEW_FLUSH_INTERVAL_SECONDS: int = 5
+    VENDOR_LEDGER_RECONCILE_INTERVAL_SECONDS: int = 3600
+    REVIEW_AGGREGATES_RECONCILE_INTERVAL_SECONDS: int = 3600
+    BID_VIEW_BUFFER_MAX_PENDING: int = 10000
+
+    # TENANT QUERY CACHE (per-organization LRU for list/stats reads)
+    TENANT_CACHE_MAX_TENANTS: int = 1000
+    TENANT_CACHE_MAX_ENTRIES_PER_TENANT: int = 128
+    TENANT_CACHE_TTL_SECONDS: float = 60.0
+
+    # HTTP CACHING / COMPRESSION
+    ETAG_PATH_PREFIXES: List[str] = [
+        "/api/admin/analytics",
+        "/api/admin/dashboard",
+        "/api/admin/bids",
+        "/api/vendor/analytics",
+        "/api/vendor/dashboard",
+        "/api/vendor/profile",
+        "/api/consumer/dashboard",
+        "/api/consumer/events",
+        "/api/events",
+    ]
+    COMPRESSION_MIN_SIZE: int = 1024
 
     APP_NAME: str = "Evenation"
     APP_VERSION: str = "1.0.0"
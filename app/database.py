@@ -1,6 +1,9 @@
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
 from app.config import settings
 
 engine = create_engine(
@@ -12,6 +15,18 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional read replica; without READ_REPLICA_URL reads stay on the primary
+read_engine = create_engine(
+    settings.READ_REPLICA_URL,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    echo=False
+) if settings.READ_REPLICA_URL else None
+
+ReadSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=read_engine
+) if read_engine is not None else None
+
 Base = declarative_base()
 
 def get_db():
@@ -19,4 +34,112 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+class ReplicaHealth:
+    """
+    Cached replica lag check. The replica serves reads only while its lag
+    is within READ_REPLICA_MAX_LAG_SECONDS; otherwise, or if it cannot be
+    reached, reads fall back to the primary until the next check.
+    """
+
+    def __init__(self, check_interval_seconds: float, max_lag_seconds: float):
+        self.check_interval_seconds = check_interval_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self._lock = threading.Lock()
+        self._checked_at = None
+
+        # State and metrics
+        self.healthy = False
+        self.lag_seconds = None
+        self.last_error = None
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+
+    def _measure_lag(self):
+        """Seconds behind the source; 0 when the server is not replicating (e.g. a local test instance)"""
+        with read_engine.connect() as conn:
+            if read_engine.dialect.name != "mysql":
+                conn.execute(text("SELECT 1"))
+                return 0.0
+
+            for statement, column in (
+                ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),   # MySQL 8.0.22+
+                ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),
+            ):
+                try:
+                    row = conn.execute(text(statement)).mappings().first()
+                except Exception:
+                    continue
+                if row is None:
+                    return 0.0
+                lag = row.get(column)
+                # NULL means the SQL thread is stopped; treat as unusable
+                return float(lag) if lag is not None else None
+            return 0.0
+
+    def is_healthy(self) -> bool:
+        if read_engine is None:
+            return False
+
+        now = time.monotonic()
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.check_interval_seconds:
+                return self.healthy
+            self._checked_at = now
+
+            try:
+                self.lag_seconds = self._measure_lag()
+                self.last_error = None
+            except Exception as e:
+                self.lag_seconds = None
+                self.last_error = str(e)
+
+            was_healthy = self.healthy
+            self.healthy = self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds
+            if was_healthy and not self.healthy:
+                print(f"⚠️ Read replica unavailable (lag={self.lag_seconds}, error={self.last_error}); using primary")
+            return self.healthy
+
+    def as_dict(self) -> dict:
+        return {
+            "configured": read_engine is not None,
+            "healthy": self.healthy,
+            "lagSeconds": self.lag_seconds,
+            "maxLagSeconds": self.max_lag_seconds,
+            "lastError": self.last_error,
+            "replicaReads": self.replica_reads,
+            "primaryFallbacks": self.primary_fallbacks,
+        }
+
+
+replica_health = ReplicaHealth(
+    settings.READ_REPLICA_CHECK_INTERVAL_SECONDS,
+    settings.READ_REPLICA_MAX_LAG_SECONDS
+)
+
+
+@event.listens_for(Session, "before_flush")
+def _block_read_only_flush(session, flush_context, instances):
+    if session.info.get("read_only"):
+        raise RuntimeError("Attempted to write through a read-only session (get_read_db)")
+
+
+def get_read_db():
+    """
+    Session for read-only routes: the replica while it is healthy and
+    caught up, the primary otherwise. Flushing through it raises.
+    """
+    if replica_health.is_healthy():
+        db = ReadSessionLocal()
+        replica_health.replica_reads += 1
+    else:
+        db = SessionLocal()
+        if read_engine is not None:
+            replica_health.primary_fallbacks += 1
+    db.info["read_only"] = True
+    try:
+        yield db
+    finally:
+        db.close()
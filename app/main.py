@@ -1,13 +1,24 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm.exc import StaleDataError
 from contextlib import asynccontextmanager
 from app.config import settings
 
 # DB
-from app.database import engine, Base
+from app.database import engine, Base, SessionLocal
 from app.seeders.seed_data import seed_database
 from app.seeders.service_seeder import seed_services
 from app.seeders.category_event_type_seeder import seed_categories_and_event_types
+from app.utils.scheduler import scheduler
+from app.utils.http_cache import ConditionalGetMiddleware, CompressionMiddleware
+from app.services.event_manager_service import EventManagerService
+from app.services.event_lifecycle_service import EventLifecycleService
+from app.services.revenue_leaderboard_service import RevenueLeaderboardService
+from app.services.admin_vendor_service import AdminVendorService
+from app.services.bid_view_service import BidViewService
+from app.services.vendor_payment_service import VendorPaymentService
+from app.services.review_service import ReviewService
 # Core Admin Routes
 from app.routes import (auth_route,user_route,organization_route,branch_route,role_route,menu_route,category_route,
     event_type_route, event_route,  event_manager_route,service_route,consumer_event_route,
@@ -36,8 +47,55 @@ async def lifespan(app: FastAPI):
     # seed_services()
     # seed_categories_and_event_types()
 
+    # Background jobs
+    scheduler.add_job(
+        "reconcile_manager_stats",
+        settings.MANAGER_STATS_RECONCILE_INTERVAL_SECONDS,
+        EventManagerService.reconcile_manager_stats
+    )
+    scheduler.add_job(
+        "event_lifecycle_sweep",
+        settings.EVENT_SWEEP_INTERVAL_SECONDS,
+        EventLifecycleService.run_sweep
+    )
+    scheduler.add_job(
+        "revenue_leaderboard_resync",
+        settings.LEADERBOARD_RESYNC_INTERVAL_SECONDS,
+        RevenueLeaderboardService.rebuild
+    )
+    scheduler.add_job(
+        "reconcile_vendor_bid_counters",
+        settings.VENDOR_BID_COUNTERS_RECONCILE_INTERVAL_SECONDS,
+        AdminVendorService.reconcile_vendor_bid_counters
+    )
+    scheduler.add_job(
+        "flush_bid_views",
+        settings.BID_VIEW_FLUSH_INTERVAL_SECONDS,
+        BidViewService.flush
+    )
+    scheduler.add_job(
+        "reconcile_vendor_ledgers",
+        settings.VENDOR_LEDGER_RECONCILE_INTERVAL_SECONDS,
+        VendorPaymentService.reconcile_ledgers
+    )
+    scheduler.add_job(
+        "reconcile_review_aggregates",
+        settings.REVIEW_AGGREGATES_RECONCILE_INTERVAL_SECONDS,
+        ReviewService.reconcile_review_aggregates
+    )
+    scheduler.start()
+
     yield
 
+    await scheduler.shutdown()
+
+    # Write out views still buffered in this worker
+    db = SessionLocal()
+    try:
+        BidViewService.flush(db)
+    finally:
+        db.close()
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
@@ -58,6 +116,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# -------------------------
+# CONDITIONAL GET + COMPRESSION
+# -------------------------
+# Added last = outermost: ETags are computed on the identity body,
+# then compression runs on whatever is actually sent
+app.add_middleware(ConditionalGetMiddleware, path_prefixes=settings.ETAG_PATH_PREFIXES)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
+# -------------------------
+# OPTIMISTIC LOCK CONFLICTS
+# -------------------------
+@app.exception_handler(StaleDataError)
+async def stale_data_handler(request: Request, exc: StaleDataError):
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": "This record was modified by another request. Please reload and retry."}
+    )
+
 # -------------------------
 # ROUTES REGISTRATION
 # -------------------------
@@ -18,6 +18,7 @@ from .event_m import Event
 from .event_category_m import EventCategory
 from .vendor_m import Vendor
 from .vendor_payment_m import VendorPayment
+from .vendor_ledger_m import VendorLedger
 from .vendor_bid_m import VendorBid
 from .vendor_category_m import VendorCategory
 from .vendor_order_m import VendorOrder
@@ -50,6 +51,7 @@ __all__ = [
     "MenuPermission",
     "Vendor",
     "VendorPayment",
+    "VendorLedger",
     "VendorBid",
     "VendorCategory",
     "VendorOrder",
@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Numeric, Enum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Numeric, Enum, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel
 import enum
@@ -23,6 +23,11 @@ class BiddingStatus(str, enum.Enum):
 
 class Event(BaseModel):
     __tablename__ = "events"
+    __table_args__ = (
+        # Used by the lifecycle sweeper (EventLifecycleService)
+        Index("ix_events_bidding_status_deadline", "bidding_status", "bidding_deadline"),
+        Index("ix_events_status_event_date", "status", "event_date"),
+    )
 
     # Organization (Consumer who created the event)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -70,6 +75,9 @@ class Event(BaseModel):
     selected_bid_id = Column(Integer, ForeignKey("vendor_bids.id", use_alter=True, name="fk_events_vendor_bids_id"), nullable=True)
     vendor_selected_at = Column(DateTime, nullable=True)
     
+    # Optimistic lock for bidding state transitions
+    version = Column(Integer, nullable=False, default=1)
+    
     # Relationships
     organization = relationship("Organization")
     category = relationship("Category", back_populates="events")
@@ -80,3 +88,5 @@ class Event(BaseModel):
     bids = relationship("VendorBid", back_populates="event", foreign_keys="VendorBid.event_id")
     selected_vendor = relationship("Vendor", foreign_keys=[selected_vendor_id])
     selected_bid = relationship("VendorBid", foreign_keys=[selected_bid_id], post_update=True)
+
+    __mapper_args__ = {"version_id_col": version}
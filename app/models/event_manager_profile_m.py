@@ -13,6 +13,13 @@ class EventManagerProfile(BaseModel):
     active_events_count = Column(Integer, default=0)
     completed_events_count = Column(Integer, default=0)
     rating = Column(Numeric(3, 2), default=0.0)  # 0.00 to 5.00
+
+    # Running aggregates over the manager's live events, maintained
+    # incrementally by EventManagerService.apply_event_change and
+    # corrected periodically by EventManagerService.reconcile_manager_stats
+    total_events_count = Column(Integer, default=0, nullable=False)
+    total_budget_managed = Column(Numeric(15, 2), default=0, nullable=False)
+    total_expected_attendees = Column(Integer, default=0, nullable=False)
     
     # Specialties (comma-separated or JSON)
     specialties = Column(Text, nullable=True)  # JSON array: ["Weddings", "Corporate"]
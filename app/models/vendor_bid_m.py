@@ -1,10 +1,19 @@
-from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, JSON, Boolean, Text
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, JSON, Boolean, Text, Computed, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel
 
 
+# Statuses that count as a won bid: "selected" by the consumer, "accepted"
+# by an admin, and the legacy "won"
+WON_BID_STATUSES = ("won", "selected", "accepted")
+
+
 class VendorBid(BaseModel):
     __tablename__ = "vendor_bids"
+    __table_args__ = (
+        # One active bid per vendor per event (withdrawn bids have a NULL marker)
+        UniqueConstraint("vendor_id", "event_id", "active_marker", name="uq_vendor_bids_active_vendor_event"),
+    )
 
     # ----------------------------
     # CORE RELATIONS
@@ -78,9 +87,20 @@ class VendorBid(BaseModel):
     selected_at = Column(DateTime, nullable=True)
     rejected_at = Column(DateTime, nullable=True)
     
+    # ----------------------------
+    # CONCURRENCY CONTROL
+    # ----------------------------
+    # Optimistic lock: every ORM flush checks and bumps the version,
+    # bulk UPDATEs must bump it explicitly
+    version = Column(Integer, nullable=False, default=1)
+
+    # 1 while the bid is live, NULL once soft-deleted (MySQL has no partial indexes)
+    active_marker = Column(Integer, Computed("CASE WHEN inactive THEN NULL ELSE 1 END", persisted=True))
+
     # ----------------------------
     # RELATIONSHIPS
     # ----------------------------
     vendor = relationship("Vendor", back_populates="bids", foreign_keys=[vendor_id])
     event = relationship("Event", back_populates="bids", foreign_keys=[event_id])
 
+    __mapper_args__ = {"version_id_col": version}
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey
+from sqlalchemy.orm import relationship
+from app.models.base_model import BaseModel
+
+
+class VendorLedger(BaseModel):
+    """
+    Running payment totals per vendor, updated in the same transaction as
+    the payment change (see VendorPaymentService.apply_payment_change)
+    """
+    __tablename__ = "vendor_ledgers"
+
+    vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=False, unique=True)
+
+    completed_amount = Column(Float, nullable=False, default=0.0, server_default="0")
+    pending_amount = Column(Float, nullable=False, default=0.0, server_default="0")
+
+    total_transactions = Column(Integer, nullable=False, default=0, server_default="0")
+    pending_transactions = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_transactions = Column(Integer, nullable=False, default=0, server_default="0")
+
+    vendor = relationship("Vendor")
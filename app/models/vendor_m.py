@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Numeric, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Numeric, JSON, Float
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel
 
@@ -37,6 +37,19 @@ class Vendor(BaseModel):
     rating = Column(Numeric(3, 2),nullable=False, default=0.0)  # 0.00 to 5.00
     total_reviews = Column(Integer,nullable=False, default=0)
     completed_events = Column(Integer,nullable=False, default=0)
+
+    # Review aggregates maintained on write (see ReviewService.apply_rating_change);
+    # rating = rating_sum / total_reviews, rating_N = reviews rounded to N stars
+    rating_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    rating_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_5 = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Bid counters maintained by the bid lifecycle (see AdminVendorService.apply_bid_deltas)
+    total_bids = Column(Integer, nullable=False, default=0, server_default="0")
+    won_bids = Column(Integer, nullable=False, default=0, server_default="0")
     
     # NEW: Service Areas (cities/states they operate in)
     service_areas = Column(JSON, nullable=True)  # ["Mumbai", "Pune", "Delhi"]
@@ -12,7 +12,9 @@ from app.schemas.vendor_bid_schema import (
     AdminEventBidReviewResponse,
     AdminShortlistSchema,
     AdminScoreUpdateSchema,
+    AdminBulkScoreUpdateSchema,
 )
+from app.schemas.bulk_schema import BulkOperationResponse
 
 router = APIRouter(
     prefix="/admin/bids",
@@ -112,3 +114,27 @@ async def update_admin_score(
         data=data,
         admin_user=current_user,
     )
+
+
+# ---------------------------------------------------------
+# BULK UPDATE ADMIN SCORES
+# ---------------------------------------------------------
+@router.put(
+    "/scores",
+    response_model=BulkOperationResponse,
+    dependencies=[Depends(PermissionChecker(["admin.bid.update"]))],
+)
+async def bulk_update_admin_scores(
+    data: AdminBulkScoreUpdateSchema,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Update admin scores and notes for many bids in one transaction.
+    Returns a result per bid id.
+    """
+    return AdminBidReviewService.bulk_update_admin_scores(
+        db=db,
+        data=data,
+        admin_user=current_user,
+    )
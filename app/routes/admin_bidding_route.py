@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.utils.fast_json import FastJSONResponse
 from app.schemas.admin_bidding_schema import (
     BidSummaryResponse,
     BidDetailResponse,
@@ -22,7 +23,7 @@ router = APIRouter(prefix="/admin/bidding", tags=["Admin - Bidding"])
 @router.get("/", response_model=list[BidSummaryResponse])
 def list_bids(db: Session = Depends(get_db)):
     """Return all vendor bids for admin dashboard."""
-    return fetch_all_bids(db)
+    return FastJSONResponse.from_rows(BidSummaryResponse, fetch_all_bids(db), from_attributes=True)
 
 
 @router.get("/{bid_id}", response_model=BidDetailResponse)
@@ -1,18 +1,19 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List, Any
 
-from app.database import get_db
+from app.database import get_read_db
 from app.dependencies import get_admin_user
 from app.schemas.analytics_schema import (
     RevenueTrendItem, CategoryRevenueItem, AdminStatsResponse, 
-    EventStatusItem, StatItem
+    EventStatusItem, StatItem, TopVendorItem, AdminAnalyticsBundleResponse
 )
 from app.models.vendor_order_m import VendorOrder
 from app.models.event_m import Event
 from app.models.vendor_m import Vendor
 from app.models.vendor_bid_m import VendorBid
+from app.services.revenue_leaderboard_service import RevenueLeaderboardService
 
 router = APIRouter(prefix="/api/admin/analytics", tags=["Admin Analytics"])
 
@@ -31,7 +32,7 @@ def get_start_date(time_range: str) -> datetime:
 @router.get("/stats", response_model=AdminStatsResponse)
 def get_admin_stats(
     time_range: str = 'month', 
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin: Any = Depends(get_admin_user)
 ):
     print(f"📡 [FASTAPI] Admin Stats Request - Range: {time_range}")
@@ -94,7 +95,7 @@ def get_admin_stats(
 @router.get("/revenue-trends", response_model=List[RevenueTrendItem])
 def get_revenue_trends(
     time_range: str = 'month', 
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin: Any = Depends(get_admin_user)
 ):
     print(f"📡 [FASTAPI] Revenue Trends Request - Range: {time_range}")
@@ -173,7 +174,7 @@ def get_revenue_trends(
 @router.get("/event-analytics", response_model=List[EventStatusItem])
 def get_event_analytics(
     time_range: str = 'month', 
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin: Any = Depends(get_admin_user)
 ):
     # Simple count by status
@@ -187,31 +188,43 @@ def get_event_analytics(
 
 @router.get("/revenue-by-category", response_model=List[CategoryRevenueItem])
 def get_revenue_by_category(
-    db: Session = Depends(get_db),
+    time_range: str = 'month',
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_read_db),
     admin: Any = Depends(get_admin_user)
 ):
     """
-    Returns revenue split by category.
+    Returns revenue split by category, read from the rolling leaderboard.
     """
-    return [
-        {"category": "Weddings", "revenue": 1240000, "percentage": 44},
-        {"category": "Corporate", "revenue": 850000, "percentage": 30},
-        {"category": "Birthdays", "revenue": 420000, "percentage": 15},
-        {"category": "Conferences", "revenue": 310000, "percentage": 11},
-    ]
+    return RevenueLeaderboardService.get_revenue_by_category(db, time_range, limit)
 
-@router.get("/top-vendors")
+@router.get("/top-vendors", response_model=List[TopVendorItem])
 def get_top_vendors(
-    db: Session = Depends(get_db),
+    time_range: str = 'month',
+    limit: int = Query(5, ge=1, le=50),
+    db: Session = Depends(get_read_db),
     admin: Any = Depends(get_admin_user)
 ):
     """
-    Returns top vendor list.
+    Returns top vendors by confirmed revenue, read from the rolling leaderboard.
     """
-    return [
-        {"name": 'Elegant Caterers', "revenue": 485000},
-        {"name": 'Grand Venues Co.', "revenue": 420000},
-        {"name": 'Dream Decorators', "revenue": 385000},
-        {"name": 'Elite Photography', "revenue": 340000},
-        {"name": 'Sound & Lights Pro', "revenue": 295000},
-    ]
+    return RevenueLeaderboardService.get_top_vendors(db, time_range, limit)
+
+@router.get("/bundle", response_model=AdminAnalyticsBundleResponse)
+def get_analytics_bundle(
+    time_range: str = 'month',
+    db: Session = Depends(get_read_db),
+    admin: Any = Depends(get_admin_user)
+):
+    """
+    All Admin Overview panels in one round-trip.
+    The panels share this request's session and transaction, so under
+    MySQL's REPEATABLE READ they all read the same consistent snapshot.
+    """
+    return AdminAnalyticsBundleResponse(
+        stats=get_admin_stats(time_range, db, admin).stats,
+        event_analytics=get_event_analytics(time_range, db, admin),
+        revenue_trends=get_revenue_trends(time_range, db, admin),
+        revenue_by_category=get_revenue_by_category(time_range, 10, db, admin),
+        top_vendors=get_top_vendors(time_range, 5, db, admin),
+    )
@@ -1,22 +1,63 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_read_db, replica_health
 from app.services.admin_dashboard_service import AdminDashboardService
 from app.schemas.admin_dashboard_schema import FinancialStatsResponse, ActivityFeedResponse
+from app.dependencies import get_admin_user
+from app.utils.scheduler import scheduler
+from app.utils.http_cache import conditional_get_stats
+from app.services.event_lifecycle_service import lifecycle_metrics
+from app.services.bid_view_service import bid_view_buffer
+from app.utils.tenant_cache import tenant_cache
 # from app.auth.dependencies import get_current_admin_user # Assuming we have auth
 
 router = APIRouter(prefix="/api/admin/dashboard", tags=["Admin Dashboard"])
 
 @router.get("/financials", response_model=FinancialStatsResponse)
-def get_financial_stats(db: Session = Depends(get_db)):
+def get_financial_stats(db: Session = Depends(get_read_db)):
     """
     Get financial statistics (Total Revenue, Total Orders Value)
     """
     return AdminDashboardService.get_financial_stats(db)
 
 @router.get("/activity", response_model=ActivityFeedResponse)
-def get_recent_activity(limit: int = 10, db: Session = Depends(get_db)):
+def get_recent_activity(limit: int = 10, db: Session = Depends(get_read_db)):
     """
     Get recent activity feed (New Events, Orders, Vendors)
     """
     return AdminDashboardService.get_recent_activity(db, limit)
+
+@router.get("/jobs")
+def get_background_jobs(admin=Depends(get_admin_user)):
+    """
+    Background job health: run counts, durations and the event lifecycle
+    sweeper's throughput and bidding-close lag, and the bid view buffer
+    """
+    return {
+        "jobs": scheduler.metrics(),
+        "eventLifecycle": lifecycle_metrics.as_dict(),
+        "bidViews": bid_view_buffer.as_dict()
+    }
+
+@router.get("/http-cache")
+def get_http_cache_stats(admin=Depends(get_admin_user)):
+    """
+    Per-route conditional GET hit ratios (share of polls answered with 304)
+    """
+    return {"routes": conditional_get_stats.as_dict()}
+
+@router.get("/read-replica")
+def get_read_replica_status(admin=Depends(get_admin_user)):
+    """
+    Read replica health: measured lag, and how many read-only requests were
+    served by the replica vs. fell back to the primary
+    """
+    return replica_health.as_dict()
+
+@router.get("/tenant-cache")
+def get_tenant_cache_stats(admin=Depends(get_admin_user)):
+    """
+    Organization-scoped query cache: entries and hit/miss/eviction/
+    invalidation counts per tenant
+    """
+    return tenant_cache.as_dict()
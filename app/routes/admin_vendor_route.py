@@ -9,6 +9,7 @@ from app.database import get_db
 from app.services.admin_vendor_service import AdminVendorService
 from app.dependencies import get_current_active_user, PermissionChecker
 from app.models.user_m import User
+from app.schemas.bulk_schema import BulkIdsRequest, BulkOperationResponse
 
 
 router = APIRouter(prefix="/admin/vendors", tags=["Admin - Vendor Management"])
@@ -66,6 +67,20 @@ async def approve_vendor(
     return AdminVendorService.approve_vendor(db, vendor_id, current_user)
 
 
+@router.post(
+    "/bulk-approve",
+    response_model=BulkOperationResponse,
+    dependencies=[Depends(PermissionChecker(["vendor.approve"]))]
+)
+async def bulk_approve_vendors(
+    request: BulkIdsRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Approve many pending vendors at once; returns a result per vendor id"""
+    return AdminVendorService.bulk_approve_vendors(db, request.ids, current_user)
+
+
 @router.put(
     "/{vendor_id}/reject",
     dependencies=[Depends(PermissionChecker(["vendor.approve"]))]
@@ -92,40 +107,4 @@ async def get_all_vendors(
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all vendors with optional status filter"""
-    from app.models.vendor_m import Vendor
-    from app.models.user_m import User as UserModel
-    from app.models.service_m import Service
-    
-    query = db.query(Vendor).filter(Vendor.inactive == False)
-    
-    if status:
-        query = query.filter(Vendor.status == status)
-    
-    vendors = query.offset(skip).limit(limit).all()
-    
-    result = []
-    for vendor in vendors:
-        user = db.query(UserModel).filter(UserModel.id == vendor.user_id).first()
-        
-        # Get service names
-        services = []
-        if vendor.offered_services:
-            service_objs = db.query(Service).filter(
-                Service.id.in_(vendor.offered_services)
-            ).all()
-            services = [{"id": s.id, "name": s.name} for s in service_objs]
-        
-        result.append({
-            "id": vendor.id,
-            "companyName": vendor.company_name,
-            "email": user.email if user else None,
-            "phone": vendor.phone,
-            "city": vendor.city,
-            "state": vendor.state,
-            "offeredServices": services,
-            "status": vendor.status,
-            "rating": float(vendor.rating) if vendor.rating else 0,
-            "createdAt": vendor.created_at
-        })
-    
-    return result
+    return AdminVendorService.get_all_vendors(db, status, skip, limit)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.database import get_db
+from app.database import get_read_db
 from app.dependencies import get_customer_user
 from app.schemas.analytics_schema import (
     CustomerFavoriteItem, CustomerSuggestedItem, CustomerHistoryItem
@@ -12,7 +12,7 @@ router = APIRouter(prefix="/api/consumer/dashboard", tags=["Consumer Analytics"]
 
 @router.get("/favorites", response_model=List[CustomerFavoriteItem])
 def get_customer_favorites(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user=Depends(get_customer_user)
 ):
     """
@@ -27,7 +27,7 @@ def get_customer_favorites(
 
 @router.get("/suggested", response_model=List[CustomerSuggestedItem])
 def get_customer_suggested(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user=Depends(get_customer_user)
 ):
     """
@@ -41,7 +41,7 @@ def get_customer_suggested(
 
 @router.get("/history", response_model=List[CustomerHistoryItem])
 def get_customer_history(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user=Depends(get_customer_user)
 ):
     """
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services.consumer_event_service import ConsumerEventService
 from app.models.user_m import User
 from app.dependencies import get_current_active_user, PermissionChecker
@@ -49,7 +49,7 @@ async def get_my_events(
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import Optional
-from app.database import get_db
-from app.schemas.event_schema import EventCreateSchema, EventUpdateSchema
+from typing import Optional, List
+from app.database import get_db, get_read_db
+from app.schemas.event_schema import EventCreateSchema, EventUpdateSchema, EventListItemSchema
 from app.services.event_service import EventService
 from app.dependencies import get_current_active_user, PermissionChecker
 from app.models.user_m import User
+from app.utils.fast_json import FastJSONResponse
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
@@ -38,6 +39,7 @@ async def update_event(
 
 @router.get(
     "/",
+    response_model=List[EventListItemSchema],
     dependencies=[Depends(PermissionChecker(["event.view"]))]
 )
 async def get_events(
@@ -48,14 +50,15 @@ async def get_events(
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all events with filters"""
-    return EventService.get_events_with_filters(
+    events = EventService.get_events_with_filters(
         db, current_user.organization_id, status, category_id, 
         event_type_id, manager_id, search, skip, limit
     )
+    return FastJSONResponse.from_rows(EventListItemSchema, events)
 
 
 @router.get(
@@ -63,7 +66,7 @@ async def get_events(
     dependencies=[Depends(PermissionChecker(["event.view"]))]
 )
 async def get_event_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get event statistics"""
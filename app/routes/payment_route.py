@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -26,7 +27,8 @@ async def initiate_payment(
     """
     Initiate a payment for an order.
     """
-    return PaymentService.initiate_payment(db, payment_data, current_user.id)
+    # Gateway and DB calls block; keep them off the event loop
+    return await run_in_threadpool(PaymentService.initiate_payment, db, payment_data, current_user.id)
 
 @router.post(
     "/verify",
@@ -40,7 +42,8 @@ async def verify_payment(
     """
     Verify a payment after gateway callback.
     """
-    return PaymentService.verify_payment(
+    return await run_in_threadpool(
+        PaymentService.verify_payment,
         db, 
         verify_data.razorpay_payment_id, 
         verify_data.razorpay_order_id, 
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services.review_service import ReviewService
 from app.models.user_m import User
 from app.dependencies import get_current_active_user, PermissionChecker
@@ -31,6 +31,21 @@ async def create_review(
     """
     return ReviewService.create_review(db, review_data, current_user.id)
 
+@router.delete(
+    "/{review_id}",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(PermissionChecker(["review.create"]))],
+)
+async def delete_review(
+    review_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Consumer deletes their own review.
+    """
+    return ReviewService.delete_review(db, review_id, current_user.id)
+
 @router.get(
     "/vendor/{vendor_id}",
     response_model=List[VendorReviewList]
@@ -39,7 +54,7 @@ async def get_vendor_reviews(
     vendor_id: int,
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get public reviews for a vendor.
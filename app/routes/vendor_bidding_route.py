@@ -2,11 +2,12 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services.vendor_bidding_service import VendorBiddingService
 from app.models.user_m import User
 from app.models.vendor_m import Vendor
 from app.dependencies import get_current_active_user, PermissionChecker
+from app.utils.fast_json import FastJSONResponse
 
 from app.schemas.vendor_bid_schema import (
     VendorBidCreateSchema,
@@ -28,7 +29,7 @@ router = APIRouter(
 async def get_available_events(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -88,13 +89,14 @@ async def get_my_bids(
     if not vendor:
         raise HTTPException(status_code=403, detail="User is not a vendor or vendor profile pending")
 
-    return VendorBiddingService.get_my_bids(
+    bids = VendorBiddingService.get_my_bids(
         db=db,
         vendor_id=vendor.id,
         status=status,
         skip=skip,
         limit=limit,
     )
+    return FastJSONResponse.from_rows(VendorMyBidSchema, bids)
 
 
 @router.get(
@@ -4,7 +4,7 @@ from sqlalchemy import func
 from typing import List
 from datetime import datetime, timedelta
 
-from app.database import get_db
+from app.database import get_read_db
 from app.dependencies_vendor import get_current_vendor
 from app.schemas.analytics_schema import (
     VendorStatsResponse, VendorChartsResponse, NotificationItem, StatItem, ChartDataPoint
@@ -28,7 +28,7 @@ def get_start_date(time_range: str) -> datetime:
 @router.get("/stats", response_model=VendorStatsResponse)
 def get_vendor_stats(
     time_range: str = 'month',
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     vendor: Vendor = Depends(get_current_vendor)
 ):
     print(f"📡 [FASTAPI] Vendor Stats Request - Vendor: {vendor.id}, Range: {time_range}")
@@ -95,7 +95,7 @@ def get_vendor_stats(
 
 @router.get("/notifications", response_model=List[NotificationItem])
 def get_notifications(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     vendor: Vendor = Depends(get_current_vendor)
 ):
     # Retrieve real recent orders/bids
@@ -133,7 +133,7 @@ def get_notifications(
 @router.get("/charts", response_model=VendorChartsResponse)
 def get_vendor_charts(
     time_range: str = 'month',
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     vendor: Vendor = Depends(get_current_vendor)
 ):
     print(f"📡 [FASTAPI] Vendor Charts Request - Vendor: {vendor.id}, Range: {time_range}")
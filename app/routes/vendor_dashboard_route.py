@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db
 from app.schemas.vendor_dashboard_schema import VendorDashboardResponse
 from app.services.vendor_dashboard_service import get_vendor_dashboard
 from app.dependencies_vendor import get_current_vendor
@@ -12,7 +12,7 @@ router = APIRouter(prefix="/vendor", tags=["Vendor Dashboard"])
 
 @router.get("/dashboard", response_model=VendorDashboardResponse)
 def vendor_dashboard(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     vendor = Depends(get_current_vendor)
 ):
     return get_vendor_dashboard(db, vendor.id)
@@ -2,12 +2,13 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services.vendor_notification_service import VendorNotificationService
 from app.models.user_m import User
 from app.models.vendor_m import Vendor
 from app.dependencies import get_current_active_user, PermissionChecker
 from app.schemas.vendor_notification_schema import VendorNotificationListItem
+from app.schemas.bulk_schema import BulkIdsRequest, BulkOperationResponse
 
 router = APIRouter(
     prefix="/vendor/notifications",
@@ -23,7 +24,7 @@ async def get_my_notifications(
     unread_only: bool = False,
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -47,7 +48,7 @@ async def get_my_notifications(
     dependencies=[Depends(PermissionChecker(["vendor.profile.view"]))]
 )
 async def get_unread_count(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -83,6 +84,30 @@ async def mark_as_read(
         vendor_id=vendor.id
     )
 
+@router.put(
+    "/mark-read",
+    response_model=BulkOperationResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(PermissionChecker(["vendor.profile.view"]))]
+)
+async def mark_many_as_read(
+    request: BulkIdsRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Mark a list of notifications as read
+    """
+    vendor = db.query(Vendor).filter(Vendor.user_id == current_user.id).first()
+    if not vendor:
+        raise HTTPException(status_code=403, detail="User is not a vendor")
+
+    return VendorNotificationService.mark_many_as_read(
+        db=db,
+        notification_ids=request.ids,
+        vendor_id=vendor.id
+    )
+
 @router.put(
     "/mark-all-read",
     status_code=status.HTTP_200_OK,
@@ -9,6 +9,7 @@ from app.models.user_m import User
 from app.models.vendor_m import Vendor
 from app.dependencies import get_current_active_user
 from app.services.vendor_payment_service import VendorPaymentService
+from app.utils.fast_json import FastJSONResponse
 from app.schemas.vendor_payment_schema import (
     PaymentOverviewSchema,
     PaymentListResponse,
@@ -49,7 +50,8 @@ def get_payment_list(
     if not vendor:
         raise HTTPException(status_code=403, detail="User is not a vendor")
     
-    return VendorPaymentService.get_payment_list(db, vendor.id, skip, limit, status)
+    payments = VendorPaymentService.get_payment_list(db, vendor.id, skip, limit, status)
+    return FastJSONResponse.from_model(PaymentListResponse, payments)
 
 
 @router.get("/{id}/invoice", response_model=PaymentInvoiceSchema)
@@ -1,13 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from typing import List
 
 from app.dependencies import get_current_active_user, get_db
+from app.database import get_read_db
 from app.models.vendor_m import Vendor
-from app.models.review_m import Review
-from app.models.user_m import User
-from app.models.event_m import Event
+from app.utils.http_cache import version_etag
+from app.services.review_service import ReviewService
 from app.schemas.vendor_profile_schema import (
     VendorProfileResponse,
     VendorProfileUpdateRequest,
@@ -26,6 +25,7 @@ router = APIRouter(
 
 @router.get("/me", response_model=VendorProfileResponse)
 def get_my_vendor_profile(
+    response: Response,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
@@ -36,6 +36,8 @@ def get_my_vendor_profile(
     if not vendor:
         raise HTTPException(404, "Vendor profile not found")
 
+    # Version-based validator: ConditionalGetMiddleware uses it instead of hashing the body
+    response.headers["ETag"] = version_etag("vendor", vendor.id, vendor.updated_at or vendor.created_at)
     return vendor
 
 
@@ -100,12 +102,12 @@ def upload_portfolio(
 def get_my_reviews(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_active_user)
 ):
     """
     Get reviews received by the authenticated vendor.
-    Includes summary stats (average rating, total count).
+    Includes summary stats (average rating, total count, star histogram).
     """
     vendor = db.query(Vendor).filter(
         Vendor.user_id == current_user.id
@@ -114,57 +116,20 @@ def get_my_reviews(
     if not vendor:
         raise HTTPException(404, "Vendor profile not found")
 
-    # Calculate summary stats
-    avg_rating = (
-        db.query(func.avg(Review.rating))
-        .filter(Review.vendor_id == vendor.id)
-        .scalar()
-    ) or 0.0
-
-    total_reviews = (
-        db.query(func.count(Review.id))
-        .filter(Review.vendor_id == vendor.id)
-        .scalar()
-    ) or 0
-
-    summary = VendorReviewSummary(
-        average_rating=round(float(avg_rating), 2),
-        total_reviews=total_reviews
-    )
-
-    # Get paginated reviews
-    reviews = (
-        db.query(Review)
-        .filter(Review.vendor_id == vendor.id)
-        .order_by(Review.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    # Summary and histogram are kept on the vendor row by ReviewService
+    summary = VendorReviewSummary(**ReviewService.rating_summary(vendor))
 
-    review_items = []
-    for r in reviews:
-        # Get consumer name
-        consumer = db.query(User).filter(User.id == r.consumer_id).first()
-        consumer_name = "Anonymous"
-        if consumer:
-            consumer_name = f"{consumer.first_name} {consumer.last_name}".strip() or consumer.email
-
-        # Get event name if available
-        event_name = None
-        if r.event_id:
-            event = db.query(Event).filter(Event.id == r.event_id).first()
-            if event:
-                event_name = event.title
-
-        review_items.append(VendorReviewItem(
+    review_items = [
+        VendorReviewItem(
             id=r.id,
-            consumer_name=consumer_name,
+            consumer_name=r.consumer_name,
             rating=r.rating,
             comment=r.comment,
-            event_name=event_name,
+            event_name=r.event_name,
             created_at=r.created_at.strftime("%b %d, %Y")
-        ))
+        )
+        for r in ReviewService.list_reviews(db, vendor.id, skip, limit, include_email=True)
+    ]
 
     return VendorReviewsResponse(
         summary=summary,
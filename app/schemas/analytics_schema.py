@@ -42,6 +42,18 @@ class EventStatusItem(BaseModel):
     count: int
     color: str
 
+class TopVendorItem(BaseModel):
+    name: str
+    revenue: float
+
+class AdminAnalyticsBundleResponse(BaseModel):
+    """Every Admin Overview panel in one response"""
+    stats: List[StatItem]
+    event_analytics: List[EventStatusItem]
+    revenue_trends: List[RevenueTrendItem]
+    revenue_by_category: List[CategoryRevenueItem]
+    top_vendors: List[TopVendorItem]
+
 class UpcomingEventItem(BaseModel):
     id: int
     name: str
@@ -0,0 +1,34 @@
+# app/schemas/bulk_schema.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from app.config import settings
+
+
+class BulkIdsRequest(BaseModel):
+    """Ids to act on; one transaction, at most BULK_OPERATION_MAX_ITEMS"""
+    ids: List[int] = Field(..., min_length=1, max_length=settings.BULK_OPERATION_MAX_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    id: int
+    success: bool
+    detail: Optional[str] = None
+
+
+class BulkOperationResponse(BaseModel):
+    processed: int
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+    @classmethod
+    def from_results(cls, results: List[dict]) -> "BulkOperationResponse":
+        succeeded = sum(1 for r in results if r["success"])
+        return cls(
+            processed=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results
+        )
@@ -59,6 +59,18 @@ class EventUpdateSchema(BaseModel):
     class Config:
         from_attributes = True
 
+class EventListItemSchema(BaseModel):
+    id: int
+    name: str
+    category: Optional[str]
+    type: Optional[str]
+    date: str
+    location: Optional[str]
+    attendees: Optional[int]
+    budget: float
+    manager: Optional[str]
+    status: str
+
 class EventServiceResponse(BaseModel):
     id: int
     name: str
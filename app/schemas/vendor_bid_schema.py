@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from decimal import Decimal
 from datetime import datetime
 
+from app.config import settings
+
 class BidServiceBreakdown(BaseModel):
     service_id: int
     service_name: str
@@ -106,6 +108,16 @@ class AdminScoreUpdateSchema(BaseModel):
     notes: Optional[str]
 
 
+class AdminBulkScoreItem(AdminScoreUpdateSchema):
+    bid_id: int
+    notes: Optional[str] = None
+
+
+class AdminBulkScoreUpdateSchema(BaseModel):
+    """Scores for many bids, applied in one transaction"""
+    items: List[AdminBulkScoreItem] = Field(..., min_length=1, max_length=settings.BULK_OPERATION_MAX_ITEMS)
+
+
 class VendorBidUpdateSchema(BaseModel):
     total_amount: Optional[Decimal] = None
     service_breakdown: Optional[List[BidServiceBreakdown]] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 
 class VendorProfileResponse(BaseModel):
@@ -85,6 +85,7 @@ class VendorReviewSummary(BaseModel):
     """Review summary stats for vendor."""
     average_rating: float
     total_reviews: int
+    rating_distribution: Dict[int, int] = {}  # stars (1-5) -> review count
 
 
 class VendorReviewsResponse(BaseModel):
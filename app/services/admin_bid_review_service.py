@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from datetime import datetime
 from typing import List
-from sqlalchemy import func
+from sqlalchemy import func, case, or_
 
 from app.models.vendor_bid_m import VendorBid
 from app.models.vendor_m import Vendor
@@ -20,7 +20,9 @@ from app.schemas.vendor_bid_schema import (
     AdminBidProposalSchema,
 )
 from app.schemas.event_schema import ConsumerEventListSchema
-from app.schemas.vendor_bid_schema import AdminShortlistSchema, AdminScoreUpdateSchema
+from app.schemas.vendor_bid_schema import AdminShortlistSchema, AdminScoreUpdateSchema, AdminBulkScoreUpdateSchema
+from app.schemas.bulk_schema import BulkOperationResponse
+from app.utils.tenant_cache import TENANT_ORGANIZATIONS
 
 
 class AdminBidReviewService:
@@ -197,41 +199,53 @@ class AdminBidReviewService:
         admin_user
     ):
 
-        if len(data.bid_ids) != 3:
+        if len(set(data.bid_ids)) != 3:
             raise HTTPException(400, "Must select exactly 3 bids")
 
         event = db.query(Event).filter(Event.id == event_id).first()
         if not event:
             raise HTTPException(404, "Event not found")
 
+        found_ids = {
+            bid_id for (bid_id,) in db.query(VendorBid.id).filter(
+                VendorBid.id.in_(data.bid_ids),
+                VendorBid.event_id == event_id,
+            ).all()
+        }
+        for bid_id in data.bid_ids:
+            if bid_id not in found_ids:
+                raise HTTPException(404, f"Bid {bid_id} not found")
+
+        # Reset previous shortlist and rank the new top 3 in a single statement
+        now = datetime.utcnow()
+        is_selected = VendorBid.id.in_(data.bid_ids)
+        rank_case = case(
+            {bid_id: rank for rank, bid_id in enumerate(data.bid_ids, start=1)},
+            value=VendorBid.id,
+            else_=None,
+        )
+
         db.query(VendorBid).filter(
             VendorBid.event_id == event_id,
-            VendorBid.status.in_(["submitted", "shortlisted"])
+            or_(
+                VendorBid.status.in_(["submitted", "shortlisted"]),
+                is_selected,
+            )
+        ).execution_options(
+            **{TENANT_ORGANIZATIONS: (event.organization_id,)}
         ).update(
             {
-                "shortlisted": False,
-                "shortlisted_rank": None,
-                "status": "submitted",
+                "shortlisted": is_selected,
+                "shortlisted_rank": rank_case,
+                "status": case((is_selected, "shortlisted"), else_="submitted"),
+                "admin_reviewed_at": case((is_selected, now), else_=VendorBid.admin_reviewed_at),
+                "admin_reviewed_by": case((is_selected, admin_user.username), else_=VendorBid.admin_reviewed_by),
+                "modified_by": case((is_selected, admin_user.username), else_=VendorBid.modified_by),
+                "version": VendorBid.version + 1,
             },
             synchronize_session=False,
         )
 
-        for rank, bid_id in enumerate(data.bid_ids, start=1):
-            bid = db.query(VendorBid).filter(
-                VendorBid.id == bid_id,
-                VendorBid.event_id == event_id,
-            ).first()
-
-            if not bid:
-                raise HTTPException(404, f"Bid {bid_id} not found")
-
-            bid.shortlisted = True
-            bid.shortlisted_rank = rank
-            bid.status = "shortlisted"
-            bid.admin_reviewed_at = datetime.utcnow()
-            bid.admin_reviewed_by = admin_user.username
-            bid.modified_by = admin_user.username
-
         event.bidding_status = BiddingStatus.SHORTLISTED
         event.modified_by = admin_user.username
 
@@ -269,3 +283,67 @@ class AdminBidReviewService:
         db.commit()
 
         return {"message": "Admin score updated successfully"}
+
+    # ---------------------------------------------------------
+    # BULK ADMIN SCORES
+    # ---------------------------------------------------------
+    @staticmethod
+    def bulk_update_admin_scores(
+        db: Session,
+        data: AdminBulkScoreUpdateSchema,
+        admin_user
+    ):
+        """
+        Score many bids with one UPDATE (CASE on bid id) in one transaction.
+        Invalid scores, unknown bids and repeated ids fail individually.
+        """
+        results = {}
+        scores = {}
+        notes = {}
+        seen = set()
+        for index, item in enumerate(data.items):
+            if item.bid_id in seen:
+                results[index] = (item.bid_id, False, "Duplicate bid id in request")
+            elif not 0 <= item.score <= 100:
+                results[index] = (item.bid_id, False, "Score must be between 0 and 100")
+            else:
+                scores[item.bid_id] = item.score
+                notes[item.bid_id] = item.notes
+                results[index] = (item.bid_id, True, None)
+            seen.add(item.bid_id)
+
+        existing = {
+            bid_id for (bid_id,) in db.query(VendorBid.id).filter(
+                VendorBid.id.in_(scores.keys())
+            ).all()
+        } if scores else set()
+
+        for index, (bid_id, success, detail) in results.items():
+            if success and bid_id not in existing:
+                results[index] = (bid_id, False, "Bid not found")
+                scores.pop(bid_id, None)
+                notes.pop(bid_id, None)
+
+        if scores:
+            now = datetime.utcnow()
+            # Scores and notes aren't part of any tenant-cached read
+            db.query(VendorBid).filter(VendorBid.id.in_(scores.keys())).execution_options(
+                **{TENANT_ORGANIZATIONS: ()}
+            ).update(
+                {
+                    "admin_score": case(scores, value=VendorBid.id),
+                    "admin_notes": case(notes, value=VendorBid.id),
+                    "admin_reviewed_by": admin_user.username,
+                    "admin_reviewed_at": now,
+                    "modified_by": admin_user.username,
+                    "version": VendorBid.version + 1
+                },
+                synchronize_session=False
+            )
+
+        db.commit()
+
+        return BulkOperationResponse.from_results([
+            {"id": bid_id, "success": success, "detail": detail or ("scored" if success else None)}
+            for bid_id, success, detail in (results[i] for i in sorted(results))
+        ])
@@ -3,37 +3,36 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_bid_m import VendorBid, WON_BID_STATUSES
 from app.models.vendor_m import Vendor
 from app.models.event_m import Event
+from app.services.admin_vendor_service import AdminVendorService
 
 
 # -------------------------
 # LIST ALL BIDS
 # -------------------------
 def fetch_all_bids(db: Session):
-    results = (
-        db.query(VendorBid, Vendor, Event)
+    """
+    Column rows labelled after BidSummaryResponse fields, ready for
+    FastJSONResponse.from_rows(..., from_attributes=True)
+    """
+    return (
+        db.query(
+            VendorBid.id.label("id"),
+            Vendor.company_name.label("vendor_name"),
+            Vendor.rating.label("vendor_rating"),
+            VendorBid.total_amount.label("amount"),
+            VendorBid.status.label("status"),
+            Event.name.label("event_name"),
+            Event.event_date.label("event_date"),
+        )
         .join(Vendor, Vendor.id == VendorBid.vendor_id)
         .outerjoin(Event, Event.id == VendorBid.event_id)
         .order_by(VendorBid.submitted_at.desc())
         .all()
     )
 
-    response = []
-    for bid, vendor, event in results:
-        response.append({
-            "id": bid.id,
-            "vendor_name": vendor.company_name,
-            "vendor_rating": vendor.rating if hasattr(vendor, "rating") else None,
-            "amount": bid.amount,
-            "status": bid.status,
-            "event_name": event.name if event else None,
-            "event_date": event.start_date if event else None,
-        })
-
-    return response
-
 
 # -------------------------
 # GET SINGLE BID DETAILS
@@ -80,10 +79,14 @@ def approve_bid(db: Session, bid_id: int, notes: str | None):
     if not bid:
         return False
 
+    was_won = bid.status in WON_BID_STATUSES
     bid.status = "accepted"
     if notes:
         bid.notes = notes
 
+    won_delta = (bid.status in WON_BID_STATUSES) - was_won
+    AdminVendorService.apply_bid_deltas(db, {bid.vendor_id: {"won_bids": won_delta}})
+
     db.commit()
     return True
 
@@ -96,9 +99,13 @@ def decline_bid(db: Session, bid_id: int, notes: str | None):
     if not bid:
         return False
 
+    was_won = bid.status in WON_BID_STATUSES
     bid.status = "rejected"
     if notes:
         bid.notes = notes
 
+    won_delta = (bid.status in WON_BID_STATUSES) - was_won
+    AdminVendorService.apply_bid_deltas(db, {bid.vendor_id: {"won_bids": won_delta}})
+
     db.commit()
     return True
@@ -1,7 +1,7 @@
 # app/services/admin_vendor_service.py
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case, insert
 from fastapi import HTTPException
 from typing import List, Optional
 from datetime import datetime
@@ -9,39 +9,119 @@ from datetime import datetime
 from app.models.vendor_m import Vendor
 from app.models.user_m import User
 from app.models.service_m import Service
+from app.models.vendor_bid_m import VendorBid, WON_BID_STATUSES
 from app.models.vendor_notification_m import VendorNotification
+from app.schemas.bulk_schema import BulkOperationResponse
 
 
 class AdminVendorService:
-    
+
+    # --------------------------------------------------
+    # BID STATISTICS
+    # --------------------------------------------------
+    @staticmethod
+    def vendor_bid_stats(db: Session):
+        """
+        Total and won bids per vendor as one grouped subquery
+        (vendor_id, total_bids, won_bids), for joining onto vendor queries.
+        """
+        return db.query(
+            VendorBid.vendor_id.label("vendor_id"),
+            func.count(VendorBid.id).label("total_bids"),
+            func.sum(case((VendorBid.status.in_(WON_BID_STATUSES), 1), else_=0)).label("won_bids")
+        ).filter(
+            VendorBid.inactive == False
+        ).group_by(
+            VendorBid.vendor_id
+        ).subquery("vendor_bid_stats")
+
+    @staticmethod
+    def apply_bid_deltas(db: Session, deltas: dict):
+        """Add {vendor_id: {"total_bids": n, "won_bids": n}} to the vendor counters atomically"""
+        for vendor_id, vendor_delta in deltas.items():
+            vendor_delta = {k: v for k, v in vendor_delta.items() if v}
+            if not vendor_delta:
+                continue
+
+            db.query(Vendor).filter(Vendor.id == vendor_id).update(
+                {
+                    getattr(Vendor, column): getattr(Vendor, column) + value
+                    for column, value in vendor_delta.items()
+                },
+                synchronize_session=False
+            )
+
+    @staticmethod
+    def reconcile_vendor_bid_counters(db: Session) -> int:
+        """
+        Recompute the counters from vendor_bid_stats and correct any vendor
+        that drifted. Returns the number of vendors corrected.
+        """
+        stats = AdminVendorService.vendor_bid_stats(db)
+        rows = db.query(
+            Vendor.id,
+            Vendor.total_bids,
+            Vendor.won_bids,
+            func.coalesce(stats.c.total_bids, 0),
+            func.coalesce(stats.c.won_bids, 0)
+        ).outerjoin(
+            stats, stats.c.vendor_id == Vendor.id
+        ).all()
+
+        corrected = 0
+        for vendor_id, total_bids, won_bids, actual_total, actual_won in rows:
+            if (total_bids, won_bids) == (int(actual_total), int(actual_won)):
+                continue
+            db.query(Vendor).filter(Vendor.id == vendor_id).update(
+                {"total_bids": int(actual_total), "won_bids": int(actual_won)},
+                synchronize_session=False
+            )
+            corrected += 1
+
+        db.commit()
+        return corrected
+
+    @staticmethod
+    def _services_by_id(db: Session, vendors) -> dict:
+        """One Service lookup for every vendor on the page"""
+        service_ids = {
+            service_id
+            for vendor in vendors
+            for service_id in (vendor.offered_services or [])
+        }
+        if not service_ids:
+            return {}
+        return {
+            s.id: s for s in db.query(Service).filter(Service.id.in_(service_ids)).all()
+        }
+
+    # --------------------------------------------------
+    # LISTS & DETAIL
+    # --------------------------------------------------
     @staticmethod
     def get_pending_vendors(db: Session, skip: int = 0, limit: int = 100):
         """Get all pending vendor registrations"""
-        vendors = db.query(Vendor).join(
+        rows = db.query(Vendor, User.email).join(
             User, Vendor.user_id == User.id
         ).filter(
             Vendor.status == "pending",
             Vendor.inactive == False
         ).offset(skip).limit(limit).all()
         
+        services_by_id = AdminVendorService._services_by_id(db, [vendor for vendor, _ in rows])
+        
         result = []
-        for vendor in vendors:
-            # Get user details
-            user = db.query(User).filter(User.id == vendor.user_id).first()
-            
-            # Get service names
-            services = []
-            if vendor.offered_services:
-                service_objs = db.query(Service).filter(
-                    Service.id.in_(vendor.offered_services)
-                ).all()
-                services = [{"id": s.id, "name": s.name, "code": s.code} for s in service_objs]
+        for vendor, email in rows:
+            services = [
+                {"id": s.id, "name": s.name, "code": s.code}
+                for s in (services_by_id.get(i) for i in vendor.offered_services or []) if s
+            ]
             
             result.append({
                 "id": vendor.id,
                 "companyName": vendor.company_name,
                 "businessType": vendor.business_type,
-                "email": user.email if user else None,
+                "email": email,
                 "phone": vendor.phone,
                 "address": vendor.address,
                 "city": vendor.city,
@@ -55,54 +135,84 @@ class AdminVendorService:
         
         return result
     
+    @staticmethod
+    def get_all_vendors(db: Session, status: Optional[str] = None, skip: int = 0, limit: int = 100):
+        """
+        Admin vendor table. Bid counts come from the denormalized counters,
+        so a page costs two queries regardless of its size.
+        """
+        query = db.query(Vendor, User.email).outerjoin(
+            User, Vendor.user_id == User.id
+        ).filter(Vendor.inactive == False)
+        
+        if status:
+            query = query.filter(Vendor.status == status)
+        
+        rows = query.offset(skip).limit(limit).all()
+        services_by_id = AdminVendorService._services_by_id(db, [vendor for vendor, _ in rows])
+        
+        result = []
+        for vendor, email in rows:
+            services = [
+                {"id": s.id, "name": s.name}
+                for s in (services_by_id.get(i) for i in vendor.offered_services or []) if s
+            ]
+            
+            result.append({
+                "id": vendor.id,
+                "companyName": vendor.company_name,
+                "email": email,
+                "phone": vendor.phone,
+                "city": vendor.city,
+                "state": vendor.state,
+                "offeredServices": services,
+                "status": vendor.status,
+                "rating": float(vendor.rating) if vendor.rating else 0,
+                "totalBids": vendor.total_bids or 0,
+                "wonBids": vendor.won_bids or 0,
+                "createdAt": vendor.created_at
+            })
+        
+        return result
+    
     @staticmethod
     def get_vendor_details(db: Session, vendor_id: int):
         """Get detailed vendor information"""
-        vendor = db.query(Vendor).filter(
+        row = db.query(
+            Vendor,
+            User.email
+        ).outerjoin(
+            User, Vendor.user_id == User.id
+        ).filter(
             Vendor.id == vendor_id,
             Vendor.inactive == False
         ).first()
         
-        if not vendor:
+        if not row:
             raise HTTPException(status_code=404, detail="Vendor not found")
         
-        # Get user details
-        user = db.query(User).filter(User.id == vendor.user_id).first()
+        vendor, email = row
+        # Maintained counters, like the vendor list; no scan of vendor_bids
+        total_bids, won_bids = vendor.total_bids or 0, vendor.won_bids or 0
         
         # Get service details
-        services = []
-        if vendor.offered_services:
-            service_objs = db.query(Service).filter(
-                Service.id.in_(vendor.offered_services)
-            ).all()
-            services = [
-                {
-                    "id": s.id,
-                    "name": s.name,
-                    "code": s.code,
-                    "icon": s.icon
-                } for s in service_objs
-            ]
-        
-        # Get bid statistics
-        from app.models.vendor_bid_m import VendorBid
-        total_bids = db.query(func.count(VendorBid.id)).filter(
-            VendorBid.vendor_id == vendor_id,
-            VendorBid.inactive == False
-        ).scalar() or 0
-        
-        won_bids = db.query(func.count(VendorBid.id)).filter(
-            VendorBid.vendor_id == vendor_id,
-            VendorBid.status == "won",
-            VendorBid.inactive == False
-        ).scalar() or 0
+        services_by_id = AdminVendorService._services_by_id(db, [vendor])
+        services = [
+            {
+                "id": s.id,
+                "name": s.name,
+                "code": s.code,
+                "icon": s.icon
+            }
+            for s in (services_by_id.get(i) for i in vendor.offered_services or []) if s
+        ]
         
         return {
             "id": vendor.id,
             "userId": vendor.user_id,
             "companyName": vendor.company_name,
             "businessType": vendor.business_type,
-            "email": user.email if user else None,
+            "email": email,
             "phone": vendor.phone,
             "address": vendor.address,
             "city": vendor.city,
@@ -112,8 +222,8 @@ class AdminVendorService:
             "serviceAreas": vendor.service_areas or [],
             "status": vendor.status,
             "rating": float(vendor.rating) if vendor.rating else 0,
-            "totalBids": total_bids,
-            "wonBids": won_bids,
+            "totalBids": int(total_bids),
+            "wonBids": int(won_bids),
             "registeredAt": vendor.created_at,
             "approvedAt": vendor.updated_at if vendor.status == "approved" else None
         }
@@ -164,6 +274,66 @@ class AdminVendorService:
             "status": vendor.status
         }
     
+    @staticmethod
+    def bulk_approve_vendors(db: Session, vendor_ids: List[int], admin_user) -> dict:
+        """
+        Approve many pending vendors in one transaction: one locking SELECT,
+        one UPDATE and one bulk notification insert. Per-id results keep the
+        request order; ids that are missing or not pending are reported, not fatal.
+        """
+        vendor_ids = list(dict.fromkeys(vendor_ids))
+        
+        vendors = {
+            vendor_id: (status, company_name)
+            for vendor_id, status, company_name in db.query(
+                Vendor.id, Vendor.status, Vendor.company_name
+            ).filter(
+                Vendor.id.in_(vendor_ids),
+                Vendor.inactive == False
+            ).with_for_update().all()
+        }
+        
+        results = []
+        approved = []
+        for vendor_id in vendor_ids:
+            if vendor_id not in vendors:
+                results.append({"id": vendor_id, "success": False, "detail": "Vendor not found"})
+            elif vendors[vendor_id][0] != "pending":
+                results.append({"id": vendor_id, "success": False, "detail": f"Vendor is already {vendors[vendor_id][0]}"})
+            else:
+                approved.append(vendor_id)
+                results.append({"id": vendor_id, "success": True, "detail": "approved"})
+        
+        if approved:
+            db.query(Vendor).filter(
+                Vendor.id.in_(approved),
+                Vendor.status == "pending"
+            ).update(
+                {"status": "approved", "modified_by": admin_user.username},
+                synchronize_session=False
+            )
+            
+            db.execute(insert(VendorNotification), [
+                {
+                    "vendor_id": vendor_id,
+                    "notification_type": "account_approved",
+                    "title": "🎉 Your Vendor Account is Approved!",
+                    "message": (
+                        f"Congratulations! Your vendor account for {vendors[vendor_id][1]} "
+                        "has been approved. You can now start bidding on events."
+                    ),
+                    "priority": "high",
+                    "category": "account",
+                    "action_url": "/vendor/dashboard",
+                    "action_text": "Go to Dashboard",
+                    "created_by": admin_user.username
+                }
+                for vendor_id in approved
+            ])
+        
+        db.commit()
+        return BulkOperationResponse.from_results(results)
+    
     @staticmethod
     def reject_vendor(db: Session, vendor_id: int, reason: str, admin_user):
         """Reject a pending vendor"""
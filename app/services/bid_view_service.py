@@ -0,0 +1,113 @@
+# app/services/bid_view_service.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import case
+from datetime import datetime
+from typing import Iterable
+import threading
+
+from app.config import settings
+from app.models.vendor_bid_m import VendorBid
+from app.utils.tenant_cache import TENANT_ORGANIZATIONS
+
+
+class BidViewBuffer:
+    """
+    Append-only buffer of (bid_id, viewed_at) events recorded by read
+    endpoints. A scheduler job drains it and writes the first view of each
+    bid with one bulk UPDATE, so GETs never lock or write bid rows.
+    """
+
+    def __init__(self, max_pending: int):
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._events = []
+
+        # Metrics
+        self.events_recorded = 0
+        self.events_dropped = 0
+        self.flushes = 0
+        self.rows_updated = 0
+        self.last_flush_at = None
+
+    def append(self, bid_ids: Iterable[int], viewed_at: datetime):
+        with self._lock:
+            for bid_id in bid_ids:
+                if len(self._events) >= self.max_pending:
+                    # Views are best-effort; never grow without bound if the flush job is down
+                    self.events_dropped += 1
+                    continue
+                self._events.append((bid_id, viewed_at))
+                self.events_recorded += 1
+
+    def drain(self):
+        with self._lock:
+            events, self._events = self._events, []
+        return events
+
+    def as_dict(self) -> dict:
+        return {
+            "pending": len(self._events),
+            "eventsRecorded": self.events_recorded,
+            "eventsDropped": self.events_dropped,
+            "flushes": self.flushes,
+            "rowsUpdated": self.rows_updated,
+            "lastFlushAt": self.last_flush_at,
+        }
+
+
+bid_view_buffer = BidViewBuffer(settings.BID_VIEW_BUFFER_MAX_PENDING)
+
+
+class BidViewService:
+
+    @staticmethod
+    def record_views(bids: Iterable[VendorBid]):
+        """Queue the first consumer view of each bid; no database access"""
+        unseen = [bid.id for bid in bids if bid.consumer_viewed_at is None]
+        if unseen:
+            bid_view_buffer.append(unseen, datetime.utcnow())
+
+    @staticmethod
+    def flush(db: Session) -> int:
+        """
+        Write buffered views in a single UPDATE. Only bids that are still
+        unviewed are touched, so replays and duplicates are harmless.
+        Returns the number of rows updated.
+        """
+        events = bid_view_buffer.drain()
+        if not events:
+            return 0
+
+        # Earliest view per bid
+        first_seen = {}
+        for bid_id, viewed_at in events:
+            if bid_id not in first_seen or viewed_at < first_seen[bid_id]:
+                first_seen[bid_id] = viewed_at
+
+        try:
+            result = db.query(VendorBid).filter(
+                VendorBid.id.in_(first_seen.keys()),
+                VendorBid.consumer_viewed_at.is_(None)
+            ).execution_options(
+                # No tenant-cached read looks at consumer_viewed_at
+                **{TENANT_ORGANIZATIONS: ()}
+            ).update(
+                {
+                    "consumer_viewed_at": case(first_seen, value=VendorBid.id),
+                    "version": VendorBid.version + 1
+                },
+                synchronize_session=False
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Put the batch back so the next tick retries it
+            for bid_id, viewed_at in first_seen.items():
+                bid_view_buffer.append([bid_id], viewed_at)
+            raise
+
+        bid_view_buffer.flushes += 1
+        bid_view_buffer.rows_updated += result
+        bid_view_buffer.last_flush_at = datetime.utcnow()
+        return result
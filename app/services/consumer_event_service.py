@@ -19,6 +19,11 @@ from app.schemas.event_schema import (
     EventServiceResponse,
     ConsumerEventListSchema
 )
+from app.utils.tenant_cache import tenant_cache, replica_grace_seconds
+
+
+# Cached consumer event list depends on the events and their bids
+MY_EVENTS_TABLES = ("events", "vendor_bids")
 
 
 class ConsumerEventService:
@@ -191,9 +196,25 @@ class ConsumerEventService:
         skip: int = 0,
         limit: int = 100
     ) -> List[ConsumerEventListSchema]:
+        """Organization's events with bid counts (cached per organization)"""
+        organization_id = consumer_user.organization_id
+        return tenant_cache.get_or_load(
+            organization_id, "consumer.my_events", (status, skip, limit), MY_EVENTS_TABLES,
+            lambda: ConsumerEventService._load_my_events(db, organization_id, status, skip, limit),
+            store_after_invalidation=replica_grace_seconds(db)
+        )
+
+    @staticmethod
+    def _load_my_events(
+        db: Session,
+        organization_id: int,
+        status: str = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[ConsumerEventListSchema]:
 
         query = db.query(Event).filter(
-            Event.organization_id == consumer_user.organization_id,
+            Event.organization_id == organization_id,
             Event.inactive == False
         )
 
@@ -202,12 +223,17 @@ class ConsumerEventService:
 
         events = query.order_by(Event.created_at.desc()).offset(skip).limit(limit).all()
 
+        # Bid counts for the whole page in one grouped query
+        bid_counts = dict(
+            db.query(VendorBid.event_id, func.count(VendorBid.id)).filter(
+                VendorBid.event_id.in_([event.id for event in events]),
+                VendorBid.inactive == False
+            ).group_by(VendorBid.event_id).all()
+        ) if events else {}
+
         result = []
         for event in events:
-            bid_count = db.query(func.count(VendorBid.id)).filter(
-                VendorBid.event_id == event.id,
-                VendorBid.inactive == False
-            ).scalar()
+            bid_count = bid_counts.get(event.id, 0)
 
             result.append(ConsumerEventListSchema(
                 id=event.id,
@@ -4,10 +4,12 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from datetime import datetime
 
-from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_bid_m import VendorBid, WON_BID_STATUSES
 from app.models.vendor_m import Vendor
 from app.models.event_m import Event, BiddingStatus, EventStatus
 from app.models.vendor_order_m import VendorOrder
+from app.services.admin_vendor_service import AdminVendorService
+from app.services.bid_view_service import BidViewService
 
 from app.schemas.consumer_schema import (
     ConsumerShortlistedBidResponse,
@@ -19,6 +21,7 @@ from app.schemas.consumer_schema import (
     ConsumerBidSelectionResponse
 )
 from app.schemas.vendor_order_schema import VendorOrderResponseSchema
+from app.utils.tenant_cache import TENANT_ORGANIZATIONS
 
 
 class ConsumerSelectionService:
@@ -60,10 +63,10 @@ class ConsumerSelectionService:
 
         shortlisted_bids = []
 
-        for bid, vendor in bids:
-            if not bid.consumer_viewed_at:
-                bid.consumer_viewed_at = datetime.utcnow()
+        # Views are buffered and flushed in bulk; this GET never writes
+        BidViewService.record_views(bid for bid, _ in bids)
 
+        for bid, vendor in bids:
             shortlisted_bids.append(
                 ConsumerShortlistedBidSchema(
                     rank=bid.shortlisted_rank,
@@ -94,8 +97,6 @@ class ConsumerSelectionService:
                 )
             )
 
-        db.commit()
-
         return ConsumerShortlistedBidResponse(
             event=ConsumerShortlistedEventSchema(
                 id=event.id,
@@ -137,6 +138,9 @@ class ConsumerSelectionService:
         if not bid:
             raise HTTPException(404, "Invalid bid selection. Bid must be shortlisted.")
 
+        # won_bids only moves if the bid wasn't already counted (e.g. admin-accepted)
+        won_deltas = {bid.vendor_id: {"won_bids": ("selected" in WON_BID_STATUSES) - (bid.status in WON_BID_STATUSES)}}
+
         bid.status = "selected"
         bid.selected_at = datetime.utcnow()
         bid.modified_by = consumer_user.username
@@ -148,20 +152,33 @@ class ConsumerSelectionService:
         # event.status = EventStatus.CONFIRMED  <-- DEFERRED until payment
         event.modified_by = consumer_user.username
 
-        db.query(VendorBid).filter(
+        # Event, bid, rejected siblings and the order commit together. The
+        # versioned flush fails with StaleDataError (409) if another request
+        # changed this event or bid since we read it.
+        db.flush()
+
+        siblings = db.query(VendorBid).filter(
             VendorBid.event_id == event_id,
             VendorBid.id != bid_id,
             VendorBid.shortlisted == True
-        ).update(
+        )
+
+        # Siblings that were already counted as won lose that count when rejected
+        for (vendor_id,) in siblings.filter(
+            VendorBid.status.in_(WON_BID_STATUSES)
+        ).with_entities(VendorBid.vendor_id).with_for_update():
+            vendor_delta = won_deltas.setdefault(vendor_id, {"won_bids": 0})
+            vendor_delta["won_bids"] -= 1
+
+        siblings.execution_options(**{TENANT_ORGANIZATIONS: (event.organization_id,)}).update(
             {
                 "status": "rejected",
-                "rejected_at": datetime.utcnow()
+                "rejected_at": datetime.utcnow(),
+                "version": VendorBid.version + 1
             },
             synchronize_session=False
         )
 
-        db.commit()
-
         order = VendorOrder(
             vendor_id=bid.vendor_id,
             event_id=event.id,
@@ -173,6 +190,7 @@ class ConsumerSelectionService:
         )
 
         db.add(order)
+        AdminVendorService.apply_bid_deltas(db, won_deltas)
         db.commit()
         db.refresh(order)
 
@@ -0,0 +1,260 @@
+# app/services/event_lifecycle_service.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, insert, literal, or_, and_
+from datetime import datetime, timedelta
+import time
+
+from app.config import settings
+from app.models.event_m import Event, EventStatus, BiddingStatus
+from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_notification_m import VendorNotification
+from app.services.event_manager_service import EventManagerService
+from app.utils.tenant_cache import TENANT_ORGANIZATIONS
+
+
+class LifecycleMetrics:
+    """Counters for the lifecycle sweeper, exposed on the admin jobs endpoint"""
+
+    def __init__(self):
+        self.runs = 0
+        self.events_closed = 0
+        self.events_activated = 0
+        self.events_completed = 0
+        self.notifications_sent = 0
+        self.last_run_at = None
+        self.last_run_duration_seconds = 0.0
+        self.last_run_throughput = 0.0      # events transitioned per second
+        self.last_close_lag_seconds = 0.0   # age of the oldest overdue OPEN event at run start
+        self.max_close_lag_seconds = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "eventsClosed": self.events_closed,
+            "eventsActivated": self.events_activated,
+            "eventsCompleted": self.events_completed,
+            "notificationsSent": self.notifications_sent,
+            "lastRunAt": self.last_run_at,
+            "lastRunDurationSeconds": round(self.last_run_duration_seconds, 3),
+            "lastRunThroughput": round(self.last_run_throughput, 2),
+            "lastCloseLagSeconds": round(self.last_close_lag_seconds, 1),
+            "maxCloseLagSeconds": round(self.max_close_lag_seconds, 1),
+        }
+
+
+lifecycle_metrics = LifecycleMetrics()
+
+
+class EventLifecycleService:
+
+    # --------------------------------------------------
+    # SCHEDULED ENTRY POINT
+    # --------------------------------------------------
+    @staticmethod
+    def run_sweep(db: Session, batch_size: int = None) -> dict:
+        """Close expired bidding and advance event statuses; one scheduler tick"""
+        batch_size = batch_size or settings.EVENT_SWEEP_BATCH_SIZE
+        started = time.monotonic()
+        now = datetime.utcnow()
+
+        oldest_deadline = db.query(func.min(Event.bidding_deadline)).filter(
+            Event.bidding_status == BiddingStatus.OPEN,
+            Event.bidding_deadline <= now
+        ).scalar()
+        lag = (now - oldest_deadline).total_seconds() if oldest_deadline else 0.0
+
+        closed, notified = EventLifecycleService.close_expired_bidding(db, now, batch_size)
+        activated = EventLifecycleService.activate_started_events(db, now, batch_size)
+        completed = EventLifecycleService.complete_finished_events(db, now, batch_size)
+
+        duration = time.monotonic() - started
+        transitioned = closed + activated + completed
+
+        lifecycle_metrics.runs += 1
+        lifecycle_metrics.events_closed += closed
+        lifecycle_metrics.events_activated += activated
+        lifecycle_metrics.events_completed += completed
+        lifecycle_metrics.notifications_sent += notified
+        lifecycle_metrics.last_run_at = now
+        lifecycle_metrics.last_run_duration_seconds = duration
+        lifecycle_metrics.last_run_throughput = transitioned / duration if duration > 0 else 0.0
+        lifecycle_metrics.last_close_lag_seconds = lag
+        lifecycle_metrics.max_close_lag_seconds = max(lifecycle_metrics.max_close_lag_seconds, lag)
+
+        return {
+            "closed": closed,
+            "activated": activated,
+            "completed": completed,
+            "notifications": notified
+        }
+
+    # --------------------------------------------------
+    # CLOSE EXPIRED BIDDING
+    # --------------------------------------------------
+    @staticmethod
+    def close_expired_bidding(db: Session, now: datetime, batch_size: int):
+        """
+        Move OPEN events past their deadline to UNDER_REVIEW (if they have
+        submitted bids) or CLOSED, and notify every bidding vendor.
+        Works in batches on ix_events_bidding_status_deadline; SKIP LOCKED
+        lets several app workers sweep without blocking each other.
+        """
+        total_closed = 0
+        total_notified = 0
+
+        while True:
+            events = db.query(Event.id, Event.name, Event.organization_id).filter(
+                Event.bidding_status == BiddingStatus.OPEN,
+                Event.bidding_deadline <= now
+            ).order_by(
+                Event.bidding_deadline
+            ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+            if not events:
+                break
+
+            event_ids = [event_id for event_id, _, _ in events]
+            event_names = {event_id: name for event_id, name, _ in events}
+            organization_ids = {organization_id for _, _, organization_id in events}
+
+            bidders = db.query(VendorBid.event_id, VendorBid.vendor_id).filter(
+                VendorBid.event_id.in_(event_ids),
+                VendorBid.status == "submitted",
+                VendorBid.inactive == False
+            ).all()
+            events_with_bids = {event_id for event_id, _ in bidders}
+
+            bidding_status_type = Event.__table__.c.bidding_status.type
+            db.query(Event).filter(Event.id.in_(event_ids)).execution_options(
+                **{TENANT_ORGANIZATIONS: organization_ids}
+            ).update(
+                {
+                    "bidding_status": case(
+                        (Event.id.in_(events_with_bids), literal(BiddingStatus.UNDER_REVIEW, bidding_status_type)),
+                        else_=literal(BiddingStatus.CLOSED, bidding_status_type)
+                    ),
+                    "version": Event.version + 1,
+                    "modified_by": "system"
+                },
+                synchronize_session=False
+            )
+
+            if bidders:
+                db.execute(insert(VendorNotification), [
+                    {
+                        "vendor_id": vendor_id,
+                        "event_id": event_id,
+                        "notification_type": "bidding_closed",
+                        "title": f"Bidding Closed: {event_names[event_id]}",
+                        "message": "Bidding for this event has closed. Your bid is now under review.",
+                        "priority": "normal",
+                        "category": "bidding",
+                        "action_url": f"/vendor/events/{event_id}",
+                        "action_text": "View Event",
+                        "created_by": "system"
+                    }
+                    for event_id, vendor_id in bidders
+                ])
+
+            db.commit()
+
+            total_closed += len(event_ids)
+            total_notified += len(bidders)
+
+            if len(event_ids) < batch_size:
+                break
+
+        return total_closed, total_notified
+
+    # --------------------------------------------------
+    # CONFIRMED -> ACTIVE ON THE EVENT DATE
+    # --------------------------------------------------
+    @staticmethod
+    def activate_started_events(db: Session, now: datetime, batch_size: int) -> int:
+        total = 0
+
+        while True:
+            events = db.query(Event.id, Event.organization_id).filter(
+                Event.status == EventStatus.CONFIRMED,
+                Event.event_date <= now
+            ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+            if not events:
+                break
+
+            event_ids = [event_id for event_id, _ in events]
+            organization_ids = {organization_id for _, organization_id in events}
+
+            # Both statuses count as active for manager stats, so no deltas
+            db.query(Event).filter(Event.id.in_(event_ids)).execution_options(
+                **{TENANT_ORGANIZATIONS: organization_ids}
+            ).update(
+                {
+                    "status": EventStatus.ACTIVE,
+                    "version": Event.version + 1,
+                    "modified_by": "system"
+                },
+                synchronize_session=False
+            )
+            db.commit()
+
+            total += len(event_ids)
+            if len(event_ids) < batch_size:
+                break
+
+        return total
+
+    # --------------------------------------------------
+    # ACTIVE -> COMPLETED ONCE THE EVENT IS OVER
+    # --------------------------------------------------
+    @staticmethod
+    def complete_finished_events(db: Session, now: datetime, batch_size: int) -> int:
+        total = 0
+
+        while True:
+            events = db.query(Event.id, Event.event_manager_id, Event.inactive, Event.organization_id).filter(
+                Event.status == EventStatus.ACTIVE,
+                Event.event_date <= now,
+                or_(
+                    and_(Event.end_time.isnot(None), Event.end_time <= now),
+                    and_(Event.end_time.is_(None), Event.event_date <= now - timedelta(days=1))
+                )
+            ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+            if not events:
+                break
+
+            event_ids = [event_id for event_id, _, _, _ in events]
+            organization_ids = {organization_id for _, _, _, organization_id in events}
+
+            db.query(Event).filter(Event.id.in_(event_ids)).execution_options(
+                **{TENANT_ORGANIZATIONS: organization_ids}
+            ).update(
+                {
+                    "status": EventStatus.COMPLETED,
+                    "version": Event.version + 1,
+                    "modified_by": "system"
+                },
+                synchronize_session=False
+            )
+
+            # Shift each manager's events from active to completed
+            deltas = {}
+            for _, manager_id, inactive, _ in events:
+                if manager_id is None or inactive:
+                    continue
+                manager_delta = deltas.setdefault(
+                    manager_id, {"active_events_count": 0, "completed_events_count": 0}
+                )
+                manager_delta["active_events_count"] -= 1
+                manager_delta["completed_events_count"] += 1
+            EventManagerService.apply_manager_deltas(db, deltas)
+
+            db.commit()
+
+            total += len(event_ids)
+            if len(event_ids) < batch_size:
+                break
+
+        return total
@@ -1,13 +1,18 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case
 from app.models.event_manager_profile_m import EventManagerProfile
 from app.models.user_m import User
 from app.models.event_m import Event, EventStatus
 from app.schemas.event_manager_schema import EventManagerProfileCreate, EventManagerProfileUpdate
 from fastapi import HTTPException
+from decimal import Decimal
+from typing import List
 import json
 
 
+ACTIVE_EVENT_STATUSES = (EventStatus.PLANNING, EventStatus.CONFIRMED, EventStatus.ACTIVE)
+
+
 class EventManagerService:
     
     @staticmethod
@@ -69,19 +74,12 @@ class EventManagerService:
         for profile, user in managers:
             manager_data = EventManagerService._format_manager_response(db, profile, user)
             
-            # Add extra stats
-            total_budget = db.query(func.sum(Event.budget)).filter(
-                Event.event_manager_id == user.id,
-                Event.inactive == False
-            ).scalar() or 0
-            
-            avg_attendees = db.query(func.avg(Event.expected_attendees)).filter(
-                Event.event_manager_id == user.id,
-                Event.inactive == False
-            ).scalar() or 0
+            # Extra stats come from the aggregates kept on the profile
+            total_events = profile.total_events_count or 0
+            attendee_sum = profile.total_expected_attendees or 0
             
-            manager_data['totalBudgetManaged'] = float(total_budget)
-            manager_data['avgAttendees'] = int(avg_attendees) if avg_attendees else 0
+            manager_data['totalBudgetManaged'] = float(profile.total_budget_managed or 0)
+            manager_data['avgAttendees'] = int(attendee_sum / total_events) if total_events else 0
             
             result.append(manager_data)
         
@@ -183,36 +181,142 @@ class EventManagerService:
         } for e in events]
     
     @staticmethod
-    def update_manager_stats(db: Session, manager_id: int):
-        """Update manager statistics (call this when events change)"""
-        profile = db.query(EventManagerProfile).filter(
-            EventManagerProfile.user_id == manager_id
-        ).first()
+    def _event_contribution(event: Event) -> dict:
+        """What a single event adds to its manager's aggregate columns"""
+        if event.event_manager_id is None or event.inactive:
+            return {}
         
-        if not profile:
-            return
+        return {
+            "total_events_count": 1,
+            "active_events_count": 1 if event.status in ACTIVE_EVENT_STATUSES else 0,
+            "completed_events_count": 1 if event.status == EventStatus.COMPLETED else 0,
+            "total_budget_managed": event.budget or 0,
+            "total_expected_attendees": event.expected_attendees or 0,
+        }
+    
+    @staticmethod
+    def snapshot_event(event: Event):
+        """Capture (manager_id, contribution) before/after an event mutation"""
+        if event is None:
+            return None, {}
+        return event.event_manager_id, EventManagerService._event_contribution(event)
+    
+    @staticmethod
+    def apply_event_change(db: Session, before, after):
+        """
+        Apply the difference between two event snapshots to the manager
+        aggregates. Runs inside the caller's transaction, so the counters
+        commit (or roll back) together with the event itself.
+        """
+        deltas = {}
+        for sign, (manager_id, contribution) in ((-1, before), (1, after)):
+            if manager_id is None:
+                continue
+            manager_delta = deltas.setdefault(manager_id, {})
+            for column, value in contribution.items():
+                manager_delta[column] = manager_delta.get(column, 0) + sign * value
         
-        # Count active events
-        active_count = db.query(func.count(Event.id)).filter(
-            Event.event_manager_id == manager_id,
-            Event.status.in_([EventStatus.PLANNING, EventStatus.CONFIRMED, EventStatus.ACTIVE]),
-            Event.inactive == False
-        ).scalar()
+        EventManagerService.apply_manager_deltas(db, deltas)
+    
+    @staticmethod
+    def apply_manager_deltas(db: Session, deltas: dict):
+        """Add {manager_id: {column: delta}} to the profile aggregates atomically"""
+        for manager_id, manager_delta in deltas.items():
+            manager_delta = {k: v for k, v in manager_delta.items() if v}
+            if not manager_delta:
+                continue
+            
+            db.query(EventManagerProfile).filter(
+                EventManagerProfile.user_id == manager_id
+            ).update(
+                {
+                    getattr(EventManagerProfile, column): getattr(EventManagerProfile, column) + value
+                    for column, value in manager_delta.items()
+                },
+                synchronize_session=False
+            )
+            
+            if "active_events_count" in manager_delta:
+                EventManagerService._refresh_availability(db, manager_id)
+    
+    @staticmethod
+    def _refresh_availability(db: Session, manager_id: int):
+        """Flip Busy/Available based on the current active count"""
+        db.query(EventManagerProfile).filter(
+            EventManagerProfile.user_id == manager_id,
+            EventManagerProfile.active_events_count >= EventManagerProfile.max_concurrent_events
+        ).update({"availability_status": "Busy"}, synchronize_session=False)
         
-        # Count completed events
-        completed_count = db.query(func.count(Event.id)).filter(
-            Event.event_manager_id == manager_id,
-            Event.status == EventStatus.COMPLETED,
+        db.query(EventManagerProfile).filter(
+            EventManagerProfile.user_id == manager_id,
+            EventManagerProfile.availability_status == "Busy",
+            EventManagerProfile.active_events_count < EventManagerProfile.max_concurrent_events
+        ).update({"availability_status": "Available"}, synchronize_session=False)
+    
+    @staticmethod
+    def update_manager_stats(db: Session, manager_id: int):
+        """Recompute a single manager's statistics from scratch"""
+        EventManagerService.reconcile_manager_stats(db, manager_ids=[manager_id])
+    
+    @staticmethod
+    def reconcile_manager_stats(db: Session, manager_ids: List[int] = None) -> int:
+        """
+        Recompute manager aggregates with one grouped query and correct any
+        profile that drifted from the incremental counters.
+        Returns the number of profiles that were corrected.
+        """
+        query = db.query(
+            Event.event_manager_id,
+            func.count(Event.id),
+            func.sum(case((Event.status.in_(ACTIVE_EVENT_STATUSES), 1), else_=0)),
+            func.sum(case((Event.status == EventStatus.COMPLETED, 1), else_=0)),
+            func.coalesce(func.sum(Event.budget), 0),
+            func.coalesce(func.sum(Event.expected_attendees), 0)
+        ).filter(
+            Event.event_manager_id.isnot(None),
             Event.inactive == False
-        ).scalar()
+        )
         
-        profile.active_events_count = active_count
-        profile.completed_events_count = completed_count
+        if manager_ids is not None:
+            query = query.filter(Event.event_manager_id.in_(manager_ids))
         
-        # Update availability based on active events
-        if active_count >= profile.max_concurrent_events:
-            profile.availability_status = "Busy"
-        elif profile.availability_status == "Busy" and active_count < profile.max_concurrent_events:
-            profile.availability_status = "Available"
+        actual = {
+            row[0]: (int(row[1]), int(row[2] or 0), int(row[3] or 0), Decimal(row[4]), int(row[5]))
+            for row in query.group_by(Event.event_manager_id).all()
+        }
         
-        db.commit()
\ No newline at end of file
+        profiles_query = db.query(EventManagerProfile)
+        if manager_ids is not None:
+            profiles_query = profiles_query.filter(EventManagerProfile.user_id.in_(manager_ids))
+        
+        corrected = 0
+        for profile in profiles_query.all():
+            expected = actual.get(profile.user_id, (0, 0, 0, Decimal(0), 0))
+            current = (
+                profile.total_events_count or 0,
+                profile.active_events_count or 0,
+                profile.completed_events_count or 0,
+                Decimal(profile.total_budget_managed or 0),
+                profile.total_expected_attendees or 0
+            )
+            if current == expected:
+                continue
+            
+            (
+                profile.total_events_count,
+                profile.active_events_count,
+                profile.completed_events_count,
+                profile.total_budget_managed,
+                profile.total_expected_attendees
+            ) = expected
+            
+            # Update availability based on active events
+            if profile.active_events_count >= profile.max_concurrent_events:
+                profile.availability_status = "Busy"
+            elif profile.availability_status == "Busy":
+                profile.availability_status = "Available"
+            
+            corrected += 1
+        
+        db.commit()
+        return corrected
@@ -1,14 +1,22 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, case
 from app.models.event_m import Event, EventStatus
 from app.models.category_m import Category
 from app.models.event_type_m import EventType
 from app.models.user_m import User
 from app.schemas.event_schema import EventCreateSchema, EventUpdateSchema
+from app.services.event_manager_service import EventManagerService
+from app.utils.tenant_cache import tenant_cache, replica_grace_seconds
 from fastapi import HTTPException
 from datetime import datetime
 
 
+# Tables each cached read depends on; a committed write to one of them
+# drops that organization's entries
+EVENT_LIST_TABLES = ("events", "categories", "event_types", "users")
+EVENT_STATS_TABLES = ("events",)
+
+
 class EventService:
     
     @staticmethod
@@ -20,6 +28,12 @@ class EventService:
             created_by=current_user.username
         )
         db.add(new_event)
+        db.flush()
+        
+        EventManagerService.apply_event_change(
+            db, EventManagerService.snapshot_event(None), EventManagerService.snapshot_event(new_event)
+        )
+        
         db.commit()
         db.refresh(new_event)
         return EventService._populate_event_details(db, new_event)
@@ -36,9 +50,36 @@ class EventService:
         skip: int = 0,
         limit: int = 100
     ):
-        """Get events with multiple filters - formatted for frontend"""
+        """Get events with multiple filters - formatted for frontend (cached per organization)"""
+        params = (status, category_id, event_type_id, manager_id, search, skip, limit)
+        return tenant_cache.get_or_load(
+            organization_id, "events.list", params, EVENT_LIST_TABLES,
+            lambda: EventService._load_events_with_filters(db, organization_id, *params),
+            store_after_invalidation=replica_grace_seconds(db)
+        )
+
+    @staticmethod
+    def _load_events_with_filters(
+        db: Session,
+        organization_id: int,
+        status: str = None,
+        category_id: int = None,
+        event_type_id: int = None,
+        manager_id: int = None,
+        search: str = None,
+        skip: int = 0,
+        limit: int = 100
+    ):
         query = db.query(
-            Event,
+            Event.id,
+            Event.name,
+            Event.event_date,
+            Event.location,
+            Event.city,
+            Event.state,
+            Event.expected_attendees,
+            Event.budget,
+            Event.status,
             Category.name.label('category_name'),
             EventType.name.label('event_type_name'),
             User.first_name,
@@ -74,64 +115,64 @@ class EventService:
         
         events = query.order_by(Event.event_date.desc()).offset(skip).limit(limit).all()
         
+        # Plain dicts in the EventListItemSchema shape; the route serializes
+        # the whole list at once with FastJSONResponse.from_rows
         result = []
-        for event, cat_name, type_name, fname, lname in events:
+        for row in events:
             # Format location properly
-            location = event.location
-            if event.city and event.state:
-                location = f"{event.city}, {event.state}"
-            elif event.city:
-                location = event.city
+            location = row.location
+            if row.city and row.state:
+                location = f"{row.city}, {row.state}"
+            elif row.city:
+                location = row.city
             
             # Format manager name
             manager = None
-            if fname:
-                manager = f"{fname} {lname}" if lname else fname
+            if row.first_name:
+                manager = f"{row.first_name} {row.last_name}" if row.last_name else row.first_name
             
             result.append({
-                "id": event.id,
-                "name": event.name,
-                "category": cat_name,
-                "type": type_name,  # Changed from event_type to type
-                "date": event.event_date.strftime("%b %d, %Y"),
+                "id": row.id,
+                "name": row.name,
+                "category": row.category_name,
+                "type": row.event_type_name,  # Changed from event_type to type
+                "date": row.event_date.strftime("%b %d, %Y"),
                 "location": location,
-                "attendees": event.expected_attendees,
-                "budget": float(event.budget) if event.budget else 0,  # ✅ Ensure float
+                "attendees": row.expected_attendees,
+                "budget": float(row.budget) if row.budget else 0,  # ✅ Ensure float
                 "manager": manager,
-                "status": event.status.value
+                "status": row.status.value
             })
         
         return result
     
     @staticmethod
     def get_event_stats(db: Session, organization_id: int):
-        """Get event statistics"""
-        total = db.query(func.count(Event.id)).filter(
-            Event.organization_id == organization_id,
-            Event.inactive == False
-        ).scalar()
-        
-        active = db.query(func.count(Event.id)).filter(
-            Event.organization_id == organization_id,
-            Event.status == EventStatus.ACTIVE,
-            Event.inactive == False
-        ).scalar()
-        
-        attendees = db.query(func.sum(Event.expected_attendees)).filter(
-            Event.organization_id == organization_id,
-            Event.inactive == False
-        ).scalar() or 0
-        
-        budget = db.query(func.sum(Event.budget)).filter(
+        """Get event statistics (cached per organization)"""
+        return tenant_cache.get_or_load(
+            organization_id, "events.stats", (), EVENT_STATS_TABLES,
+            lambda: EventService._load_event_stats(db, organization_id),
+            store_after_invalidation=replica_grace_seconds(db)
+        )
+
+    @staticmethod
+    def _load_event_stats(db: Session, organization_id: int):
+        # All four aggregates in one pass over the organization's events
+        total, active, attendees, budget = db.query(
+            func.count(Event.id),
+            func.sum(case((Event.status == EventStatus.ACTIVE, 1), else_=0)),
+            func.sum(Event.expected_attendees),
+            func.sum(Event.budget)
+        ).filter(
             Event.organization_id == organization_id,
             Event.inactive == False
-        ).scalar() or 0
+        ).one()
         
         return {
             "totalEvents": total,
-            "activeEvents": active,
-            "totalAttendees": attendees,
-            "totalBudget": float(budget)  # ✅ Ensure float
+            "activeEvents": int(active or 0),
+            "totalAttendees": attendees or 0,
+            "totalBudget": float(budget or 0)  # ✅ Ensure float
         }
     
     @staticmethod
@@ -219,10 +260,13 @@ class EventService:
         if not event:
             raise HTTPException(status_code=404, detail="Event not found")
         
+        before = EventManagerService.snapshot_event(event)
+        
         for key, value in event_update.dict(exclude_unset=True).items():
             setattr(event, key, value)
         
         event.modified_by = current_user.username
+        EventManagerService.apply_event_change(db, before, EventManagerService.snapshot_event(event))
         db.commit()
         db.refresh(event)
         return EventService._populate_event_details(db, event)
@@ -238,8 +282,11 @@ class EventService:
         if not event:
             raise HTTPException(status_code=404, detail="Event not found")
         
+        before = EventManagerService.snapshot_event(event)
+        
         event.inactive = True
         event.modified_by = current_user.username
+        EventManagerService.apply_event_change(db, before, EventManagerService.snapshot_event(event))
         db.commit()
     
     @staticmethod
@@ -253,10 +300,11 @@ class EventService:
         if not manager:
             raise HTTPException(status_code=404, detail="Manager not found")
         
+        before = EventManagerService.snapshot_event(event)
+        
         event.event_manager_id = manager_id
         event.modified_by = current_user.username
-        db.commit()
         
-        # Update manager stats
-        from app.services.event_manager_service import EventManagerService
-        EventManagerService.update_manager_stats(db, manager_id)
\ No newline at end of file
+        # Move the event's contribution from the previous manager (if any) to the new one
+        EventManagerService.apply_event_change(db, before, EventManagerService.snapshot_event(event))
+        db.commit()
\ No newline at end of file
@@ -3,56 +3,101 @@ from app.models.vendor_order_m import VendorOrder
 from app.models.vendor_payment_m import VendorPayment
 from app.models.event_m import Event, EventStatus
 from app.schemas.payment_schema import PaymentInitiate
+from app.services.event_manager_service import EventManagerService
+from app.services.revenue_leaderboard_service import RevenueLeaderboardService
+from app.services.vendor_payment_service import VendorPaymentService
 from datetime import datetime
 from fastapi import HTTPException
-import uuid
 import razorpay
-from app.config import settings
-
-# Initialize Razorpay Client
-client = razorpay.Client(auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET))
+from app.utils.payment_gateway import payment_gateway, PaymentGatewayError, PaymentGatewayRejected
 
 class PaymentService:
+    @staticmethod
+    def _pending_payment(db: Session, order_id: int, payment_ref: str = None):
+        query = db.query(VendorPayment).filter(
+            VendorPayment.order_id == order_id,
+            VendorPayment.status == "pending",
+            VendorPayment.payment_ref.isnot(None)
+        )
+        if payment_ref:
+            query = query.filter(VendorPayment.payment_ref == payment_ref)
+        return query.first()
+
+    @staticmethod
+    def _already_initiated(payment: VendorPayment, currency: str):
+        return {
+            "transaction_id": payment.payment_ref,
+            "status": "created",
+            "amount": payment.amount,
+            "currency": currency,
+            "message": "Payment already initiated. Proceed to gateway."
+        }
+
     @staticmethod
     def initiate_payment(db: Session, payment_data: PaymentInitiate, user_id: int):
-        # 1. Fetch the order
-        order = db.query(VendorOrder).filter(VendorOrder.id == payment_data.order_id).first()
+        # 1. Fetch the order (locked only for the checks below, never across the gateway call)
+        order = db.query(VendorOrder).filter(VendorOrder.id == payment_data.order_id).with_for_update().first()
         if not order:
             raise HTTPException(404, "Order not found")
         
         # 2. Validate amount (Basic check)
         # Note: payment_data.amount should be passed in INR, Razorpay expects Paikse
         if float(order.amount) != float(payment_data.amount):
+           db.rollback()
            raise HTTPException(400, "Payment amount mismatch")
 
-        # 3. Create Razorpay Order
-        amount_in_paise = int(payment_data.amount * 100)
+        # 3. Reuse the gateway order of an earlier attempt for this order
+        existing = PaymentService._pending_payment(db, order.id)
+        if existing and float(existing.amount) == float(payment_data.amount):
+            response = PaymentService._already_initiated(existing, payment_data.currency)
+            db.commit()
+            return response
+
+        order_id, vendor_id = order.id, order.vendor_id
+        # Release the row lock before talking to Razorpay: create_order retries
+        # with timeouts and backoff, and is idempotent on the order's receipt,
+        # so two concurrent initiations get the same gateway order anyway
+        db.commit()
+
+        # 4. Create Razorpay Order (idempotent on order_id, retried with backoff)
+        amount_in_paise = int(round(payment_data.amount * 100))
         currency = payment_data.currency
         
         try:
-            razorpay_order = client.order.create({
-                "amount": amount_in_paise,
-                "currency": currency,
-                "receipt": f"order_rcptid_{payment_data.order_id}",
-                "notes": {
+            razorpay_order = payment_gateway.create_order(
+                order_id,
+                amount_in_paise,
+                currency,
+                notes={
                     "order_id": payment_data.order_id,
                     "user_id": user_id
                 }
-            })
-        except Exception as e:
-             raise HTTPException(500, detail=f"Razorpay Error: {str(e)}")
+            )
+        except PaymentGatewayRejected as e:
+            raise HTTPException(400, detail=f"Razorpay Error: {str(e)}")
+        except PaymentGatewayError as e:
+            raise HTTPException(503, detail=f"Payment gateway unavailable: {str(e)}")
 
         transaction_id = razorpay_order.get("id")
 
-        # 4. Create VendorPayment record (Pending)
+        # 5. Create VendorPayment record (Pending), unless a concurrent
+        # initiation recorded the same gateway order while we were waiting
+        db.query(VendorOrder).filter(VendorOrder.id == order_id).with_for_update().first()
+        existing = PaymentService._pending_payment(db, order_id, transaction_id)
+        if existing:
+            response = PaymentService._already_initiated(existing, currency)
+            db.commit()
+            return response
+
         payment = VendorPayment(
-            vendor_id=order.vendor_id,
-            order_id=order.id,
+            vendor_id=vendor_id,
+            order_id=order_id,
             amount=payment_data.amount,
             payment_method=payment_data.payment_method,
             payment_ref=transaction_id, # Store Razorpay Order ID here
             status="pending"
         )
+        VendorPaymentService.apply_payment_change(db, vendor_id, payment.amount, None, "pending")
         db.add(payment)
         db.commit()
         db.refresh(payment)
@@ -69,40 +114,56 @@ class PaymentService:
     def verify_payment(db: Session, razorpay_payment_id: str, razorpay_order_id: str, razorpay_signature: str):
         # 1. Verify Signature
         try:
-            client.utility.verify_payment_signature({
-                'razorpay_order_id': razorpay_order_id,
-                'razorpay_payment_id': razorpay_payment_id,
-                'razorpay_signature': razorpay_signature
-            })
+            payment_gateway.verify_payment_signature(razorpay_order_id, razorpay_payment_id, razorpay_signature)
         except razorpay.errors.SignatureVerificationError:
             raise HTTPException(400, "Invalid payment signature")
 
         # 2. Fetch Payment Record
-        # We stored razorpay_order_id in payment_ref
-        payment = db.query(VendorPayment).filter(VendorPayment.payment_ref == razorpay_order_id).first()
+        # We stored razorpay_order_id in payment_ref. Locked (payment, then
+        # order) so the webhook and the client callback can't both complete it.
+        payment = db.query(VendorPayment).filter(
+            VendorPayment.payment_ref == razorpay_order_id
+        ).with_for_update().first()
         if not payment:
             raise HTTPException(404, "Payment transaction not found")
+
+        if payment.status == "completed":
+            db.commit()
+            return {
+                "transaction_id": razorpay_payment_id,
+                "status": "success",
+                "amount": payment.amount,
+                "message": "Payment already verified. Event is confirmed."
+            }
             
-        order = db.query(VendorOrder).filter(VendorOrder.id == payment.order_id).first()
+        order = db.query(VendorOrder).filter(VendorOrder.id == payment.order_id).with_for_update().first()
         if not order:
+            db.rollback()
             raise HTTPException(404, "Order associated with payment not found")
 
-        # 3. Mark Payment as Completed
+        # 3. Mark Payment as Completed (ledger first, in the same transaction)
+        VendorPaymentService.apply_payment_change(db, payment.vendor_id, payment.amount, payment.status, "completed")
         payment.status = "completed"
         payment.paid_at = datetime.utcnow()
         # Optionally create a new field to store the actual payment_id if needed, or append to notes
         
         # 4. Mark Order as Confirmed
+        newly_confirmed = order.status != "confirmed"
         order.status = "confirmed"
         order.confirmed_at = datetime.utcnow()
         
         # 5. Mark Event as Confirmed
         event = db.query(Event).filter(Event.id == order.event_id).first()
         if event:
+             before = EventManagerService.snapshot_event(event)
              event.status = EventStatus.CONFIRMED
+             EventManagerService.apply_event_change(db, before, EventManagerService.snapshot_event(event))
             
         db.commit()
 
+        if newly_confirmed:
+            RevenueLeaderboardService.record_confirmed_order(db, order, event)
+
         return {
             "transaction_id": razorpay_payment_id,
             "status": "success",
@@ -0,0 +1,257 @@
+# app/services/revenue_leaderboard_service.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import datetime, date, timedelta
+import threading
+
+from app.models.vendor_order_m import VendorOrder
+from app.models.vendor_m import Vendor
+from app.models.event_m import Event
+from app.models.category_m import Category
+
+
+# Rolling windows in days, matching the admin dashboard time ranges
+LEADERBOARD_WINDOWS = {"week": 7, "month": 30, "year": 365}
+DEFAULT_WINDOW = "month"
+
+# Totals below this are float noise left over from expiring buckets
+_EPSILON = 0.005
+
+
+class RankedTotals:
+    """
+    Running totals per key plus a list kept sorted by (-total, key), so
+    the top K is a slice of the first K entries.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self._ranked = []
+
+    def add(self, key, delta: float):
+        old = self.totals.get(key)
+        if old is not None:
+            del self._ranked[bisect_left(self._ranked, (-old, key))]
+
+        new = (old or 0.0) + delta
+        if new > _EPSILON:
+            self.totals[key] = new
+            insort(self._ranked, (-new, key))
+        else:
+            self.totals.pop(key, None)
+
+    def top(self, k: int):
+        return [(key, -neg_total) for neg_total, key in self._ranked[:k]]
+
+    def sum(self) -> float:
+        return sum(self.totals.values())
+
+
+class RevenueLeaderboard:
+    """
+    Confirmed order revenue bucketed by UTC day. Each window keeps ranked
+    vendor and category totals; recording an order adds to every window,
+    and advancing the clock subtracts the buckets that fell out of it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.loaded_at = None
+        self._reset()
+
+    def _reset(self):
+        # day -> {vendor_id: amount}, day -> {category_id: amount}
+        self._vendor_days = defaultdict(lambda: defaultdict(float))
+        self._category_days = defaultdict(lambda: defaultdict(float))
+        self.vendor_names = {}
+        self.category_names = {}
+        self._windows = {
+            name: {"first_day": None, "vendors": RankedTotals(), "categories": RankedTotals()}
+            for name in LEADERBOARD_WINDOWS
+        }
+        self._today = None
+
+    def load(self, rows, vendor_names: dict, category_names: dict, today: date):
+        """Replace the whole board from (day, vendor_id, category_id, amount) rows"""
+        with self._lock:
+            self._reset()
+            self.vendor_names = dict(vendor_names)
+            self.category_names = dict(category_names)
+            self._today = today
+            for name, days in LEADERBOARD_WINDOWS.items():
+                self._windows[name]["first_day"] = today - timedelta(days=days - 1)
+
+            for day, vendor_id, category_id, amount in rows:
+                self._add(day, vendor_id, category_id, float(amount or 0))
+
+            self.loaded = True
+            self.loaded_at = datetime.utcnow()
+
+    def record(self, day: date, vendor_id: int, category_id, amount: float,
+               vendor_name: str = None, category_name: str = None):
+        with self._lock:
+            if vendor_name:
+                self.vendor_names[vendor_id] = vendor_name
+            if category_name and category_id is not None:
+                self.category_names[category_id] = category_name
+            self._advance(day)
+            self._add(day, vendor_id, category_id, float(amount or 0))
+
+    def _add(self, day: date, vendor_id: int, category_id, amount: float):
+        if amount == 0 or day > self._today:
+            return
+        self._vendor_days[day][vendor_id] += amount
+        if category_id is not None:
+            self._category_days[day][category_id] += amount
+
+        for window in self._windows.values():
+            if day >= window["first_day"]:
+                window["vendors"].add(vendor_id, amount)
+                if category_id is not None:
+                    window["categories"].add(category_id, amount)
+
+    def _advance(self, today: date):
+        """Expire the day buckets that have rolled out of each window"""
+        if self._today is not None and today <= self._today:
+            return
+        self._today = today
+
+        for name, days in LEADERBOARD_WINDOWS.items():
+            window = self._windows[name]
+            new_first_day = today - timedelta(days=days - 1)
+            day = window["first_day"]
+            while day < new_first_day:
+                for vendor_id, amount in self._vendor_days.get(day, {}).items():
+                    window["vendors"].add(vendor_id, -amount)
+                for category_id, amount in self._category_days.get(day, {}).items():
+                    window["categories"].add(category_id, -amount)
+                day += timedelta(days=1)
+            window["first_day"] = new_first_day
+
+        # Buckets older than the longest window are no longer needed
+        oldest = today - timedelta(days=max(LEADERBOARD_WINDOWS.values()) - 1)
+        for buckets in (self._vendor_days, self._category_days):
+            for day in [d for d in buckets if d < oldest]:
+                del buckets[day]
+
+    def top_vendors(self, window: str, k: int, today: date):
+        with self._lock:
+            self._advance(today)
+            ranked = self._windows[window]["vendors"].top(k)
+            return [
+                {"name": self.vendor_names.get(vendor_id, f"Vendor #{vendor_id}"), "revenue": round(revenue, 2)}
+                for vendor_id, revenue in ranked
+            ]
+
+    def revenue_by_category(self, window: str, k: int, today: date):
+        with self._lock:
+            self._advance(today)
+            categories = self._windows[window]["categories"]
+            ranked = categories.top(k)
+            total = categories.sum()
+            return [
+                {
+                    "category": self.category_names.get(category_id, f"Category #{category_id}"),
+                    "revenue": round(revenue, 2),
+                    "percentage": round(revenue * 100 / total, 1) if total else 0.0
+                }
+                for category_id, revenue in ranked
+            ]
+
+
+revenue_leaderboard = RevenueLeaderboard()
+
+
+class RevenueLeaderboardService:
+
+    @staticmethod
+    def _window(time_range: str) -> str:
+        return time_range if time_range in LEADERBOARD_WINDOWS else DEFAULT_WINDOW
+
+    # --------------------------------------------------
+    # FULL REBUILD (cold start + periodic resync)
+    # --------------------------------------------------
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """
+        Reload the board from confirmed orders in the longest window.
+        Runs on first read and on a schedule, so orders confirmed by other
+        app workers are picked up too. Returns the number of day buckets.
+        """
+        today = datetime.utcnow().date()
+        since = datetime.combine(today - timedelta(days=max(LEADERBOARD_WINDOWS.values()) - 1), datetime.min.time())
+        day = func.date(VendorOrder.confirmed_at)
+
+        rows = db.query(
+            day, VendorOrder.vendor_id, Event.category_id, func.sum(VendorOrder.amount)
+        ).outerjoin(
+            Event, Event.id == VendorOrder.event_id
+        ).filter(
+            VendorOrder.status == "confirmed",
+            VendorOrder.confirmed_at >= since,
+            VendorOrder.inactive == False
+        ).group_by(
+            day, VendorOrder.vendor_id, Event.category_id
+        ).all()
+
+        # func.date comes back as a string on some drivers
+        rows = [
+            (d if isinstance(d, date) else date.fromisoformat(str(d)), vendor_id, category_id, amount)
+            for d, vendor_id, category_id, amount in rows
+        ]
+
+        vendor_ids = {vendor_id for _, vendor_id, _, _ in rows}
+        vendor_names = dict(
+            db.query(Vendor.id, Vendor.company_name).filter(Vendor.id.in_(vendor_ids)).all()
+        ) if vendor_ids else {}
+        category_names = dict(db.query(Category.id, Category.name).all())
+
+        revenue_leaderboard.load(rows, vendor_names, category_names, today)
+        return len({d for d, _, _, _ in rows})
+
+    # --------------------------------------------------
+    # INCREMENTAL UPDATE
+    # --------------------------------------------------
+    @staticmethod
+    def record_confirmed_order(db: Session, order: VendorOrder, event: Event = None):
+        """Add a just-confirmed order to every window; call after the commit"""
+        if not revenue_leaderboard.loaded:
+            # The first read rebuilds from the database, which includes this order
+            return
+
+        category_id = event.category_id if event else None
+        vendor_name = None
+        category_name = None
+        if order.vendor_id not in revenue_leaderboard.vendor_names:
+            vendor_name = db.query(Vendor.company_name).filter(Vendor.id == order.vendor_id).scalar()
+        if category_id is not None and category_id not in revenue_leaderboard.category_names:
+            category_name = db.query(Category.name).filter(Category.id == category_id).scalar()
+
+        confirmed_at = order.confirmed_at or datetime.utcnow()
+        revenue_leaderboard.record(
+            confirmed_at.date(), order.vendor_id, category_id, order.amount,
+            vendor_name=vendor_name, category_name=category_name
+        )
+
+    # --------------------------------------------------
+    # READS (O(K))
+    # --------------------------------------------------
+    @staticmethod
+    def get_top_vendors(db: Session, time_range: str, limit: int):
+        if not revenue_leaderboard.loaded:
+            RevenueLeaderboardService.rebuild(db)
+        return revenue_leaderboard.top_vendors(
+            RevenueLeaderboardService._window(time_range), limit, datetime.utcnow().date()
+        )
+
+    @staticmethod
+    def get_revenue_by_category(db: Session, time_range: str, limit: int):
+        if not revenue_leaderboard.loaded:
+            RevenueLeaderboardService.rebuild(db)
+        return revenue_leaderboard.revenue_by_category(
+            RevenueLeaderboardService._window(time_range), limit, datetime.utcnow().date()
+        )
@@ -1,12 +1,51 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case
+from fastapi import HTTPException
+from datetime import datetime
 from app.models.review_m import Review
 from app.models.user_m import User
+from app.models.vendor_m import Vendor
+from app.models.event_m import Event
 from app.schemas.review_schema import ReviewCreate
 
+
+def _star_column(rating: float) -> str:
+    """Histogram bucket for a rating: rounded half up to whole stars, clamped to 1-5"""
+    return f"rating_{min(5, max(1, int(rating + 0.5)))}"
+
+
+def _star_bucket():
+    """_star_column as SQL, so reconciliation buckets exactly like the runtime path"""
+    return case(
+        (Review.rating < 1.5, 1),
+        (Review.rating < 2.5, 2),
+        (Review.rating < 3.5, 3),
+        (Review.rating < 4.5, 4),
+        else_=5
+    )
+
+
+def _reviewer_name(include_email: bool = False):
+    """
+    'First Last' for joined review lists, else "Anonymous". Only the
+    vendor's own authenticated view may fall back to the email; the
+    public list must never expose it.
+    """
+    full_name = func.nullif(
+        func.trim(func.coalesce(User.first_name, "") + " " + func.coalesce(User.last_name, "")),
+        ""
+    )
+    if include_email:
+        return func.coalesce(full_name, User.email, "Anonymous")
+    return func.coalesce(full_name, "Anonymous")
+
+
 class ReviewService:
     @staticmethod
     def create_review(db: Session, review_data: ReviewCreate, consumer_id: int):
+        if not 1 <= review_data.rating <= 5:
+            raise HTTPException(400, "Rating must be between 1 and 5")
+
         # Check if review already exists for this booking/vendor? (Optional constraint)
         new_review = Review(
             consumer_id=consumer_id,
@@ -17,22 +56,154 @@ class ReviewService:
             created_by=str(consumer_id)
         )
         db.add(new_review)
+        ReviewService.apply_rating_change(db, review_data.vendor_id, review_data.rating, +1)
         db.commit()
         db.refresh(new_review)
         return new_review
 
+    @staticmethod
+    def delete_review(db: Session, review_id: int, consumer_id: int):
+        """Soft-delete a consumer's own review and take it out of the vendor aggregates"""
+        review = db.query(Review).filter(
+            Review.id == review_id,
+            Review.consumer_id == consumer_id,
+            Review.inactive == False
+        ).first()
+
+        if not review:
+            raise HTTPException(404, "Review not found")
+
+        review.inactive = True
+        review.deleted_at = datetime.utcnow()
+        review.modified_by = str(consumer_id)
+        ReviewService.apply_rating_change(db, review.vendor_id, review.rating, -1)
+        db.commit()
+
+        return {"message": "Review deleted successfully"}
+
+    @staticmethod
+    def apply_rating_change(db: Session, vendor_id: int, rating: float, sign: int):
+        """
+        Add (sign=+1) or remove (sign=-1) one rating from the vendor's
+        sum, count and star histogram atomically, then refresh the average.
+        The average is a second UPDATE so it reads the new totals on every
+        database (MySQL evaluates SET left to right, others do not).
+        """
+        star = _star_column(rating)
+        db.query(Vendor).filter(Vendor.id == vendor_id).update(
+            {
+                Vendor.rating_sum: Vendor.rating_sum + sign * rating,
+                Vendor.total_reviews: Vendor.total_reviews + sign,
+                getattr(Vendor, star): getattr(Vendor, star) + sign
+            },
+            synchronize_session=False
+        )
+        db.query(Vendor).filter(Vendor.id == vendor_id).update(
+            {
+                Vendor.rating: case(
+                    (Vendor.total_reviews > 0, func.round(Vendor.rating_sum / Vendor.total_reviews, 2)),
+                    else_=0
+                )
+            },
+            synchronize_session=False
+        )
+
+    @staticmethod
+    def reconcile_review_aggregates(db: Session) -> int:
+        """
+        Recompute rating_sum, total_reviews and the star histogram from
+        active reviews and correct any vendor that drifted. Returns the
+        number of vendors corrected.
+        """
+        star = _star_bucket()
+        stats = db.query(
+            Review.vendor_id.label("vendor_id"),
+            func.count(Review.id).label("total_reviews"),
+            func.sum(Review.rating).label("rating_sum"),
+            *[func.sum(case((star == stars, 1), else_=0)).label(f"rating_{stars}") for stars in range(1, 6)]
+        ).filter(
+            Review.inactive == False
+        ).group_by(
+            Review.vendor_id
+        ).subquery("vendor_review_stats")
+
+        star_columns = [f"rating_{stars}" for stars in range(1, 6)]
+        rows = db.query(
+            Vendor.id,
+            Vendor.total_reviews,
+            Vendor.rating_sum,
+            *[getattr(Vendor, column) for column in star_columns],
+            func.coalesce(stats.c.total_reviews, 0),
+            func.coalesce(stats.c.rating_sum, 0),
+            *[func.coalesce(getattr(stats.c, column), 0) for column in star_columns]
+        ).outerjoin(
+            stats, stats.c.vendor_id == Vendor.id
+        ).all()
+
+        corrected = 0
+        for row in rows:
+            vendor_id, current, actual = row[0], row[1:8], row[8:]
+            counts = [int(value or 0) for value in current[:1] + current[2:]]
+            actual_counts = [int(value) for value in actual[:1] + actual[2:]]
+            actual_sum = float(actual[1])
+            if counts == actual_counts and abs(float(current[1] or 0) - actual_sum) < 0.005:
+                continue
+            total_reviews = actual_counts[0]
+            db.query(Vendor).filter(Vendor.id == vendor_id).update(
+                {
+                    "total_reviews": total_reviews,
+                    "rating_sum": actual_sum,
+                    "rating": round(actual_sum / total_reviews, 2) if total_reviews else 0,
+                    **dict(zip(star_columns, actual_counts[1:]))
+                },
+                synchronize_session=False
+            )
+            corrected += 1
+
+        db.commit()
+        return corrected
+
+    @staticmethod
+    def rating_summary(vendor: Vendor) -> dict:
+        """Average, count and histogram straight from the vendor row"""
+        return {
+            "average_rating": round(float(vendor.rating or 0), 2),
+            "total_reviews": vendor.total_reviews or 0,
+            "rating_distribution": {
+                stars: getattr(vendor, f"rating_{stars}") or 0 for stars in range(1, 6)
+            }
+        }
+
+    @staticmethod
+    def list_reviews(db: Session, vendor_id: int, skip: int = 0, limit: int = 20, include_email: bool = False):
+        """
+        Active reviews for a vendor, newest first, with reviewer and event
+        names in one query. include_email is for the vendor's own view only.
+        """
+        return (
+            db.query(
+                Review.id.label("id"),
+                _reviewer_name(include_email).label("consumer_name"),
+                Review.rating.label("rating"),
+                Review.comment.label("comment"),
+                Event.name.label("event_name"),
+                Review.created_at.label("created_at")
+            )
+            .outerjoin(User, User.id == Review.consumer_id)
+            .outerjoin(Event, Event.id == Review.event_id)
+            .filter(
+                Review.vendor_id == vendor_id,
+                Review.inactive == False
+            )
+            .order_by(Review.created_at.desc(), Review.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
     @staticmethod
     def get_vendor_reviews(db: Session, vendor_id: int, skip: int = 0, limit: int = 20):
-        reviews = db.query(Review).filter(Review.vendor_id == vendor_id).offset(skip).limit(limit).all()
-        # Enrich with consumer name
-        result = []
-        for r in reviews:
-            consumer = db.query(User).filter(User.id == r.consumer_id).first()
-            result.append({
-                "id": r.id,
-                "consumer_name": f"{consumer.first_name} {consumer.last_name}" if consumer else "Anonymous",
-                "rating": r.rating,
-                "comment": r.comment,
-                "created_at": r.created_at
-            })
-        return result
+        return [
+            row._asdict()
+            for row in ReviewService.list_reviews(db, vendor_id, skip, limit)
+        ]
@@ -1,6 +1,8 @@
 # app/services/vendor_bidding_service.py
 
 from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from datetime import datetime
 from typing import List, Optional
@@ -10,6 +12,7 @@ from app.models.vendor_bid_m import VendorBid
 from app.models.event_m import Event, BiddingStatus
 from app.models.vendor_m import Vendor
 from app.models.service_m import Service
+from app.services.admin_vendor_service import AdminVendorService
 
 from app.schemas.vendor_bid_schema import (
     VendorBidCreateSchema,
@@ -36,8 +39,12 @@ class VendorBiddingService:
 
         vendor_services = set(vendor.offered_services or [])
 
+        # The lifecycle sweeper closes expired events; the deadline check
+        # only hides those that expired since its last run
+        now = datetime.utcnow()
         events = db.query(Event).filter(
             Event.bidding_status == BiddingStatus.OPEN.value,
+            or_(Event.bidding_deadline.is_(None), Event.bidding_deadline > now),
             Event.inactive == False
         ).offset(skip).limit(limit).all()
 
@@ -156,7 +163,13 @@ class VendorBiddingService:
         )
 
         db.add(bid)
-        db.commit()
+        AdminVendorService.apply_bid_deltas(db, {vendor_id: {"total_bids": 1}})
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent submit won the race on uq_vendor_bids_active_vendor_event
+            db.rollback()
+            raise HTTPException(400, "You already submitted a bid")
         db.refresh(bid)
 
         return {
@@ -172,9 +185,21 @@ class VendorBiddingService:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> List[VendorMyBidSchema]:
-
-        query = db.query(VendorBid, Event).join(
+    ) -> List[dict]:
+        """
+        Rows in the VendorMyBidSchema shape; the route serializes the whole
+        list at once with FastJSONResponse.from_rows
+        """
+        query = db.query(
+            VendorBid.id,
+            VendorBid.total_amount,
+            VendorBid.status,
+            VendorBid.submitted_at,
+            VendorBid.shortlisted,
+            VendorBid.shortlisted_rank,
+            Event.name.label("event_name"),
+            Event.event_date
+        ).join(
             Event, VendorBid.event_id == Event.id
         ).filter(
             VendorBid.vendor_id == vendor_id,
@@ -189,19 +214,19 @@ class VendorBiddingService:
         ).offset(skip).limit(limit).all()
 
         return [
-            VendorMyBidSchema(
-                bidId=bid.id,
-                eventName=event.name,
-                eventDate=event.event_date.strftime("%b %d, %Y"),
-                totalAmount=float(bid.total_amount),
-                status=bid.status,
-                submittedAt=bid.submitted_at.isoformat()
-                if bid.submitted_at
+            {
+                "bidId": row.id,
+                "eventName": row.event_name,
+                "eventDate": row.event_date.strftime("%b %d, %Y"),
+                "totalAmount": float(row.total_amount),
+                "status": row.status,
+                "submittedAt": row.submitted_at.isoformat()
+                if row.submitted_at
                 else None,
-                shortlisted=bid.shortlisted,
-                shortlistedRank=bid.shortlisted_rank
-            )
-            for bid, event in bids
+                "shortlisted": bool(row.shortlisted),
+                "shortlistedRank": row.shortlisted_rank
+            }
+            for row in bids
         ]
 
 
@@ -323,6 +348,7 @@ class VendorBiddingService:
         
         # User requested DELETE endpoint implying removal. Let's soft delete.
         bid.inactive = True
+        AdminVendorService.apply_bid_deltas(db, {bid.vendor_id: {"total_bids": -1}})
         db.commit()
         
         return {"message": "Bid withdrawn successfully"}
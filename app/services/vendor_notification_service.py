@@ -8,6 +8,7 @@ from typing import List
 
 from app.models.vendor_notification_m import VendorNotification
 from app.schemas.vendor_notification_schema import VendorNotificationListItem
+from app.schemas.bulk_schema import BulkOperationResponse
 
 class VendorNotificationService:
 
@@ -55,6 +56,43 @@ class VendorNotificationService:
         
         return {"message": "Notification marked as read"}
 
+    @staticmethod
+    def mark_many_as_read(
+        db: Session,
+        notification_ids: List[int],
+        vendor_id: int
+    ):
+        """Mark the given notifications read with one UPDATE; per-id results"""
+        notification_ids = list(dict.fromkeys(notification_ids))
+
+        found = dict(
+            db.query(VendorNotification.id, VendorNotification.is_read).filter(
+                VendorNotification.id.in_(notification_ids),
+                VendorNotification.vendor_id == vendor_id
+            ).all()
+        )
+
+        unread = [i for i in notification_ids if i in found and not found[i]]
+        if unread:
+            db.query(VendorNotification).filter(
+                VendorNotification.id.in_(unread),
+                VendorNotification.vendor_id == vendor_id,
+                VendorNotification.is_read == False
+            ).update(
+                {
+                    "is_read": True,
+                    "read_at": datetime.utcnow()
+                },
+                synchronize_session=False
+            )
+            db.commit()
+
+        return BulkOperationResponse.from_results([
+            {"id": i, "success": False, "detail": "Notification not found"} if i not in found
+            else {"id": i, "success": True, "detail": "already read" if found[i] else "marked as read"}
+            for i in notification_ids
+        ])
+
     @staticmethod
     def mark_all_as_read(
         db: Session,
@@ -1,86 +1,180 @@
 # app/services/vendor_payment_service.py
 
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
-from typing import Optional
+from sqlalchemy import func, case
+from sqlalchemy.exc import IntegrityError
+from typing import Optional, List
+from collections import defaultdict
 from fastapi import HTTPException
 
 from app.models.vendor_payment_m import VendorPayment
+from app.models.vendor_ledger_m import VendorLedger
 from app.models.vendor_order_m import VendorOrder
 from app.models.vendor_m import Vendor
 from app.models.event_m import Event
 from app.models.user_m import User
 from app.schemas.vendor_payment_schema import (
     PaymentOverviewSchema,
-    PaymentListItemSchema,
     PaymentListResponse,
     PaymentInvoiceSchema
 )
 
 
+# Payment status -> (amount column, count column) on VendorLedger
+LEDGER_STATUS_COLUMNS = {
+    "pending": ("pending_amount", "pending_transactions"),
+    "completed": ("completed_amount", "completed_transactions"),
+}
+LEDGER_COLUMNS = (
+    "completed_amount", "pending_amount",
+    "total_transactions", "pending_transactions", "completed_transactions"
+)
+
+
 class VendorPaymentService:
     
+    # --------------------------------------------------
+    # LEDGER
+    # --------------------------------------------------
+    @staticmethod
+    def payment_aggregates(db: Session, vendor_ids: List[int] = None) -> dict:
+        """
+        One conditional aggregate over vendor_payments:
+        {vendor_id: {ledger column: value}}
+        """
+        query = db.query(
+            VendorPayment.vendor_id,
+            func.coalesce(func.sum(case((VendorPayment.status == "completed", VendorPayment.amount), else_=0)), 0),
+            func.coalesce(func.sum(case((VendorPayment.status == "pending", VendorPayment.amount), else_=0)), 0),
+            func.count(VendorPayment.id),
+            func.sum(case((VendorPayment.status == "pending", 1), else_=0)),
+            func.sum(case((VendorPayment.status == "completed", 1), else_=0))
+        )
+        if vendor_ids is not None:
+            query = query.filter(VendorPayment.vendor_id.in_(vendor_ids))
+
+        return {
+            row[0]: {
+                "completed_amount": float(row[1] or 0),
+                "pending_amount": float(row[2] or 0),
+                "total_transactions": int(row[3] or 0),
+                "pending_transactions": int(row[4] or 0),
+                "completed_transactions": int(row[5] or 0)
+            }
+            for row in query.group_by(VendorPayment.vendor_id).all()
+        }
+
+    @staticmethod
+    def _ensure_ledger(db: Session, vendor_id: int):
+        """
+        Create the vendor's ledger row from its payments if it is missing.
+        Must run before the caller's payment change is flushed.
+        """
+        if db.query(VendorLedger.id).filter(VendorLedger.vendor_id == vendor_id).scalar():
+            return
+
+        totals = VendorPaymentService.payment_aggregates(db, [vendor_id]).get(vendor_id, {})
+        try:
+            with db.begin_nested():
+                db.add(VendorLedger(vendor_id=vendor_id, created_by="system", **totals))
+        except IntegrityError:
+            # Another transaction created it first
+            pass
+
+    @staticmethod
+    def apply_payment_change(
+        db: Session,
+        vendor_id: int,
+        amount: float,
+        old_status: Optional[str],
+        new_status: Optional[str]
+    ):
+        """
+        Move `amount` between ledger buckets in the caller's transaction.
+        old_status=None records a new payment; new_status=None removes one.
+        Call before the payment change itself is flushed.
+        """
+        deltas = defaultdict(float)
+        if old_status is None:
+            deltas["total_transactions"] += 1
+        if new_status is None:
+            deltas["total_transactions"] -= 1
+
+        for status, sign in ((old_status, -1), (new_status, 1)):
+            columns = LEDGER_STATUS_COLUMNS.get(status)
+            if columns:
+                amount_column, count_column = columns
+                deltas[amount_column] += sign * float(amount or 0)
+                deltas[count_column] += sign
+
+        deltas = {column: value for column, value in deltas.items() if value}
+        if not deltas:
+            return
+
+        VendorPaymentService._ensure_ledger(db, vendor_id)
+        db.query(VendorLedger).filter(VendorLedger.vendor_id == vendor_id).update(
+            {
+                getattr(VendorLedger, column): getattr(VendorLedger, column) + value
+                for column, value in deltas.items()
+            },
+            synchronize_session=False
+        )
+
+    @staticmethod
+    def reconcile_ledgers(db: Session) -> int:
+        """
+        Rebuild ledger rows from vendor_payments and fix any that drifted.
+        Returns the number of ledgers created or corrected.
+        """
+        actual = VendorPaymentService.payment_aggregates(db)
+        ledgers = {ledger.vendor_id: ledger for ledger in db.query(VendorLedger).all()}
+
+        corrected = 0
+        for vendor_id in set(actual) | set(ledgers):
+            expected = actual.get(vendor_id, dict.fromkeys(LEDGER_COLUMNS, 0))
+            ledger = ledgers.get(vendor_id)
+            if ledger is None:
+                db.add(VendorLedger(vendor_id=vendor_id, created_by="system", **expected))
+                corrected += 1
+                continue
+
+            current = {column: getattr(ledger, column) or 0 for column in LEDGER_COLUMNS}
+            if all(abs(current[column] - expected[column]) < 0.005 for column in LEDGER_COLUMNS):
+                continue
+            for column in LEDGER_COLUMNS:
+                setattr(ledger, column, expected[column])
+            corrected += 1
+
+        db.commit()
+        return corrected
+
+    # --------------------------------------------------
+    # OVERVIEW
+    # --------------------------------------------------
     @staticmethod
     def get_payment_overview(db: Session, vendor_id: int) -> PaymentOverviewSchema:
         """
         Get payment overview stats for a vendor.
         Returns total earnings, pending, paid amounts and transaction counts.
+        Reads the vendor's ledger row; vendors without one fall back to a
+        single conditional aggregate.
         """
-        # Total earnings (all completed payments)
-        total_earnings = (
-            db.query(func.sum(VendorPayment.amount))
-            .filter(
-                VendorPayment.vendor_id == vendor_id,
-                VendorPayment.status == "completed"
-            )
-            .scalar()
-        ) or 0.0
-        
-        # Pending amount
-        pending_amount = (
-            db.query(func.sum(VendorPayment.amount))
-            .filter(
-                VendorPayment.vendor_id == vendor_id,
-                VendorPayment.status == "pending"
+        ledger = db.query(VendorLedger).filter(VendorLedger.vendor_id == vendor_id).first()
+        if ledger:
+            totals = {column: getattr(ledger, column) or 0 for column in LEDGER_COLUMNS}
+        else:
+            totals = VendorPaymentService.payment_aggregates(db, [vendor_id]).get(
+                vendor_id, dict.fromkeys(LEDGER_COLUMNS, 0)
             )
-            .scalar()
-        ) or 0.0
-        
-        # Paid amount (same as total earnings for completed)
-        paid_amount = total_earnings
-        
-        # Transaction counts
-        total_transactions = (
-            db.query(func.count(VendorPayment.id))
-            .filter(VendorPayment.vendor_id == vendor_id)
-            .scalar()
-        ) or 0
-        
-        pending_transactions = (
-            db.query(func.count(VendorPayment.id))
-            .filter(
-                VendorPayment.vendor_id == vendor_id,
-                VendorPayment.status == "pending"
-            )
-            .scalar()
-        ) or 0
-        
-        completed_transactions = (
-            db.query(func.count(VendorPayment.id))
-            .filter(
-                VendorPayment.vendor_id == vendor_id,
-                VendorPayment.status == "completed"
-            )
-            .scalar()
-        ) or 0
-        
+
         return PaymentOverviewSchema(
-            total_earnings=total_earnings,
-            pending_amount=pending_amount,
-            paid_amount=paid_amount,
-            total_transactions=total_transactions,
-            pending_transactions=pending_transactions,
-            completed_transactions=completed_transactions
+            total_earnings=totals["completed_amount"],
+            pending_amount=totals["pending_amount"],
+            # Paid amount (same as total earnings for completed)
+            paid_amount=totals["completed_amount"],
+            total_transactions=totals["total_transactions"],
+            pending_transactions=totals["pending_transactions"],
+            completed_transactions=totals["completed_transactions"]
         )
     
     @staticmethod
@@ -90,17 +184,11 @@ class VendorPaymentService:
         skip: int = 0, 
         limit: int = 20,
         status: Optional[str] = None
-    ) -> PaymentListResponse:
+    ) -> dict:
         """
         Get paginated list of payments for a vendor.
         """
-        query = (
-            db.query(VendorPayment)
-            .options(
-                joinedload(VendorPayment.order).joinedload(VendorOrder.event)
-            )
-            .filter(VendorPayment.vendor_id == vendor_id)
-        )
+        query = db.query(VendorPayment).filter(VendorPayment.vendor_id == vendor_id)
         
         if status:
             query = query.filter(VendorPayment.status == status)
@@ -108,47 +196,43 @@ class VendorPaymentService:
         # Get total count
         total = query.count()
         
-        # Get paginated results
-        payments = (
+        # Get paginated results as plain rows labelled after PaymentListItemSchema;
+        # the consumer is whoever created the event
+        consumer_name = func.nullif(
+            func.trim(func.coalesce(User.first_name, "") + " " + func.coalesce(User.last_name, "")),
+            ""
+        )
+        rows = (
             query
+            .with_entities(
+                VendorPayment.id.label("id"),
+                VendorPayment.order_id.label("order_id"),
+                VendorOrder.order_ref.label("order_ref"),
+                VendorPayment.amount.label("amount"),
+                VendorPayment.payment_method.label("payment_method"),
+                VendorPayment.payment_ref.label("payment_ref"),
+                VendorPayment.status.label("status"),
+                VendorPayment.paid_at.label("paid_at"),
+                VendorPayment.created_at.label("created_at"),
+                Event.name.label("event_name"),
+                consumer_name.label("consumer_name")
+            )
+            .outerjoin(VendorOrder, VendorOrder.id == VendorPayment.order_id)
+            .outerjoin(Event, Event.id == VendorOrder.event_id)
+            .outerjoin(User, User.username == Event.created_by)
             .order_by(VendorPayment.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
         
-        items = []
-        for payment in payments:
-            order = payment.order
-            event = order.event if order else None
-            
-            # Get consumer name from event
-            consumer_name = None
-            if event and event.user_id:
-                consumer = db.query(User).filter(User.id == event.user_id).first()
-                if consumer:
-                    consumer_name = consumer.full_name
-            
-            items.append(PaymentListItemSchema(
-                id=payment.id,
-                order_id=payment.order_id,
-                order_ref=order.order_ref if order else None,
-                amount=payment.amount,
-                payment_method=payment.payment_method,
-                payment_ref=payment.payment_ref,
-                status=payment.status,
-                paid_at=payment.paid_at,
-                created_at=payment.created_at,
-                event_name=event.title if event else None,
-                consumer_name=consumer_name
-            ))
-        
-        return PaymentListResponse(
-            items=items,
-            total=total,
-            skip=skip,
-            limit=limit
-        )
+        # Validated and serialized as a whole by the route (FastJSONResponse.from_model)
+        return {
+            "items": [row._asdict() for row in rows],
+            "total": total,
+            "skip": skip,
+            "limit": limit
+        }
     
     @staticmethod
     def get_payment_invoice(
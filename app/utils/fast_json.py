@@ -0,0 +1,60 @@
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Iterable, List, Type
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def _orjson_default(obj: Any):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """One cached TypeAdapter per schema; building adapters is not free"""
+    return TypeAdapter(List[schema])
+
+
+class FastJSONResponse(Response):
+    """
+    Opt-in orjson response class (`response_class=FastJSONResponse`).
+
+    For large lists prefer `FastJSONResponse.from_rows`, which validates
+    and serializes the whole list in one pydantic-core pass and skips
+    FastAPI's second validation through `response_model`.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            # Already serialized (see from_rows)
+            return content
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+    @classmethod
+    def from_rows(
+        cls,
+        schema: Type[BaseModel],
+        rows: Iterable[Any],
+        from_attributes: bool = False,
+        **kwargs
+    ) -> "FastJSONResponse":
+        """
+        Serialize `rows` (dicts, or SQLAlchemy Row tuples whose labels match
+        the schema fields when `from_attributes=True`) as a JSON list of
+        `schema` without building one model instance per row in Python.
+        """
+        adapter = list_adapter(schema)
+        items = adapter.validate_python(list(rows), from_attributes=from_attributes)
+        return cls(content=adapter.dump_json(items), **kwargs)
+
+    @classmethod
+    def from_model(cls, schema: Type[BaseModel], data: Any, **kwargs) -> "FastJSONResponse":
+        """Validate and serialize an envelope schema (e.g. paginated lists) in one pass"""
+        return cls(content=schema.model_validate(data).model_dump_json().encode(), **kwargs)
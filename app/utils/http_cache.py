@@ -0,0 +1,244 @@
+import gzip
+import hashlib
+from typing import Iterable, List, Optional
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+
+# Suffixes added to the ETag when the body is compressed, so each
+# representation keeps a distinct strong validator
+ENCODING_ETAG_SUFFIX = {"br": "-br", "gzip": "-gzip"}
+
+
+def version_etag(*parts) -> str:
+    """
+    Build a strong ETag from model versions (ids, updated_at, version
+    columns) so a route can skip hashing the serialized body.
+    """
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return '"' + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest() + '"'
+
+
+def _content_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _strip_etag(tag: str) -> str:
+    """Normalise a validator for comparison: drop W/ and encoding suffixes"""
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    for suffix in ENCODING_ETAG_SUFFIX.values():
+        if tag.endswith(suffix + '"'):
+            tag = tag[: -len(suffix) - 1] + '"'
+    return tag
+
+
+def _if_none_match_hit(header_value: str, etag: str) -> bool:
+    if header_value.strip() == "*":
+        return True
+    target = _strip_etag(etag)
+    return any(_strip_etag(tag) == target for tag in header_value.split(","))
+
+
+def _get_header(headers: Iterable, name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _set_header(headers: List, name: bytes, value: str):
+    headers[:] = [(k, v) for k, v in headers if k.lower() != name]
+    headers.append((name, value.encode("latin-1")))
+
+
+def _append_vary(headers: List, *fields: str):
+    existing = [f.strip() for f in (_get_header(headers, b"vary") or "").split(",") if f.strip()]
+    for field in fields:
+        if field.lower() not in (f.lower() for f in existing):
+            existing.append(field)
+    _set_header(headers, b"vary", ", ".join(existing))
+
+
+def _is_json(headers: Iterable) -> bool:
+    content_type = _get_header(headers, b"content-type") or ""
+    return content_type.startswith("application/json")
+
+
+class ConditionalGetStats:
+    """Per-route request / 304 counters"""
+
+    def __init__(self):
+        self.routes = {}
+
+    def record(self, route: str, not_modified: bool):
+        entry = self.routes.setdefault(route, {"requests": 0, "notModified": 0})
+        entry["requests"] += 1
+        if not_modified:
+            entry["notModified"] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            route: {
+                **entry,
+                "hitRatio": round(entry["notModified"] / entry["requests"], 3) if entry["requests"] else 0.0
+            }
+            for route, entry in sorted(self.routes.items())
+        }
+
+
+conditional_get_stats = ConditionalGetStats()
+
+
+class ConditionalGetMiddleware:
+    """
+    Strong ETags and If-None-Match handling for JSON GET endpoints.
+
+    Routes may set their own ETag (see `version_etag`); otherwise the
+    validator is a hash of the response body. Matching requests get an
+    empty 304 instead of the full payload.
+    """
+
+    def __init__(self, app, path_prefixes: Iterable[str]):
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = _get_header(scope["headers"], b"if-none-match")
+        start_message = None
+        body_parts = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if message["status"] != 200 or not _is_json(headers):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = {**message, "headers": headers}
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            headers = start_message["headers"]
+            etag = _get_header(headers, b"etag") or _content_etag(body)
+            not_modified = bool(if_none_match) and _if_none_match_hit(if_none_match, etag)
+
+            route = scope.get("route")
+            conditional_get_stats.record(getattr(route, "path", scope["path"]), not_modified)
+
+            _set_header(headers, b"etag", etag)
+            _set_header(headers, b"cache-control", "private, no-cache")
+            _append_vary(headers, "Authorization", "Accept-Encoding")
+
+            if not_modified:
+                headers = [(k, v) for k, v in headers if k.lower() not in (b"content-length", b"content-type")]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class CompressionMiddleware:
+    """
+    Brotli (when installed) or gzip compression for JSON responses larger
+    than `minimum_size`. Non-JSON and already-encoded responses pass
+    through untouched.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = {part.split(";")[0].strip() for part in accept_encoding.split(",")}
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Clients without gzip/br still go through the wrapper: their
+        # uncompressed variant needs Vary too, or a shared cache may hand
+        # it (or the compressed one) to the wrong client
+        encoding = self._choose_encoding(_get_header(scope["headers"], b"accept-encoding") or "")
+
+        start_message = None
+        body_parts = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if not _is_json(headers) or _get_header(headers, b"content-encoding"):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = {**message, "headers": headers}
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            headers = start_message["headers"]
+
+            if len(body) >= self.minimum_size:
+                _append_vary(headers, "Accept-Encoding")
+                if encoding is not None:
+                    body = self._compress(body, encoding)
+                    _set_header(headers, b"content-encoding", encoding)
+                    etag = _get_header(headers, b"etag")
+                    if etag and etag.endswith('"'):
+                        _set_header(headers, b"etag", etag[:-1] + ENCODING_ETAG_SUFFIX[encoding] + '"')
+
+            _set_header(headers, b"content-length", str(len(body)))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
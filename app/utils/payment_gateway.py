@@ -0,0 +1,152 @@
+import random
+import time
+from typing import Optional
+
+import razorpay
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import settings
+
+
+class PaymentGatewayError(Exception):
+    """The gateway could not be reached or kept failing within the retry budget"""
+
+
+class PaymentGatewayRejected(Exception):
+    """The gateway refused the request (4xx); retrying will not help"""
+
+
+# Failures worth retrying: the request may never have reached the gateway,
+# or the gateway itself reported a transient error
+_RETRYABLE = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    razorpay.errors.ServerError,
+    razorpay.errors.GatewayError,
+)
+
+
+class RazorpayGateway:
+    """
+    Razorpay client with a pooled keep-alive session, connect/read
+    timeouts, bounded exponential backoff and idempotent order creation.
+
+    Orders are keyed by a receipt derived from our order id. Before any
+    retry the gateway is asked for an order with that receipt, so a
+    request that timed out after the order was created is never repeated.
+    """
+
+    def __init__(
+        self,
+        key_id: str,
+        key_secret: str,
+        base_url: str = "",
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        max_attempts: int = 3,
+        backoff_base: float = 0.25,
+        backoff_max: float = 2.0,
+        pool_size: int = 20
+    ):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        options = {"base_url": base_url} if base_url else {}
+        self.client = razorpay.Client(session=self.session, auth=(key_id, key_secret), **options)
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        # Metrics
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.reused_orders = 0
+
+    @staticmethod
+    def receipt_for(order_id: int) -> str:
+        """Idempotency key for one of our orders; stable across retries and processes"""
+        return f"order_rcptid_{order_id}"
+
+    def _sleep_before_retry(self, attempt: int):
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        # Full jitter so retrying workers don't stampede the gateway together
+        time.sleep(random.uniform(0, delay))
+
+    def _find_order(self, receipt: str, amount: int) -> Optional[dict]:
+        result = self.client.order.all({"receipt": receipt}, timeout=self.timeout)
+        for order in result.get("items", []):
+            if order.get("receipt") == receipt and order.get("amount") == amount and order.get("status") != "paid":
+                return order
+        return None
+
+    def create_order(self, order_id: int, amount: int, currency: str, notes: dict = None) -> dict:
+        """
+        Create (or find the already created) gateway order for `order_id`.
+        `amount` is in the smallest currency unit (paise).
+        """
+        receipt = self.receipt_for(order_id)
+        data = {
+            "amount": amount,
+            "currency": currency,
+            "receipt": receipt,
+            "notes": notes or {}
+        }
+        headers = {"Idempotency-Key": receipt}
+
+        self.calls += 1
+        last_error = None
+        for attempt in range(self.max_attempts):
+            if attempt:
+                self.retries += 1
+                self._sleep_before_retry(attempt - 1)
+            try:
+                if attempt:
+                    # The previous attempt may have succeeded on the gateway side
+                    existing = self._find_order(receipt, amount)
+                    if existing:
+                        self.reused_orders += 1
+                        return existing
+                return self.client.order.create(data, timeout=self.timeout, headers=dict(headers))
+            except razorpay.errors.BadRequestError as e:
+                self.failures += 1
+                raise PaymentGatewayRejected(str(e)) from e
+            except _RETRYABLE as e:
+                last_error = e
+                print(f"⚠️ Razorpay attempt {attempt + 1}/{self.max_attempts} failed: {e}")
+
+        self.failures += 1
+        raise PaymentGatewayError(str(last_error))
+
+    def verify_payment_signature(self, razorpay_order_id: str, razorpay_payment_id: str, razorpay_signature: str):
+        """Local HMAC check; raises razorpay.errors.SignatureVerificationError"""
+        self.client.utility.verify_payment_signature({
+            'razorpay_order_id': razorpay_order_id,
+            'razorpay_payment_id': razorpay_payment_id,
+            'razorpay_signature': razorpay_signature
+        })
+
+    def metrics(self) -> dict:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "reusedOrders": self.reused_orders,
+        }
+
+
+payment_gateway = RazorpayGateway(
+    settings.RAZORPAY_KEY_ID,
+    settings.RAZORPAY_KEY_SECRET,
+    base_url=settings.RAZORPAY_BASE_URL,
+    connect_timeout=settings.PAYMENT_GATEWAY_CONNECT_TIMEOUT_SECONDS,
+    read_timeout=settings.PAYMENT_GATEWAY_READ_TIMEOUT_SECONDS,
+    max_attempts=settings.PAYMENT_GATEWAY_MAX_ATTEMPTS,
+    backoff_base=settings.PAYMENT_GATEWAY_BACKOFF_BASE_SECONDS,
+    pool_size=settings.PAYMENT_GATEWAY_POOL_SIZE
+)
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Callable, List
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+
+
+class PeriodicJob:
+    """
+    Run a synchronous DB job every `interval_seconds` inside the app lifespan.
+
+    The job receives its own session and runs in a worker thread so a slow
+    sweep never blocks the event loop.
+    """
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[Session], object]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self._task = None
+
+        # Run metrics
+        self.runs = 0
+        self.failures = 0
+        self.last_run_at = None
+        self.last_duration_seconds = 0.0
+        self.last_result = None
+        self.last_error = None
+
+    def _run_once(self):
+        db = SessionLocal()
+        started = time.monotonic()
+        self.last_run_at = datetime.utcnow()
+        try:
+            self.last_result = self.func(db)
+            self.last_error = None
+            return self.last_result
+        except Exception as e:
+            db.rollback()
+            self.failures += 1
+            self.last_error = str(e)
+            raise
+        finally:
+            self.runs += 1
+            self.last_duration_seconds = time.monotonic() - started
+            db.close()
+
+    def metrics(self) -> dict:
+        return {
+            "name": self.name,
+            "intervalSeconds": self.interval_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "lastRunAt": self.last_run_at,
+            "lastDurationSeconds": round(self.last_duration_seconds, 3),
+            "lastResult": self.last_result,
+            "lastError": self.last_error,
+        }
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(self._run_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Scheduled job '{self.name}' failed: {e}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class Scheduler:
+    """Owns the periodic jobs started and stopped by the app lifespan"""
+
+    def __init__(self):
+        self.jobs: List[PeriodicJob] = []
+
+    def add_job(self, name: str, interval_seconds: float, func: Callable[[Session], object]):
+        self.jobs.append(PeriodicJob(name, interval_seconds, func))
+
+    def start(self):
+        for job in self.jobs:
+            job.start()
+
+    def metrics(self) -> List[dict]:
+        return [job.metrics() for job in self.jobs]
+
+    async def shutdown(self):
+        for job in self.jobs:
+            await job.stop()
+
+
+scheduler = Scheduler()
@@ -0,0 +1,286 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import read_engine
+
+
+class TenantStats:
+    __slots__ = ("hits", "misses", "evictions", "invalidations")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def as_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRatio": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class _TenantBucket:
+    """One organization's entries in LRU order, plus its own counters"""
+
+    __slots__ = ("entries", "stats", "generation", "invalidated_at")
+
+    def __init__(self):
+        # (shape, params) -> (expires_at, tables, value)
+        self.entries = OrderedDict()
+        self.stats = TenantStats()
+        # Bumped on every invalidation so a load that raced a commit is not stored
+        self.generation = 0
+        self.invalidated_at = 0.0
+
+
+class TenantQueryCache:
+    """
+    Read-through cache for organization-scoped queries, keyed by
+    (organization_id, query shape, params). Every entry records the tables
+    it was read from; committed writes drop that tenant's entries for the
+    touched tables (see the session hooks below).
+
+    Each tenant has its own LRU with max_entries_per_tenant slots, so a
+    noisy tenant only ever evicts its own entries. Tenants themselves are
+    kept in LRU order and the least recently used one is dropped whole
+    past max_tenants, which bounds memory at tenants x entries.
+    """
+
+    def __init__(self, max_tenants: int, max_entries_per_tenant: int, ttl_seconds: float):
+        self.max_tenants = max_tenants
+        self.max_entries_per_tenant = max_entries_per_tenant
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._tenants = OrderedDict()  # organization_id -> _TenantBucket
+        # Tables any entry has ever depended on; writes elsewhere are ignored
+        self.tracked_tables = set()
+        self.tenant_evictions = 0
+
+    def _bucket(self, organization_id) -> _TenantBucket:
+        bucket = self._tenants.get(organization_id)
+        if bucket is None:
+            bucket = self._tenants[organization_id] = _TenantBucket()
+            if len(self._tenants) > self.max_tenants:
+                self._tenants.popitem(last=False)
+                self.tenant_evictions += 1
+        else:
+            self._tenants.move_to_end(organization_id)
+        return bucket
+
+    def get_or_load(
+        self,
+        organization_id,
+        shape: str,
+        params: Hashable,
+        tables: Iterable[str],
+        loader: Callable,
+        store_after_invalidation: float = 0.0
+    ):
+        """
+        Cached value for the key, or loader() on a miss. Cached values are
+        shared between requests and must not be mutated by callers.
+
+        `store_after_invalidation` skips storing results loaded within that
+        many seconds of the tenant's last invalidation; pass the replica's
+        allowed lag when reading from a replica that may not have the write yet.
+        """
+        key = (shape, params)
+        tables = frozenset(tables)
+        now = time.monotonic()
+        with self._lock:
+            # Registered before loading so a write committed mid-load is seen
+            self.tracked_tables |= tables
+            bucket = self._bucket(organization_id)
+            entry = bucket.entries.get(key)
+            if entry is not None and entry[0] > now:
+                bucket.entries.move_to_end(key)
+                bucket.stats.hits += 1
+                return entry[2]
+            if entry is not None:
+                del bucket.entries[key]
+            bucket.stats.misses += 1
+            generation = bucket.generation
+
+        value = loader()
+
+        now = time.monotonic()
+        with self._lock:
+            if self._tenants.get(organization_id) is not bucket or bucket.generation != generation:
+                # Invalidated (or the tenant evicted) while loading
+                return value
+            self._tenants.move_to_end(organization_id)
+            if now - bucket.invalidated_at < store_after_invalidation:
+                return value
+            bucket.entries[key] = (now + self.ttl_seconds, tables, value)
+            bucket.entries.move_to_end(key)
+            while len(bucket.entries) > self.max_entries_per_tenant:
+                bucket.entries.popitem(last=False)
+                bucket.stats.evictions += 1
+        return value
+
+    def invalidate(self, organization_id, tables: Iterable[str]):
+        """Drop one tenant's entries that read any of `tables`"""
+        tables = set(tables)
+        with self._lock:
+            bucket = self._tenants.get(organization_id)
+            if bucket is None:
+                return
+            self._drop(bucket, tables)
+
+    def invalidate_tables(self, tables: Iterable[str]):
+        """Drop every tenant's entries that read any of `tables` (global lookups, bulk UPDATEs)"""
+        tables = set(tables)
+        with self._lock:
+            for bucket in self._tenants.values():
+                self._drop(bucket, tables)
+
+    def _drop(self, bucket: _TenantBucket, tables: set):
+        bucket.generation += 1
+        bucket.invalidated_at = time.monotonic()
+        stale = [key for key, (_, entry_tables, _) in bucket.entries.items() if entry_tables & tables]
+        for key in stale:
+            del bucket.entries[key]
+        bucket.stats.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._tenants.clear()
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            tenants = {
+                str(organization_id): {"entries": len(bucket.entries), **bucket.stats.as_dict()}
+                for organization_id, bucket in self._tenants.items()
+            }
+        return {
+            "maxTenants": self.max_tenants,
+            "maxEntriesPerTenant": self.max_entries_per_tenant,
+            "ttlSeconds": self.ttl_seconds,
+            "tenantEvictions": self.tenant_evictions,
+            "entries": sum(t["entries"] for t in tenants.values()),
+            "tenants": tenants,
+        }
+
+
+tenant_cache = TenantQueryCache(
+    settings.TENANT_CACHE_MAX_TENANTS,
+    settings.TENANT_CACHE_MAX_ENTRIES_PER_TENANT,
+    settings.TENANT_CACHE_TTL_SECONDS
+)
+
+
+def replica_grace_seconds(db: Session) -> float:
+    """store_after_invalidation for a read through `db`: the allowed replica lag, or 0 on the primary"""
+    if read_engine is not None and db.get_bind() is read_engine:
+        return settings.READ_REPLICA_MAX_LAG_SECONDS
+    return 0.0
+
+
+# --------------------------------------------------
+# WRITE HOOKS
+# --------------------------------------------------
+# Rows without an organization_id column are resolved through their
+# event (bid counts in consumer event lists); any other tracked table
+# without one is a global lookup and invalidates every tenant.
+_PENDING_KEY = "tenant_cache_pending"
+_EVENT_SCOPED_TABLES = {"vendor_bids"}
+
+# Execution option for query.update()/delete(): the organization ids whose
+# cached reads the bulk write can change. An empty tuple means none (e.g. a
+# column no cached query reads); without the option every tenant is dropped.
+TENANT_ORGANIZATIONS = "tenant_cache_organizations"
+
+
+def _pending(session: Session) -> dict:
+    return session.info.setdefault(_PENDING_KEY, {"tenants": {}, "global": set()})
+
+
+def _organization_ids(obj) -> set:
+    """Current and, for an updated row, previous organization_id"""
+    state = inspect(obj)
+    ids = {obj.organization_id}
+    history = state.attrs.organization_id.history
+    ids.update(history.deleted or ())
+    ids.discard(None)
+    return ids
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tenant_writes(session, flush_context):
+    tracked = tenant_cache.tracked_tables
+    if not tracked:
+        return
+
+    pending = None
+    event_ids = {}  # event_id -> tables touched through it
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table not in tracked:
+            continue
+        if pending is None:
+            pending = _pending(session)
+
+        if hasattr(obj, "organization_id"):
+            for organization_id in _organization_ids(obj):
+                pending["tenants"].setdefault(organization_id, set()).add(table)
+        elif table in _EVENT_SCOPED_TABLES and getattr(obj, "event_id", None) is not None:
+            event_ids.setdefault(obj.event_id, set()).add(table)
+        else:
+            pending["global"].add(table)
+
+    if event_ids:
+        from app.models.event_m import Event
+
+        rows = session.connection().execute(
+            select(Event.id, Event.organization_id).where(Event.id.in_(event_ids.keys()))
+        )
+        for event_id, organization_id in rows:
+            pending["tenants"].setdefault(organization_id, set()).update(event_ids[event_id])
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_writes(orm_execute_state):
+    """
+    query.update()/delete() bypass the unit of work; drop the table for the
+    tenants declared with TENANT_ORGANIZATIONS, or for every tenant
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    table = mapper.local_table.name if mapper is not None else None
+    if table not in tenant_cache.tracked_tables:
+        return
+    organization_ids = orm_execute_state.execution_options.get(TENANT_ORGANIZATIONS)
+    pending = _pending(orm_execute_state.session)
+    if organization_ids is None:
+        pending["global"].add(table)
+        return
+    for organization_id in organization_ids:
+        pending["tenants"].setdefault(organization_id, set()).add(table)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_tenant_invalidations(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    for organization_id, tables in pending["tenants"].items():
+        tenant_cache.invalidate(organization_id, tables)
+    if pending["global"]:
+        tenant_cache.invalidate_tables(pending["global"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_tenant_invalidations(session):
+    session.info.pop(_PENDING_KEY, None)
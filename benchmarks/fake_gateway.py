@@ -0,0 +1,163 @@
+"""
+Local stand-in for the Razorpay orders API, for tests and load runs.
+
+    python -m benchmarks.fake_gateway [--port 9010] [--latency-ms 20]
+        [--error-rate 0.05] [--hang-rate 0.01] [--hang-seconds 15]
+        [--honor-idempotency-key]
+
+Point the app at it with RAZORPAY_BASE_URL=http://127.0.0.1:9010.
+Implements POST /v1/orders, GET /v1/orders (filtered by receipt) and
+GET /v1/orders/<id>. Like Razorpay's orders API it ignores the
+Idempotency-Key header unless --honor-idempotency-key is given, so
+duplicate orders show up when a client retries blindly. Faults are
+injected at random: 500s, and hangs longer than the client's read
+timeout. A hang still creates the order, like a response lost on the
+way back.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeGatewayState:
+
+    def __init__(self, latency_ms: float, error_rate: float, hang_rate: float, hang_seconds: float,
+                 honor_idempotency_key: bool = False):
+        self.honor_idempotency_key = honor_idempotency_key
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.lock = threading.Lock()
+        self.orders = {}            # id -> order
+        self.by_idempotency_key = {}
+        self.requests = 0
+
+    def create_order(self, body: dict, idempotency_key: str):
+        if not self.honor_idempotency_key:
+            idempotency_key = None
+        with self.lock:
+            if idempotency_key and idempotency_key in self.by_idempotency_key:
+                return self.orders[self.by_idempotency_key[idempotency_key]]
+            order = {
+                "id": f"order_{uuid.uuid4().hex[:14]}",
+                "entity": "order",
+                "amount": body.get("amount"),
+                "amount_paid": 0,
+                "amount_due": body.get("amount"),
+                "currency": body.get("currency", "INR"),
+                "receipt": body.get("receipt"),
+                "status": "created",
+                "attempts": 0,
+                "notes": body.get("notes", {}),
+                "created_at": int(time.time())
+            }
+            self.orders[order["id"]] = order
+            if idempotency_key:
+                self.by_idempotency_key[idempotency_key] = order["id"]
+            return order
+
+
+def make_handler(state: FakeGatewayState):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, payload: dict):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _fault(self) -> bool:
+            """Simulated latency and 500s; True if the request was answered with an error"""
+            with state.lock:
+                state.requests += 1
+            time.sleep(state.latency_ms / 1000.0)
+            if random.random() < state.error_rate:
+                self._send(500, {"error": {"code": "SERVER_ERROR", "description": "Injected failure"}})
+                return True
+            return False
+
+        def do_POST(self):
+            if urlparse(self.path).path != "/v1/orders":
+                self._send(404, {"error": {"code": "BAD_REQUEST_ERROR", "description": "Not found"}})
+                return
+            if self._fault():
+                return
+
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body.get("amount"), int) or body["amount"] < 100:
+                self._send(400, {"error": {"code": "BAD_REQUEST_ERROR", "description": "Order amount less than minimum amount allowed"}})
+                return
+
+            order = state.create_order(body, self.headers.get("Idempotency-Key"))
+            if random.random() < state.hang_rate:
+                # Order exists, but the client times out before seeing it
+                time.sleep(state.hang_seconds)
+            self._send(200, order)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if self._fault():
+                return
+
+            if url.path == "/v1/orders":
+                receipt = parse_qs(url.query).get("receipt", [None])[0]
+                with state.lock:
+                    items = [o for o in state.orders.values() if receipt is None or o["receipt"] == receipt]
+                self._send(200, {"entity": "collection", "count": len(items), "items": items})
+                return
+
+            if url.path.startswith("/v1/orders/"):
+                order = state.orders.get(url.path.rsplit("/", 1)[-1])
+                if order:
+                    self._send(200, order)
+                else:
+                    self._send(400, {"error": {"code": "BAD_REQUEST_ERROR", "description": "The id provided does not exist"}})
+                return
+
+            self._send(404, {"error": {"code": "BAD_REQUEST_ERROR", "description": "Not found"}})
+
+    return Handler
+
+
+def serve(port: int = 9010, latency_ms: float = 20, error_rate: float = 0.0,
+          hang_rate: float = 0.0, hang_seconds: float = 15.0,
+          honor_idempotency_key: bool = False, background: bool = False):
+    """Run the fake gateway; with background=True return (server, state) instead of blocking"""
+    state = FakeGatewayState(latency_ms, error_rate, hang_rate, hang_seconds, honor_idempotency_key)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.daemon_threads = True
+    if background:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server, state
+    print(f"Fake gateway on http://127.0.0.1:{server.server_address[1]}")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--port", type=int, default=9010)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--hang-seconds", type=float, default=15.0)
+    parser.add_argument("--honor-idempotency-key", action="store_true")
+    args = parser.parse_args()
+    serve(args.port, args.latency_ms, args.error_rate, args.hang_rate, args.hang_seconds,
+          args.honor_idempotency_key)
+
+
+if __name__ == "__main__":
+    main()
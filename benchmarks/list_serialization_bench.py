@@ -0,0 +1,77 @@
+"""
+Per-row cost of serializing large list responses.
+
+    python -m benchmarks.list_serialization_bench [rows]
+
+"before" mirrors the previous path: one pydantic model per row, then
+FastAPI's response_model validation/serialization and the stdlib JSON
+encoder. "after" is FastJSONResponse.from_rows: one TypeAdapter pass over
+the whole list, serialized by pydantic-core.
+"""
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.schemas.vendor_bid_schema import VendorMyBidSchema
+from app.utils.fast_json import FastJSONResponse
+
+
+def make_rows(n: int) -> List[dict]:
+    base = datetime(2026, 1, 1)
+    return [
+        {
+            "bidId": i,
+            "eventName": f"Event {i}",
+            "eventDate": (base + timedelta(days=i % 365)).strftime("%b %d, %Y"),
+            "totalAmount": 10000.0 + i,
+            "status": "submitted",
+            "submittedAt": (base + timedelta(minutes=i)).isoformat(),
+            "shortlisted": i % 7 == 0,
+            "shortlistedRank": (i % 3) + 1 if i % 7 == 0 else None,
+        }
+        for i in range(n)
+    ]
+
+
+def before(rows: List[dict], field) -> bytes:
+    models = [VendorMyBidSchema(**row) for row in rows]
+    content = asyncio.run(serialize_response(field=field, response_content=models))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def after(rows: List[dict]) -> bytes:
+    return FastJSONResponse.from_rows(VendorMyBidSchema, rows).body
+
+
+def timed(fn, *args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rows = make_rows(n)
+    field = create_response_field(name="response", type_=List[VendorMyBidSchema])
+
+    assert json.loads(before(rows, field)) == json.loads(after(rows))
+
+    t_before = timed(before, rows, field)
+    t_after = timed(after, rows)
+    print(f"rows: {n}")
+    print(f"before: {t_before * 1000:8.1f} ms total  {t_before / n * 1e6:6.2f} us/row")
+    print(f"after:  {t_after * 1000:8.1f} ms total  {t_after / n * 1e6:6.2f} us/row")
+    print(f"speedup: {t_before / t_after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
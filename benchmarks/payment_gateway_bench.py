@@ -0,0 +1,79 @@
+"""
+Order creation latency and duplicates against a faulty gateway.
+
+    python -m benchmarks.payment_gateway_bench [orders] [concurrency]
+
+Starts benchmarks.fake_gateway in-process with injected 500s and hangs.
+"before" is the plain razorpay.Client used previously: no timeout and no
+retry. "after" is RazorpayGateway: pooled session, timeouts, backoff and
+receipt-based reuse. Reports p50/p99, failed requests and orders that
+were created more than once for the same receipt.
+"""
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import razorpay
+
+from app.utils.payment_gateway import RazorpayGateway
+from benchmarks.fake_gateway import serve
+
+ERROR_RATE = 0.05
+HANG_RATE = 0.02
+HANG_SECONDS = 3.0
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(label, create, n, concurrency, state):
+    state.orders.clear()
+
+    def one(order_id):
+        start = time.perf_counter()
+        try:
+            create(order_id)
+            ok = True
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(one, range(1, n + 1)))
+
+    latencies = [t for t, _ in results]
+    failed = sum(1 for _, ok in results if not ok)
+    duplicates = sum(c - 1 for c in Counter(o["receipt"] for o in state.orders.values()).values() if c > 1)
+    print(
+        f"{label:7s} p50 {percentile(latencies, 50) * 1000:7.1f} ms  "
+        f"p99 {percentile(latencies, 99) * 1000:7.1f} ms  "
+        f"failed {failed:4d}  duplicate orders {duplicates:4d}"
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    server, state = serve(0, latency_ms=10, error_rate=ERROR_RATE, hang_rate=HANG_RATE,
+                          hang_seconds=HANG_SECONDS, background=True)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"orders: {n}  concurrency: {concurrency}  500s: {ERROR_RATE:.0%}  hangs: {HANG_RATE:.0%} x {HANG_SECONDS}s")
+
+    plain = razorpay.Client(auth=("key", "secret"), base_url=base_url)
+    run("before", lambda order_id: plain.order.create({
+        "amount": 10000, "currency": "INR", "receipt": RazorpayGateway.receipt_for(order_id)
+    }), n, concurrency, state)
+
+    gateway = RazorpayGateway("key", "secret", base_url=base_url, read_timeout=0.5,
+                              backoff_base=0.05, pool_size=concurrency)
+    run("after", lambda order_id: gateway.create_order(order_id, 10000, "INR"), n, concurrency, state)
+    print(f"after: {gateway.metrics()}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
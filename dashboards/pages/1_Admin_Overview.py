@@ -27,11 +27,12 @@ selected_range = api_range_map[time_filter]
 
 # Fetch Data
 with st.spinner("Loading analytics..."):
-    stats_resp = APIClient.get_admin_stats(selected_range)
-    event_analytics = APIClient.get_admin_event_analytics(selected_range)
-    revenue_trends = APIClient.get_admin_revenue_trends(selected_range)
-    category_revenue = APIClient.get_admin_revenue_by_category()
-    top_vendors = APIClient.get_admin_top_vendors()
+    bundle = APIClient.get_admin_bundle(selected_range) or {}
+    stats_resp = {'stats': bundle['stats']} if bundle.get('stats') else None
+    event_analytics = bundle.get('event_analytics', [])
+    revenue_trends = bundle.get('revenue_trends', [])
+    category_revenue = bundle.get('revenue_by_category', [])
+    top_vendors = bundle.get('top_vendors', [])
 
 # 1. STATS GRID (8 Cards - 4x2)
 if stats_resp and 'stats' in stats_resp:
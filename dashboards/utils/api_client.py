@@ -1,4 +1,8 @@
+import threading
+from collections import OrderedDict
+
 import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
 
 # In production, this would be managed via cookies or a proper Auth provider
@@ -6,6 +10,61 @@ import streamlit as st
 
 BASE_URL = "http://localhost:8000"
 
+# Seconds a panel response is reused across reruns before re-polling
+CACHE_TTL_SECONDS = 30
+
+# ETag entries kept for conditional GETs; least recently used go first
+ETAG_CACHE_MAX_ENTRIES = 256
+
+# One pooled, keep-alive session for every dashboard call
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# (path, token) -> (etag, body) in LRU order; shared by all Streamlit
+# sessions (each runs in its own thread), so bounded and locked
+_etag_cache = OrderedDict()
+_etag_lock = threading.Lock()
+
+
+def _etag_get(key):
+    with _etag_lock:
+        cached = _etag_cache.get(key)
+        if cached:
+            _etag_cache.move_to_end(key)
+        return cached
+
+
+def _etag_put(key, etag, data):
+    with _etag_lock:
+        _etag_cache[key] = (etag, data)
+        _etag_cache.move_to_end(key)
+        while len(_etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+            _etag_cache.popitem(last=False)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _fetch_json(path, token):
+    """
+    Conditional GET: resend the last ETag and reuse the cached body on 304.
+    Raises on failure so errors are never cached.
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    key = (path, token)
+    cached = _etag_get(key)
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    res = _session.get(f"{BASE_URL}{path}", headers=headers, timeout=10)
+    if res.status_code == 304 and cached:
+        return cached[1]
+    res.raise_for_status()
+
+    data = res.json()
+    if res.headers.get("ETag"):
+        _etag_put(key, res.headers["ETag"], data)
+    return data
+
 # Mock Tokens (Ideally, these should be fetched via a /login UI)
 # We will trust the user to have valid tokens in the 'tokens' dict for now 
 # or implement a simple login form.
@@ -23,89 +82,66 @@ class APIClient:
             return {"Authorization": f"Bearer {token}"}
         return {}
 
+    @staticmethod
+    def _get(path, default=None):
+        try:
+            return _fetch_json(path, APIClient.get_token())
+        except: return default
+
     # ------------------ ADMIN ------------------
+    @staticmethod
+    def get_admin_bundle(time_range="month"):
+        """Every Admin Overview panel in one round-trip"""
+        return APIClient._get(f"/api/admin/analytics/bundle?time_range={time_range}", None)
+
     @staticmethod
     def get_admin_stats(time_range="month"):
-        try:
-            # Requires Admin Token - not strictly enforced in this demo client unless configured
-            # Assuming Admin endpoints are public/protected for this phase
-            res = requests.get(f"{BASE_URL}/api/admin/analytics/stats?time_range={time_range}", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else None
-        except: return None
+        return APIClient._get(f"/api/admin/analytics/stats?time_range={time_range}", None)
 
     @staticmethod
     def get_admin_revenue_trends(time_range="month"):
-        try:
-            res = requests.get(f"{BASE_URL}/api/admin/analytics/revenue-trends?time_range={time_range}", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else []
-        except: return []
+        return APIClient._get(f"/api/admin/analytics/revenue-trends?time_range={time_range}", [])
         
     @staticmethod
     def get_admin_event_analytics(time_range="month"):
-        try:
-            res = requests.get(f"{BASE_URL}/api/admin/analytics/event-analytics?time_range={time_range}", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else []
-        except: return []
+        return APIClient._get(f"/api/admin/analytics/event-analytics?time_range={time_range}", [])
 
     @staticmethod
     def get_admin_revenue_by_category():
-        try:
-            res = requests.get(f"{BASE_URL}/api/admin/analytics/revenue-by-category", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else []
-        except: return []
+        return APIClient._get("/api/admin/analytics/revenue-by-category", [])
 
     @staticmethod
     def get_admin_top_vendors():
-        try:
-            res = requests.get(f"{BASE_URL}/api/admin/analytics/top-vendors", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else []
-        except: return []
+        return APIClient._get("/api/admin/analytics/top-vendors", [])
 
     # ------------------ VENDOR ------------------
     @staticmethod
     def get_vendor_stats(time_range="month"):
-        try:
-            res = requests.get(f"{BASE_URL}/api/vendor/analytics/stats?time_range={time_range}", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else None
-        except: return None
+        return APIClient._get(f"/api/vendor/analytics/stats?time_range={time_range}", None)
 
     @staticmethod
     def get_vendor_notifications():
-        try:
-            res = requests.get(f"{BASE_URL}/api/vendor/analytics/notifications", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else []
-        except: return []
+        return APIClient._get("/api/vendor/analytics/notifications", [])
 
     @staticmethod
     def get_vendor_charts(time_range="month"):
-        try:
-            res = requests.get(f"{BASE_URL}/api/vendor/analytics/charts?time_range={time_range}", headers=APIClient.get_headers())
-            if res.status_code == 200:
-                return res.json()
-            return {"revenue_trend": [], "bids_by_category": []}
-        except: return {"revenue_trend": [], "bids_by_category": []}
+        return APIClient._get(
+            f"/api/vendor/analytics/charts?time_range={time_range}",
+            {"revenue_trend": [], "bids_by_category": []}
+        )
 
     # ------------------ CONSUMER ------------------
     @staticmethod
     def get_consumer_favorites():
-        try:
-            res = requests.get(f"{BASE_URL}/api/consumer/dashboard/favorites", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else []
-        except: return []
+        return APIClient._get("/api/consumer/dashboard/favorites", [])
 
     @staticmethod
     def get_consumer_suggested():
-        try:
-            res = requests.get(f"{BASE_URL}/api/consumer/dashboard/suggested", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else []
-        except: return []
+        return APIClient._get("/api/consumer/dashboard/suggested", [])
 
     @staticmethod
     def get_consumer_history():
-        try:
-            res = requests.get(f"{BASE_URL}/api/consumer/dashboard/history", headers=APIClient.get_headers())
-            return res.json() if res.status_code == 200 else []
-        except: return []
+        return APIClient._get("/api/consumer/dashboard/history", [])
 
     @staticmethod
     def login_vendor(username, password):
@@ -116,7 +152,7 @@ class APIClient:
                 "username": username,
                 "password": password
             }
-            res = requests.post(f"{BASE_URL}/api/auth/vendor/token", data=payload) # Use form data or json depending on endpoint
+            res = _session.post(f"{BASE_URL}/api/auth/vendor/token", data=payload) # Use form data or json depending on endpoint
             if res.status_code == 200:
                 return res.json().get("access_token")
             return None
@@ -36,7 +36,7 @@ async def get_gravity_suggestions(connection_id: str):
     from app.services.schema_analyzer import schema_analyzer
     from app.services.agent_service import agent_service
     try:
-        schema = await schema_analyzer.analyze_schema(connection_id)
+        schema = await schema_analyzer.get_or_analyze(connection_id)
         schema_dict = schema.dict() if hasattr(schema, 'dict') else schema.model_dump()
         suggestions = await agent_service.get_gravity_suggestions(schema_dict)
         return {"suggestions": suggestions}
@@ -58,7 +58,7 @@ async def optimize_system(request: OptimizationRequest):
         
         if request.active and request.connection_id:
             from app.services.schema_analyzer import schema_analyzer
-            schema = await schema_analyzer.analyze_schema(request.connection_id)
+            schema = await schema_analyzer.get_or_analyze(request.connection_id)
             # Handle Pydantic v1/v2 compatibility
             schema_dict = schema.dict() if hasattr(schema, 'dict') else schema.model_dump()
             
@@ -72,11 +72,11 @@ async def optimize_system(request: OptimizationRequest):
             
             # Store clusters for graph coloring
             from app.services.cluster_store import cluster_store
-            cluster_store.set_clusters(request.connection_id, clusters, method_used)
+            await cluster_store.set_clusters(request.connection_id, clusters, method_used)
         else:
             # Clear clusters when disabling
             from app.services.cluster_store import cluster_store
-            cluster_store.clear_clusters(request.connection_id)
+            await cluster_store.clear_clusters(request.connection_id)
 
         return {
             "status": "success", 
@@ -1,6 +1,10 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.services.db_connector import db_connector
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from datetime import date, datetime, time
+from decimal import Decimal
+import json
 
 router = APIRouter()
 
@@ -31,3 +35,76 @@ async def get_sample_data(table_name: str, column_name: str, connection_id: str
     except Exception as e:
         print(f"Error fetching sample data: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _json_default(value):
+    """Encode driver types that json.dumps can't handle natively"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return str(value)
+
+
+def _quote_table(db_type: str, table_name: str) -> str:
+    if db_type == 'mysql':
+        return ".".join(f"`{part.replace('`', '``')}`" for part in table_name.split("."))
+    return ".".join(f'"{part.replace(chr(34), chr(34) * 2)}"' for part in table_name.split("."))
+
+
+@router.get("/data/stream/{connection_id}/{table_name}")
+async def stream_table(connection_id: str, table_name: str, limit: Optional[int] = None, batch_size: int = 1000):
+    """
+    Stream a table as NDJSON without loading it into memory.
+    First line: {"table", "columns"}; then one JSON array per row in
+    column order; last line: {"done": true, "count": n}.
+    """
+    try:
+        connection = db_connector.get_connection(connection_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if connection['type'] in ['mongodb', 'mongo']:
+        raise HTTPException(status_code=400, detail="Streaming is only available for SQL connections")
+
+    # Only tables from the analysed schema (analysing it now if need be);
+    # the name is interpolated into SQL, so there is no unchecked path
+    from app.services.schema_analyzer import schema_analyzer
+    try:
+        schema = await schema_analyzer.get_or_analyze(connection_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if table_name not in {t.name for t in schema.tables}:
+        raise HTTPException(status_code=404, detail=f"Relation '{table_name}' not found in active schema snapshot.")
+
+    sql = f"SELECT * FROM {_quote_table(connection['type'], table_name)}"
+    if limit is not None:
+        sql += f" LIMIT {max(0, int(limit))}"
+    batch_size = max(1, min(batch_size, 10000))
+
+    # Pull the first batch here so a bad query is still a proper HTTP error
+    batches = db_connector.stream_query(connection_id, sql, batch_size=batch_size)
+    try:
+        columns, first_rows = await batches.__anext__()
+    except Exception as e:
+        await batches.aclose()
+        print(f"Error streaming {table_name}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def ndjson():
+        count = len(first_rows)
+        try:
+            lines = [json.dumps({"table": table_name, "columns": columns})]
+            lines.extend(json.dumps(row, default=_json_default) for row in first_rows)
+            yield "\n".join(lines) + "\n"
+            async for _, rows in batches:
+                count += len(rows)
+                yield "\n".join(json.dumps(row, default=_json_default) for row in rows) + "\n"
+            yield json.dumps({"done": True, "count": count}) + "\n"
+        finally:
+            # Client went away mid-stream: release the cursor and connection
+            await batches.aclose()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
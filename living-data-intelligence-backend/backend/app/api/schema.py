@@ -5,10 +5,10 @@ from app.services.schema_analyzer import schema_analyzer
 router = APIRouter()
 
 @router.get("/schema/{connection_id}", response_model=Schema)
-async def get_schema(connection_id: str):
-    """Get database schema analysis"""
+async def get_schema(connection_id: str, refresh: bool = False):
+    """Get database schema analysis (cached until the schema changes; refresh=true forces a re-scan)"""
     try:
-        schema = await schema_analyzer.analyze_schema(connection_id)
+        schema = await schema_analyzer.get_or_analyze(connection_id, force=refresh)
         return schema
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
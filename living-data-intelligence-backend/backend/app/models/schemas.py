@@ -9,6 +9,7 @@ class DatabaseConfig(BaseModel):
     database: str
     username: str
     password: str
+    driver: Optional[str] = "threaded"  # "threaded" (psycopg2/pymysql) or "async" (asyncpg/aiomysql)
 
 class ConnectionResponse(BaseModel):
     success: bool
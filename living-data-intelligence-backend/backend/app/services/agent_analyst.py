@@ -10,7 +10,7 @@ class AgentAnalyst:
         query = query.lower()
         
         # 1. Fetch current status context
-        schema = await schema_analyzer.analyze_schema(connection_id)
+        schema = await schema_analyzer.get_or_analyze(connection_id)
         # Mock metrics for context if real-time not available in this scope
         metrics = {"transaction_rate": 850, "fraud_alerts": 1, "failed_transactions": 5}
         health = graph_intelligence.analyze_graph_health(connection_id, metrics)
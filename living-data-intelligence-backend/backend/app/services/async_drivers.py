@@ -0,0 +1,217 @@
+"""
+Native async driver backends for DatabaseConnector.
+
+Selected per connection with `"driver": "async"` in the connect payload.
+Both backends keep the connector's query() contract: `%s` placeholders
+with a params tuple in, a list of dicts out. asyncpg and aiomysql are
+optional; a connection only needs the one it asks for.
+"""
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, List
+
+# Prepared statements kept per pooled Postgres connection (asyncpg LRU)
+STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 256))
+
+_MULTI_COMMAND_ERROR = "cannot insert multiple commands into a prepared statement"
+
+
+_PLACEHOLDER = re.compile(r"%(%|s)")
+
+
+@lru_cache(maxsize=1024)
+def to_numbered_params(sql: str) -> str:
+    """
+    Rewrite psycopg2-style `%s` placeholders as asyncpg's `$1, $2, ...`
+    and `%%` as `%`. Like psycopg2 this does not look inside string
+    literals, so the same SQL text means the same thing on both drivers.
+    """
+    counter = iter(range(1, sql.count("%s") + 1))
+    return _PLACEHOLDER.sub(lambda m: "%" if m.group(1) == "%" else f"${next(counter)}", sql)
+
+
+def _encode_json(value) -> str:
+    # Callers pass json.dumps() strings, as psycopg2 expects
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+async def _init_asyncpg_connection(conn):
+    """Decode json/jsonb to Python objects like psycopg2 does"""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name, schema="pg_catalog", encoder=_encode_json, decoder=json.loads
+        )
+
+
+class AsyncpgBackend:
+    """
+    asyncpg pool for Postgres/Neon. Parameterised queries go through
+    asyncpg's per-connection prepared statement cache, so a repeated
+    catalog or metrics query is parsed and planned once per connection.
+    """
+
+    def __init__(self):
+        self.pool = None
+        self.queries = 0
+        self.prepared_queries = 0
+
+    async def connect(self, config: Dict[str, Any], max_size: int):
+        import asyncpg
+
+        ssl = 'require' if config.get('db_type', '').lower() in ['neon', 'neon_db'] else 'prefer'
+        self.pool = await asyncpg.create_pool(
+            host=config['host'],
+            port=config.get('port', 5432),
+            database=config['database'],
+            user=config['username'],
+            password=config['password'],
+            ssl=ssl,
+            min_size=1,
+            max_size=max_size,
+            timeout=60,
+            statement_cache_size=STATEMENT_CACHE_SIZE,
+            init=_init_asyncpg_connection
+        )
+        print(f"✅ asyncpg pool created (statement cache {STATEMENT_CACHE_SIZE})")
+        return self
+
+    async def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        self.queries += 1
+        async with self.pool.acquire() as conn:
+            if params:
+                self.prepared_queries += 1
+                rows = await conn.fetch(to_numbered_params(sql), *params)
+                return [dict(row) for row in rows]
+
+            try:
+                rows = await conn.fetch(sql)
+            except Exception as e:
+                # Scripts (e.g. CREATE SCHEMA ...; CREATE TABLE ...) can't be
+                # prepared; run them over the simple query protocol instead
+                if _MULTI_COMMAND_ERROR not in str(e):
+                    raise
+                await conn.execute(sql)
+                return []
+            return [dict(row) for row in rows]
+
+    async def stream(self, sql: str, params: tuple, batch_size: int):
+        """(columns, rows) batches from a server-side cursor; see DatabaseConnector.stream_query"""
+        async with self.pool.acquire() as conn:
+            # Cursors only live inside a transaction; leaving early rolls it back
+            async with conn.transaction(readonly=True):
+                statement = await conn.prepare(to_numbered_params(sql) if params else sql)
+                columns = [attribute.name for attribute in statement.get_attributes()]
+                cursor = await statement.cursor(*params)
+                sent = False
+                while True:
+                    rows = await cursor.fetch(batch_size)
+                    if not rows:
+                        break
+                    sent = True
+                    yield columns, [tuple(row) for row in rows]
+                if not sent:
+                    yield columns, []
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "driver": "asyncpg",
+            "poolSize": self.pool.get_size() if self.pool else 0,
+            "idle": self.pool.get_idle_size() if self.pool else 0,
+            "statementCacheSize": STATEMENT_CACHE_SIZE,
+            "queries": self.queries,
+            "preparedQueries": self.prepared_queries,
+        }
+
+
+class AiomysqlBackend:
+    """
+    aiomysql pool for MySQL. aiomysql interpolates parameters client side
+    (like pymysql), so there is no server-side statement cache to reuse.
+    """
+
+    def __init__(self):
+        self.pool = None
+        self.queries = 0
+
+    async def connect(self, config: Dict[str, Any], max_size: int):
+        import aiomysql
+
+        self._dict_cursor = aiomysql.DictCursor
+        self._ss_cursor = aiomysql.SSCursor
+        self.pool = await aiomysql.create_pool(
+            host=config['host'],
+            port=config.get('port', 3306),
+            db=config['database'],
+            user=config['username'],
+            password=config['password'],
+            charset='utf8mb4',
+            autocommit=True,
+            connect_timeout=10,
+            minsize=1,
+            maxsize=max_size,
+            pool_recycle=3600
+        )
+        print(f"✅ aiomysql pool created")
+        return self
+
+    async def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        self.queries += 1
+        async with self.pool.acquire() as conn:
+            async with conn.cursor(self._dict_cursor) as cursor:
+                # If no params, execute directly to avoid % formatting issues
+                await cursor.execute(sql, params or None)
+                rows = await cursor.fetchall()
+                return list(rows) if rows else []
+
+    async def stream(self, sql: str, params: tuple, batch_size: int):
+        """(columns, rows) batches from an unbuffered cursor; see DatabaseConnector.stream_query"""
+        async with self.pool.acquire() as conn:
+            cursor = await conn.cursor(self._ss_cursor)
+            complete = False
+            try:
+                await cursor.execute(sql, params or None)
+                columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                sent = False
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    sent = True
+                    yield columns, list(rows)
+                if not sent:
+                    yield columns, []
+                complete = True
+            finally:
+                if complete:
+                    await cursor.close()
+                else:
+                    # Draining the rest of an unbuffered result could take a while; drop the connection
+                    conn.close()
+
+    async def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "driver": "aiomysql",
+            "poolSize": self.pool.size if self.pool else 0,
+            "idle": self.pool.freesize if self.pool else 0,
+            "queries": self.queries,
+        }
+
+
+def create_async_backend(db_type: str):
+    if db_type in ['postgresql', 'postgres', 'neon', 'neon_db']:
+        return AsyncpgBackend()
+    if db_type == 'mysql':
+        return AiomysqlBackend()
+    raise ValueError(f"Async driver not supported for {db_type}")
+
@@ -1,6 +1,9 @@
 """
 Cluster Store - Stores active cluster assignments
 """
+import asyncio
+
+from app.services.state_cache import state_cache
 
 class ClusterStore:
     """Simple in-memory store for cluster assignments"""
@@ -9,10 +12,15 @@ class ClusterStore:
         self.clusters = {}  # connection_id -> {table_name: cluster_name}
         self.methods = {}   # connection_id -> 'heuristic' or 'networkx'
     
-    def set_clusters(self, connection_id: str, clusters: dict, method: str = 'heuristic'):
-        """Store cluster assignments for a connection"""
+    async def set_clusters(self, connection_id: str, clusters: dict, method: str = 'heuristic'):
+        """Store cluster assignments for a connection (the disk write runs off the event loop)"""
         self.clusters[connection_id] = clusters
         self.methods[connection_id] = method
+        from app.services.schema_analyzer import schema_analyzer
+        await state_cache.aput(
+            "clusters", state_cache.scope(connection_id), schema_analyzer.fingerprints.get(connection_id),
+            {"clusters": clusters, "method": method}
+        )
         print(f"📦 Stored {len(clusters)} cluster assignments for {connection_id} ({method} mode)")
         print(f"   Sample clusters: {dict(list(clusters.items())[:3])}")
     
@@ -30,13 +38,21 @@ class ClusterStore:
         """Get clustering method used"""
         return self.methods.get(connection_id, 'heuristic')
     
-    def clear_clusters(self, connection_id: str):
+    async def clear_clusters(self, connection_id: str):
         """Clear cluster assignments for a connection"""
         if connection_id in self.clusters:
             del self.clusters[connection_id]
         if connection_id in self.methods:
             del self.methods[connection_id]
+        await asyncio.to_thread(state_cache.delete, "clusters", state_cache.scope(connection_id))
         print(f"🗑️ Cleared cluster assignments for {connection_id}")
 
+    def warm_from_disk(self, connection_id: str, scope: str, fingerprint: str):
+        """Restore assignments stored by an earlier process for the same database"""
+        stored = state_cache.get("clusters", scope, fingerprint)
+        if stored is not None:
+            self.clusters[connection_id] = stored["clusters"]
+            self.methods[connection_id] = stored["method"]
+
 # Global instance
 cluster_store = ClusterStore()
@@ -0,0 +1,109 @@
+"""
+Columnar query results for the analytics services.
+
+Rows come off the cursor as tuples (see DatabaseConnector.stream_query)
+and are transposed straight into one NumPy array per column, so no
+per-row dict is built on the analytics path. Integer columns without
+NULLs become int64, other numeric columns float64 with NaN for NULL,
+and everything else stays an object array. The arrays are for features
+only; record() returns the values exactly as the driver produced them.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import numpy as np
+
+_NUMERIC = (int, float, Decimal, bool, np.integer, np.floating)
+
+
+def to_numpy_column(values: List[Any]) -> np.ndarray:
+    """int64 for NULL-free integer columns, float64 if every non-NULL value is numeric, else object"""
+    if values and all(type(v) is int for v in values):
+        try:
+            return np.fromiter(values, dtype=np.int64, count=len(values))
+        except OverflowError:
+            pass
+    if all(v is None or isinstance(v, _NUMERIC) for v in values):
+        return np.fromiter(
+            (np.nan if v is None else float(v) for v in values), dtype=np.float64, count=len(values)
+        )
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        # Element-wise so list/dict values (json columns) are not broadcast
+        column[i] = value
+    return column
+
+
+def encode_feature(column: np.ndarray) -> np.ndarray:
+    """
+    One numeric feature per column for PCA/K-Means: numbers as-is (NULL
+    -> 0), dates as epoch seconds, anything else as sorted category codes
+    (NULL -> -1), matching the old pandas category encoding.
+    """
+    if column.dtype != object:
+        return np.nan_to_num(column.astype(np.float64, copy=False), nan=0.0)
+
+    present = [v for v in column if v is not None]
+    if present and all(isinstance(v, (datetime, date)) for v in present):
+        return np.fromiter(
+            (
+                0.0 if v is None
+                else (v if isinstance(v, datetime) else datetime(v.year, v.month, v.day)).timestamp()
+                for v in column
+            ),
+            dtype=np.float64,
+            count=len(column)
+        )
+
+    keys = np.array(["" if v is None else str(v) for v in column], dtype=object)
+    _, codes = np.unique(keys, return_inverse=True)
+    codes = codes.astype(np.float64)
+    codes[np.fromiter((v is None for v in column), dtype=bool, count=len(column))] = -1
+    return codes
+
+
+class ColumnarResult:
+    """A query result as {column: ndarray}, in select order, plus the raw column lists"""
+
+    def __init__(self, columns: List[str], arrays: Dict[str, np.ndarray], num_rows: int,
+                 values: Dict[str, List[Any]] = None):
+        self.columns = columns
+        self.arrays = arrays
+        self.num_rows = num_rows
+        # Driver values per column; the arrays turn bools and nullable ints into floats
+        self.values = values
+
+    @classmethod
+    def from_column_lists(cls, columns: List[str], values: List[List[Any]]) -> "ColumnarResult":
+        arrays = {name: to_numpy_column(column) for name, column in zip(columns, values)}
+        return cls(columns, arrays, len(values[0]) if values else 0, dict(zip(columns, values)))
+
+    def feature_matrix(self, columns: List[str] = None) -> np.ndarray:
+        """(rows x columns) float matrix of encoded features"""
+        columns = columns or self.columns
+        if not columns or not self.num_rows:
+            return np.empty((self.num_rows, 0))
+        return np.column_stack([encode_feature(self.arrays[c]) for c in columns])
+
+    def to_arrow(self):
+        """pyarrow.RecordBatch of the same columns (pyarrow is optional)"""
+        import pyarrow as pa
+
+        return pa.RecordBatch.from_arrays(
+            [pa.array(self.arrays[c], from_pandas=True) for c in self.columns], names=self.columns
+        )
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """One row as a plain dict with the original values, for API responses"""
+        if self.values is not None:
+            return {name: self.values[name][index] for name in self.columns}
+        record = {}
+        for name in self.columns:
+            value = self.arrays[name][index]
+            if isinstance(value, np.floating):
+                value = None if np.isnan(value) else float(value)
+            elif isinstance(value, np.integer):
+                value = int(value)
+            record[name] = value
+        return record
@@ -6,6 +6,7 @@ import asyncio
 from typing import Dict, List, Any, Optional
 from app.services.agent_service import agent_service
 from app.services.db_connector import db_connector
+from app.services.state_cache import state_cache
 
 class DataFlowAnalyzer:
     """Analyze data flow patterns using Agentic AI"""
@@ -26,7 +27,7 @@ class DataFlowAnalyzer:
         
         # Get schema for context
         from app.services.schema_analyzer import schema_analyzer
-        schema = await schema_analyzer.analyze_schema(connection_id)
+        schema = await schema_analyzer.get_or_analyze(connection_id)
         schema_dict = schema.dict() if hasattr(schema, 'dict') else schema.model_dump()
         
         # Find the target table
@@ -89,10 +90,19 @@ class DataFlowAnalyzer:
         
         # Cache the result
         self.flow_cache[cache_key] = flow_graph
+        await state_cache.aput(
+            "flow", state_cache.scope(connection_id), schema_analyzer.fingerprints.get(connection_id),
+            flow_graph, key=table_name
+        )
         print(f"✅ Flow analysis complete: {len(flow_graph['nodes'])} nodes, {len(flow_graph['edges'])} edges")
         
         return flow_graph
     
+    def warm_from_disk(self, connection_id: str, scope: str, fingerprint: str):
+        """Load flows stored by an earlier process for the same database"""
+        for table_name, flow_graph in state_cache.get_all("flow", scope, fingerprint).items():
+            self.flow_cache[f"{connection_id}:{table_name}"] = flow_graph
+    
     def _discover_fk_relationships(self, table: Dict, schema: Dict) -> List[Dict]:
         """Discover explicit FK relationships"""
         relationships = []
@@ -173,7 +183,7 @@ class DataFlowAnalyzer:
         """
         # Build a graph of all relationships
         from app.services.schema_analyzer import schema_analyzer
-        schema = await schema_analyzer.analyze_schema(connection_id)
+        schema = await schema_analyzer.get_or_analyze(connection_id)
         schema_dict = schema.dict() if hasattr(schema, 'dict') else schema.model_dump()
         
         # Simple BFS to find shortest path
@@ -2,14 +2,93 @@ import psycopg2
 from psycopg2 import pool
 import pymysql
 from pymongo import MongoClient
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from app.services.async_drivers import create_async_backend
+from app.services.columnar import ColumnarResult
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
 import asyncio
+import os
+import queue
+import threading
 import time
 
+# Max concurrent queries (and pooled connections) per connection_id
+POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 10))
+# Rows fetched per round trip by stream_query
+STREAM_BATCH_SIZE = int(os.getenv("DB_STREAM_BATCH_SIZE", 1000))
+
+
+class MySQLConnectionPool:
+    """
+    Thread-safe pymysql pool with the same getconn/putconn/closeall
+    interface as psycopg2's pools. Connections are opened lazily up to
+    maxconn and pinged (with reconnect) when checked out.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, **connect_kwargs):
+        self.maxconn = maxconn
+        self.connect_kwargs = connect_kwargs
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self.closed = False
+        for _ in range(minconn):
+            self._idle.put(self._open())
+
+    def _open(self):
+        connection = pymysql.connect(**self.connect_kwargs)
+        with connection.cursor() as cursor:
+            cursor.execute("SET NAMES 'utf8mb4'")
+        with self._lock:
+            self._opened += 1
+        return connection
+
+    def getconn(self):
+        if self.closed:
+            raise pool.PoolError("connection pool is closed")
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.maxconn
+            if not can_open:
+                # Callers are bounded by the connector's semaphore, so this only waits briefly
+                connection = self._idle.get(timeout=30)
+            else:
+                return self._open()
+        connection.ping(reconnect=True)
+        return connection
+
+    def putconn(self, connection, close: bool = False):
+        if close or self.closed:
+            self._discard(connection)
+            return
+        self._idle.put(connection)
+
+    def _discard(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._opened -= 1
+
+    def closeall(self):
+        self.closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
 class DatabaseConnector:
     def __init__(self):
         self.connections: Dict[str, Dict[str, Any]] = {}
-        self.locks: Dict[str, asyncio.Lock] = {}
+        # Per connection: a dedicated executor sized to its pool, and a
+        # semaphore so at most pool-size queries are in flight at once
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
         self.connection_counter = 0
 
     async def connect(self, config: Dict[str, Any]) -> Dict[str, str]:
@@ -17,8 +96,6 @@ class DatabaseConnector:
         start_time = time.perf_counter()
         self.connection_counter += 1
         connection_id = f"conn_{self.connection_counter}"
-        self.locks[connection_id] = asyncio.Lock()
-        
         
         db_type = config['db_type'].lower()
         host = config.get('host', '').lower()
@@ -50,10 +127,17 @@ class DatabaseConnector:
                     f.write(f"AUTO-FIX: Forced Neon DB type for SSL.\n")
                 print(f"🔒 Forced Neon SSL mode (sslmode=require) for {config['host']}")
         
+        # "async" uses asyncpg/aiomysql on the event loop; default is the threaded drivers
+        driver = (config.get('driver') or 'threaded').lower()
+        if driver == 'async' and db_type not in ['postgresql', 'postgres', 'neon', 'neon_db', 'mysql']:
+            driver = 'threaded'
+        
         try:
             # Enforce application-level timeout
             async def _connect_wrapper():
-                if db_type in ['postgresql', 'postgres', 'neon', 'neon_db']:
+                if driver == 'async':
+                    return await create_async_backend(db_type).connect(config, POOL_MAX_SIZE)
+                elif db_type in ['postgresql', 'postgres', 'neon', 'neon_db']:
                     return await asyncio.to_thread(self._connect_postgresql_sync, config)
                 elif db_type == 'mysql':
                     return await asyncio.to_thread(self._connect_mysql_sync, config)
@@ -66,9 +150,16 @@ class DatabaseConnector:
 
             client = await asyncio.wait_for(_connect_wrapper(), timeout=120.0)
             
+            if driver == 'threaded' and db_type != 'mock':
+                self.executors[connection_id] = ThreadPoolExecutor(
+                    max_workers=POOL_MAX_SIZE, thread_name_prefix=f"db-{connection_id}"
+                )
+                self.semaphores[connection_id] = asyncio.Semaphore(POOL_MAX_SIZE)
+            
             self.connections[connection_id] = {
                 'id': connection_id,
                 'type': db_type,
+                'driver': driver,
                 'client': client,
                 'config': {
                     'host': config['host'],
@@ -78,14 +169,14 @@ class DatabaseConnector:
             }
             
             duration = time.perf_counter() - start_time
-            print(f"DONE: Connected to {db_type} database: {config['database']} (in {duration:.3f}s)")
+            print(f"DONE: Connected to {db_type} database: {config['database']} via {driver} driver (in {duration:.3f}s)")
             
             # CRITICAL: Background the schema analysis AFTER storing connection but BEFORE returning
             # This ensures the API responds immediately
             async def _background_schema_analysis():
                 try:
                     from app.services.schema_analyzer import schema_analyzer
-                    await schema_analyzer.analyze_schema(connection_id)
+                    await schema_analyzer.get_or_analyze(connection_id)
                 except Exception as e:
                     print(f"⚠️ Background schema analysis failed for {connection_id}: {e}")
             
@@ -105,8 +196,9 @@ class DatabaseConnector:
 
     def _connect_postgresql_sync(self, config: Dict[str, Any]):
         """Connect to PostgreSQL"""
-        connection_pool = psycopg2.pool.SimpleConnectionPool(
-            1, 10,
+        # Threaded pool: queries for one connection run on several executor threads
+        connection_pool = psycopg2.pool.ThreadedConnectionPool(
+            1, POOL_MAX_SIZE,
             host=config['host'],
             port=config.get('port', 5432),
             database=config['database'],
@@ -124,24 +216,22 @@ class DatabaseConnector:
 
     def _connect_mysql_sync(self, config: Dict[str, Any]):
         """Connect to MySQL"""
-        connection = pymysql.connect(
+        # Opening the first connection validates credentials and connectivity
+        connection_pool = MySQLConnectionPool(
+            1, POOL_MAX_SIZE,
             host=config['host'],
             port=config.get('port', 3306),
             database=config['database'],
             user=config['username'],
             password=config['password'],
             connect_timeout=10, # 10 second timeout
-            charset='utf8mb4'
+            charset='utf8mb4',
+            autocommit=True
         )
         
+        print(f"✅ MySQL connection pool created successfully")
         
-        # Test connection and force UTF-8
-        cursor = connection.cursor()
-        cursor.execute("SET NAMES 'utf8mb4'")
-        cursor.execute('SELECT NOW()')
-        cursor.close()
-        
-        return connection
+        return connection_pool
 
     def _connect_mongodb_sync(self, config: Dict[str, Any]):
         """Connect to MongoDB"""
@@ -163,6 +253,7 @@ class DatabaseConnector:
             {
                 'id': conn['id'],
                 'type': conn['type'],
+                'driver': conn.get('driver', 'threaded'),
                 'host': conn['config']['host'],
                 'database': conn['config']['database']
             }
@@ -178,11 +269,18 @@ class DatabaseConnector:
     async def query(self, connection_id: str, sql: str, params: tuple = ()):
         """Execute a query and return results with concurrency control"""
         start_time = time.perf_counter()
-        lock = self.locks.get(connection_id)
+        semaphore = self.semaphores.get(connection_id)
         try:
-            if lock:
-                async with lock:
-                    result = await asyncio.to_thread(self._query_sync, connection_id, sql, params)
+            connection = self.connections.get(connection_id)
+            if connection and connection.get('driver') == 'async':
+                # Native driver: no thread hop, the backend's pool bounds concurrency
+                result = await connection['client'].query(sql, params)
+            elif semaphore:
+                # Up to pool-size queries run in parallel on this connection's own threads
+                async with semaphore:
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        self.executors[connection_id], self._query_sync, connection_id, sql, params
+                    )
             else:
                 result = await asyncio.to_thread(self._query_sync, connection_id, sql, params)
             
@@ -197,6 +295,105 @@ class DatabaseConnector:
                 f.write(f"--- ERROR ---\nSQL: {sql}\nERROR: {str(e)}\n")
             raise
 
+    async def stream_query(
+        self, connection_id: str, sql: str, params: tuple = (), batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[Tuple[List[str], List[tuple]]]:
+        """
+        Run a query on a server-side cursor and yield (columns, rows) batches
+        of at most batch_size tuples. `columns` is the same list for every
+        batch; an empty result yields one empty batch so callers always get
+        the header. Holds one pooled connection until the iterator finishes
+        or is closed.
+        """
+        connection = self.get_connection(connection_id)
+        if connection.get('driver') == 'async':
+            async for batch in connection['client'].stream(sql, params, batch_size):
+                yield batch
+            return
+        
+        if connection['type'] == 'mock':
+            rows = self._get_mock_data(sql, params) or []
+            columns = list(rows[0].keys()) if rows else []
+            yield columns, [tuple(row[c] for c in columns) for row in rows]
+            return
+        
+        loop = asyncio.get_running_loop()
+        executor = self.executors[connection_id]
+        async with self.semaphores[connection_id]:
+            stream = await loop.run_in_executor(executor, self._open_stream_sync, connection, sql, params)
+            try:
+                sent = False
+                while True:
+                    rows = await loop.run_in_executor(executor, self._fetch_stream_sync, stream, batch_size)
+                    if not rows:
+                        break
+                    sent = True
+                    yield stream['columns'], rows
+                if not sent:
+                    yield stream['columns'], []
+                stream['complete'] = True
+            finally:
+                await loop.run_in_executor(executor, self._close_stream_sync, connection, stream)
+
+    async def fetch_columnar(self, connection_id: str, sql: str, params: tuple = ()) -> ColumnarResult:
+        """
+        Run a query and return it column-wise (one NumPy array per column)
+        for analytics code. Built from stream_query batches, so rows are
+        never turned into dicts; call .to_arrow() for a pyarrow RecordBatch.
+        """
+        columns: List[str] = []
+        values: List[List[Any]] = []
+        async for columns, rows in self.stream_query(connection_id, sql, params):
+            if not values:
+                values = [[] for _ in columns]
+            for column_values, batch_column in zip(values, zip(*rows)):
+                column_values.extend(batch_column)
+        return ColumnarResult.from_column_lists(columns, values)
+
+    def _open_stream_sync(self, connection: Dict[str, Any], sql: str, params: tuple) -> Dict[str, Any]:
+        """Check out a pooled connection and open a server-side cursor on it"""
+        pool_client = connection['client']
+        conn = pool_client.getconn()
+        try:
+            if connection['type'] == 'mysql':
+                # Unbuffered: rows stay on the server until fetched
+                cursor = conn.cursor(pymysql.cursors.SSCursor)
+            else:
+                # Named cursors only live inside a transaction
+                conn.set_session(autocommit=False)
+                cursor = conn.cursor(name=f"stream_{id(conn)}_{time.monotonic_ns()}")
+            if not params:
+                cursor.execute(sql)
+            else:
+                cursor.execute(sql, params)
+        except Exception:
+            pool_client.putconn(conn, close=True)
+            raise
+        return {'conn': conn, 'cursor': cursor, 'columns': [], 'complete': False}
+
+    def _fetch_stream_sync(self, stream: Dict[str, Any], batch_size: int) -> List[tuple]:
+        rows = stream['cursor'].fetchmany(batch_size)
+        if not stream['columns'] and stream['cursor'].description:
+            # psycopg2 named cursors only describe the result after the first FETCH
+            stream['columns'].extend(desc[0] for desc in stream['cursor'].description)
+        return rows
+
+    def _close_stream_sync(self, connection: Dict[str, Any], stream: Dict[str, Any]):
+        conn = stream['conn']
+        discard = False
+        try:
+            if connection['type'] == 'mysql':
+                # Closing an unfinished unbuffered cursor would read every remaining row
+                discard = not stream['complete']
+                if not discard:
+                    stream['cursor'].close()
+            else:
+                stream['cursor'].close()
+                conn.rollback()
+        except Exception:
+            discard = True
+        connection['client'].putconn(conn, close=discard)
+
     def _query_sync(self, connection_id: str, sql: str, params: tuple):
         """Synchronous query execution for use in thread pool"""
         connection = self.get_connection(connection_id)
@@ -205,6 +402,7 @@ class DatabaseConnector:
         try:
             if db_type in ['postgresql', 'postgres', 'neon', 'neon_db']:
                 conn = None
+                broken = False
                 try:
                     conn = connection['client'].getconn()
                     conn.set_session(autocommit=True)
@@ -222,20 +420,34 @@ class DatabaseConnector:
                         result = []
                     cursor.close()
                     return result
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    # Drop dead connections instead of handing them to the next query
+                    broken = True
+                    raise
                 finally:
                     if conn:
-                        connection['client'].putconn(conn)
+                        connection['client'].putconn(conn, close=broken)
                 
             elif db_type == 'mysql':
-                cursor = connection['client'].cursor(pymysql.cursors.DictCursor)
-                # If no params, execute directly to avoid % formatting issues
-                if not params:
-                    cursor.execute(sql)
-                else:
-                    cursor.execute(sql, params)
-                result = cursor.fetchall()
-                cursor.close()
-                return result
+                conn = None
+                broken = False
+                try:
+                    conn = connection['client'].getconn()
+                    cursor = conn.cursor(pymysql.cursors.DictCursor)
+                    # If no params, execute directly to avoid % formatting issues
+                    if not params:
+                        cursor.execute(sql)
+                    else:
+                        cursor.execute(sql, params)
+                    result = cursor.fetchall()
+                    cursor.close()
+                    return result
+                except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+                    broken = True
+                    raise
+                finally:
+                    if conn:
+                        connection['client'].putconn(conn, close=broken)
                 
             elif db_type == 'mock':
                 return self._get_mock_data(sql, params)
@@ -250,13 +462,17 @@ class DatabaseConnector:
         if connection_id in self.connections:
             connection = self.connections[connection_id]
             try:
-                if connection['type'] in ['postgresql', 'postgres']:
+                if connection.get('driver') == 'async':
+                    await connection['client'].close()
+                elif connection['type'] in ['postgresql', 'postgres', 'neon', 'neon_db', 'mysql']:
                     connection['client'].closeall()
-                elif connection['type'] == 'mysql':
-                    connection['client'].close()
                 elif connection['type'] in ['mongodb', 'mongo']:
                     connection['client'].close()
                 
+                executor = self.executors.pop(connection_id, None)
+                if executor:
+                    executor.shutdown(wait=False)
+                self.semaphores.pop(connection_id, None)
                 del self.connections[connection_id]
                 print(f"🔌 Closed connection: {connection_id}")
             except Exception as e:
@@ -3,10 +3,12 @@ Graph Generator - Creates 3D graph structure from database schema
 Enhanced with AI (Neural Core & RL) for intelligent layout and link prediction.
 """
 import math
-import random
 from typing import Dict, List
+
+import numpy as np
 from app.services.neural_core import neural_core
 from app.services.rl_optimizer import rl_optimizer
+from app.services.column_index import ColumnIndex
 
 class GraphGenerator:
     """Generate 3D graph from database schema with advanced visualization"""
@@ -40,36 +42,68 @@ class GraphGenerator:
     # Backward compatibility
     CLUSTER_COLORS = HEURISTIC_COLORS
 
-    def _calculate_statistical_position(self, table: dict, neural_gravity: float) -> tuple:
+    def _statistical_positions(self, tables: List[dict], gravities: np.ndarray) -> np.ndarray:
         """
-        Calculate deterministic 3D position based on statistical vectors.
+        Deterministic 3D positions (T x 3) from statistical vectors.
         X = Data Volume (Row Count)
         Y = Structural Complexity (Columns + FKs)
         Z = Neural Importance (AI Gravity)
         """
+        count = len(tables)
+        row_counts = np.fromiter((t.get('row_count', 0) for t in tables), dtype=np.float64, count=count)
+        col_counts = np.fromiter((len(t.get('columns', [])) for t in tables), dtype=np.float64, count=count)
+        fk_counts = np.fromiter((len(t.get('foreign_keys', [])) for t in tables), dtype=np.float64, count=count)
+
+        positions = np.empty((count, 3))
         # 1. X-Axis: Data Volume (Logarithmic)
-        row_count = table.get('row_count', 0)
-        # Log scale: 0 -> 0, 1M -> 6. Normalize to -600 to +600
-        log_rows = math.log10(max(row_count, 1))
-        # Center around 1000 rows (log=3). <1000 = Left, >1000 = Right
-        pos_x = (log_rows - 3.0) * 200 
-        pos_x = max(-800, min(800, pos_x)) # Clamp
+        # Log scale: 0 -> 0, 1M -> 6. Centered around 1000 rows (log=3): <1000 = Left, >1000 = Right
+        positions[:, 0] = np.clip((np.log10(np.maximum(row_counts, 1)) - 3.0) * 200, -800, 800)
+        # 2. Y-Axis: Complexity, centered around avg complexity of 10. <10 = Down, >10 = Up
+        positions[:, 1] = np.clip((col_counts + fk_counts * 2 - 10) * 40, -500, 500)
+        # 3. Z-Axis: Neural Gravity (AI Score)
+        # Gravity ranges 1.0 to 5.0. Standard = 1.0 (Back), High Value = 5.0 (Front)
+        positions[:, 2] = np.clip((gravities - 1.0) * 150, -200, 600)
+        return positions
 
-        # 2. Y-Axis: Complexity
-        col_count = len(table.get('columns', []))
-        fk_count = len(table.get('foreign_keys', []))
-        complexity = col_count + (fk_count * 2)
-        # Center around avg complexity of 10. <10 = Down, >10 = Up
-        pos_y = (complexity - 10) * 40
-        pos_y = max(-500, min(500, pos_y))
+    def _layout_targets(self, tables: List[dict], gravities: np.ndarray, cluster_assignments: Dict[str, str],
+                        cluster_positions: Dict[str, dict], rng: np.random.Generator) -> np.ndarray:
+        """
+        Target position (T x 3) for every table: a small circle around its
+        cluster's center when it has a cluster, statistical otherwise.
+        """
+        targets = self._statistical_positions(tables, gravities)
+        if not cluster_assignments:
+            return targets
 
-        # 3. Z-Axis: Neural Gravity (AI Score)
-        # Gravity ranges 1.0 to 5.0. 
-        # Standard = 1.0 (Back), High Value = 5.0 (Front)
-        pos_z = (neural_gravity - 1.0) * 150
-        pos_z = max(-200, min(600, pos_z))
+        # Cluster membership as integer codes (-1 = unclustered), in table order
+        cluster_ids = list(cluster_positions)
+        code_of = {cluster_id: code for code, cluster_id in enumerate(cluster_ids)}
+        codes = np.fromiter(
+            (code_of[cluster_assignments[t['name']]] if t['name'] in cluster_assignments else -1 for t in tables), dtype=np.int64, count=len(tables)
+        )
+        clustered = np.flatnonzero(codes >= 0)
+        if not len(clustered):
+            return targets
+        member_codes = codes[clustered]
+
+        # Local index = rank of the table among its cluster's members, in table order
+        order = np.argsort(member_codes, kind='stable')
+        sizes = np.bincount(member_codes, minlength=len(cluster_ids))
+        group_start = np.cumsum(sizes) - sizes
+        local_index = np.empty(len(clustered), dtype=np.int64)
+        local_index[order] = np.arange(len(clustered)) - group_start[member_codes[order]]
+        num_in_cluster = sizes[member_codes]
+
+        centers = np.array([[cluster_positions[c]['x'], cluster_positions[c]['y'], cluster_positions[c]['z']]
+                            for c in cluster_ids])[member_codes]
+        # Arrange tables in a small circle within the cluster
+        local_angle = (local_index / np.maximum(num_in_cluster, 1)) * 2 * math.pi
+        local_radius = 80 + (num_in_cluster * 5)  # Radius grows with cluster size
 
-        return (pos_x, pos_y, pos_z)
+        targets[clustered, 0] = centers[:, 0] + local_radius * np.cos(local_angle)
+        targets[clustered, 1] = centers[:, 1] + local_radius * np.sin(local_angle)
+        targets[clustered, 2] = centers[:, 2] + (rng.random(len(clustered)) - 0.5) * 30
+        return targets
 
     async def generate_graph(self, connection_id: str, cluster_assignments: Dict[str, str] = None, clustering_method: str = None) -> dict:
         """Generate 3D graph with Semantic Force Layout properties and cluster-aware positioning"""
@@ -80,7 +114,7 @@ class GraphGenerator:
             print(f"📍 Using cluster-based positioning ({clustering_method} mode)")
         
         # 1. Get Base Schema
-        schema_obj = await schema_analyzer.analyze_schema(connection_id)
+        schema_obj = await schema_analyzer.get_or_analyze(connection_id)
         schema = schema_obj.model_dump() if hasattr(schema_obj, 'model_dump') else schema_obj
         
         tables = schema.get('tables', [])
@@ -112,7 +146,8 @@ class GraphGenerator:
         cluster_positions = {}
         if cluster_assignments:
             # Get unique clusters
-            unique_clusters = list(set(cluster_assignments.values()))
+            # Sorted so the arrangement (and the cached layout) is the same in every process
+            unique_clusters = sorted(set(cluster_assignments.values()), key=str)
             num_clusters = len(unique_clusters)
             
             # Arrange clusters in a circle around Neural Core
@@ -130,38 +165,21 @@ class GraphGenerator:
         # 4. Process Tables with CLUSTER-AWARE or STATISTICAL LOGIC
         table_map = {t['name']: t for t in tables}
         
+        # Get neural gravity for all tables (needed for node metadata)
+        gravities = np.fromiter(
+            (neural_core.gravity_store.get(t['name'], 1.0) for t in tables), dtype=np.float64, count=num_tables
+        )
+        rng = np.random.default_rng()
+        targets = self._layout_targets(tables, gravities, cluster_assignments, cluster_positions, rng)
+        # Start slightly randomized around target to allow physics to settle
+        starts = targets + (rng.random(targets.shape) - 0.5) * 30
+        targets, starts, gravities = targets.tolist(), starts.tolist(), gravities.tolist()
+        
         for i, table in enumerate(tables):
             name = table['name']
-            
-            # Get neural gravity for all tables (needed for node metadata)
-            neural_gravity = neural_core.gravity_store.get(name, 1.0)
-            
-            # Determine positioning based on clustering
-            if cluster_assignments and name in cluster_assignments:
-                # CLUSTER-BASED POSITIONING
-                cluster_id = cluster_assignments[name]
-                cluster_center = cluster_positions.get(cluster_id, {'x': 0, 'y': 0, 'z': 0})
-                
-                # Count tables in this cluster for local positioning
-                cluster_tables = [t for t in tables if cluster_assignments.get(t['name']) == cluster_id]
-                local_index = cluster_tables.index(table)
-                num_in_cluster = len(cluster_tables)
-                
-                # Arrange tables in a small circle within the cluster
-                local_angle = (local_index / max(num_in_cluster, 1)) * 2 * math.pi
-                local_radius = 80 + (num_in_cluster * 5)  # Radius grows with cluster size
-                
-                target_x = cluster_center['x'] + local_radius * math.cos(local_angle)
-                target_y = cluster_center['y'] + local_radius * math.sin(local_angle)
-                target_z = cluster_center['z'] + (random.random() - 0.5) * 30
-            else:
-                # FALLBACK: Statistical positioning (original logic)
-                target_x, target_y, target_z = self._calculate_statistical_position(table, neural_gravity)
-            
-            # Start slightly randomized around target to allow physics to settle
-            x = target_x + (random.random() - 0.5) * 30
-            y = target_y + (random.random() - 0.5) * 30
-            z = target_z + (random.random() - 0.5) * 30
+            neural_gravity = gravities[i]
+            target_x, target_y, target_z = targets[i]
+            x, y, z = starts[i]
             
             node = self._build_node_dict(table, x, y, z, 'semantic')
             # Inject statistical targets for frontend physics
@@ -215,34 +233,40 @@ class GraphGenerator:
                     add_edge(t_name, ref, 'foreign_key', 0.95, f"FK: {fk.get('column')}")
 
         # B. Matching Columns (Medium)
-        for i in range(len(tables)):
-            for j in range(i + 1, len(tables)):
-                t1 = tables[i]
-                t2 = tables[j]
-                
-                cols1 = {c['name'] for c in t1.get('columns', []) if c['name'] not in ['id', 'created_at', 'updated_at']}
-                cols2 = {c['name'] for c in t2.get('columns', []) if c['name'] not in ['id', 'created_at', 'updated_at']}
-                
-                matches = cols1.intersection(cols2)
-                if matches:
-                    strength = min(0.3 + (len(matches) * 0.1), 0.7)
-                    add_edge(t1['name'], t2['name'], 'matching_col', strength, f"Shared: {list(matches)[:3]}")
+        for t1_name, t2_name, matches in ColumnIndex(tables).shared_name_pairs():
+            strength = min(0.3 + (len(matches) * 0.1), 0.7)
+            add_edge(t1_name, t2_name, 'matching_col', strength, f"Shared: {matches[:3]}")
 
         # C. AI Predictions (Variable)
         valid_targets = [n['id'] for n in nodes if n['id'] != 'hub']
-        for table in tables:
-            t_name = table['name']
-            predictions = await neural_core.predict_links(t_name, valid_targets)
-            for pred in predictions:
-                if pred['confidence'] > 0.6: 
-                    add_edge(t_name, pred['target_id'], 'ai_predicted', pred['confidence'], pred.get('reasoning'))
+        predictions = await neural_core.predict_all_links(
+            valid_targets, fingerprint=schema_analyzer.fingerprints.get(connection_id)
+        )
+        for pred in predictions:
+            add_edge(pred['source_id'], pred['target_id'], 'ai_predicted', pred['confidence'], pred.get('reasoning'))
+
+        # 5. Relax the seeds into a converged force layout (process pool, cached per fingerprint + clusters)
+        from app.services.layout_engine import layout_engine
+        layout = await layout_engine.layout(
+            connection_id, nodes, edges, schema_analyzer.fingerprints.get(connection_id), cluster_assignments
+        )
+        for node in nodes:
+            position = layout['positions'].get(node['id'])
+            if position is not None and not node.get('fixed'):
+                # Ready to render: the frontend's physics starts (and stays) at rest
+                node['x'], node['y'], node['z'] = position
+                node['target_x'], node['target_y'], node['target_z'] = position
 
-        return {'nodes': nodes, 'edges': edges}
+        return {
+            'nodes': nodes,
+            'edges': edges,
+            'layout': {k: layout[k] for k in ('mode', 'iterations', 'converged')}
+        }
 
     async def get_k_hop_lineage(self, connection_id: str, table_name: str, hops: int = 2) -> dict:
         """Trace data lineage up to K-hops using schema relationships"""
         from app.services.schema_analyzer import schema_analyzer
-        schema_obj = await schema_analyzer.analyze_schema(connection_id)
+        schema_obj = await schema_analyzer.get_or_analyze(connection_id)
         schema = schema_obj.model_dump() if hasattr(schema_obj, 'model_dump') else schema_obj
         tables = schema.get('tables', [])
         
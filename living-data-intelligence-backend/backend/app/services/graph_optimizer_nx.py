@@ -15,6 +15,8 @@ import community as community_louvain  # python-louvain
 import numpy as np
 from typing import Dict, List, Any
 
+from app.services.column_index import ColumnIndex
+
 
 class SchemaAnalyzer:
     """
@@ -55,13 +57,8 @@ class SchemaAnalyzer:
                     G.add_edge(table_name, target, weight=1.0)
         
         # Add edges for matching column names (weaker connections)
-        for i, t1 in enumerate(tables):
-            for t2 in tables[i+1:]:
-                cols1 = {c['name'] for c in t1.get('columns', []) if c['name'] not in ['id', 'created_at', 'updated_at']}
-                cols2 = {c['name'] for c in t2.get('columns', []) if c['name'] not in ['id', 'created_at', 'updated_at']}
-                matches = cols1.intersection(cols2)
-                if len(matches) >= 2:  # At least 2 matching columns
-                    G.add_edge(t1['name'], t2['name'], weight=0.3)
+        for t1_name, t2_name, _ in ColumnIndex(tables).shared_name_pairs(min_shared=2):  # At least 2 matching columns
+            G.add_edge(t1_name, t2_name, weight=0.3)
         
         # Compute clusters using Louvain community detection
         try:
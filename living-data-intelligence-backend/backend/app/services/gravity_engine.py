@@ -23,25 +23,16 @@ class GravityEngine:
         """
         print(f"🪐 GravityEngine: Calculating forces for {table}.{column}")
         
-        # 1. Fetch raw data
+        # 1. Fetch raw data column-wise (one array per column, no row dicts)
         query = f"SELECT * FROM {table} LIMIT {limit}"
-        records = await db_connector.query(connection_id, query)
+        result = await db_connector.fetch_columnar(connection_id, query)
         
-        if not records:
+        if not result.num_rows:
             return []
 
         # 2. Vectorize Data
-        # We need to turn the dict records into a feature matrix
-        import pandas as pd
-        df = pd.DataFrame(records)
-        
-        # Handle non-numeric data for PCA
-        # Convert categoricals to codes, fill NAs
-        df_encoded = df.copy()
-        for col in df_encoded.columns:
-            if df_encoded[col].dtype == 'object':
-                df_encoded[col] = df_encoded[col].astype('category').cat.codes
-            df_encoded[col] = df_encoded[col].fillna(0)
+        # Categoricals become category codes, dates epoch seconds, NULLs 0
+        features = result.feature_matrix()
             
         # 3. Statistical Analysis (PCA & K-Means)
         # Using sklearn if available, else fallback to numpy math
@@ -51,10 +42,10 @@ class GravityEngine:
             from sklearn.preprocessing import StandardScaler
             
             # Normalize
-            X = StandardScaler().fit_transform(df_encoded)
+            X = StandardScaler().fit_transform(features)
             
             # K-Means Clustering
-            kmeans = KMeans(n_clusters=min(5, len(df)), random_state=42, n_init=10)
+            kmeans = KMeans(n_clusters=min(5, result.num_rows), random_state=42, n_init=10)
             clusters = kmeans.fit_predict(X)
             
             # PCA for 3D coordinates
@@ -66,38 +57,39 @@ class GravityEngine:
             # We invert distance for "Gravity Score"
             distances = np.linalg.norm(X, axis=1)
             max_dist = np.max(distances) if np.max(distances) > 0 else 1
-            gravity_scores = [(1 - (d / max_dist)) * 100 for d in distances]
+            gravity_scores = (1 - distances / max_dist) * 100
+            orbital_radii = np.linalg.norm(coords, axis=1) * 50
             
             print(f"✅ Statistical Proof: PCA variance explained ratio: {pca.explained_variance_ratio_}")
 
         except ImportError:
             print("⚠️ sklearn not found, using simple heuristics")
             # Fallback logic would go here
-            return self._assign_default_gravity(records)
+            return self._assign_default_gravity(result)
         except Exception as e:
              print(f"⚠️ Statistical Analysis Error: {e}")
-             return self._assign_default_gravity(records)
+             return self._assign_default_gravity(result)
 
-        # 4. Enrich records
+        # 4. Enrich records (row dicts only for the response payload)
         enriched_records = []
-        for i, record in enumerate(records):
+        for i in range(result.num_rows):
             enriched_records.append({
                 "id": f"rec_{i}",
-                "data": record,
+                "data": result.record(i),
                 "gravity_score": float(gravity_scores[i]),
                 "cluster_group": int(clusters[i]),
-                "is_anomaly": gravity_scores[i] < 20, # Low gravity = outlier away from mean
+                "is_anomaly": bool(gravity_scores[i] < 20), # Low gravity = outlier away from mean
                 # Scaling PCA coords to visualization space (e.g. -200 to 200)
                 "pos_x": float(coords[i][0] * 50),
                 "pos_y": float(coords[i][1] * 50),
                 "pos_z": float(coords[i][2] * 50),
-                "orbital_radius": float(np.linalg.norm(coords[i]) * 50)
+                "orbital_radius": float(orbital_radii[i])
             })
             
         print(f"🪐 GravityEngine: Processed {len(enriched_records)} records with Statistical Proof.")
         return enriched_records
 
-    def _assign_default_gravity(self, records):
-        return [{**r, "gravity_score": 10, "orbital_radius": 150} for r in records]
+    def _assign_default_gravity(self, result):
+        return [{**result.record(i), "gravity_score": 10, "orbital_radius": 150} for i in range(result.num_rows)]
 
 gravity_engine = GravityEngine()
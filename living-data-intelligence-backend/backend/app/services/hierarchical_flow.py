@@ -21,7 +21,7 @@ class HierarchicalFlowService:
             
             # Get table schema
             from app.services.schema_analyzer import schema_analyzer
-            schema = await schema_analyzer.analyze_schema(connection_id)
+            schema = await schema_analyzer.get_or_analyze(connection_id)
             
             # Find the specific table
             table_info = next((t for t in schema.get('tables', []) if t['name'] == table_name), None)
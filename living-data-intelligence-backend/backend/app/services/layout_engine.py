@@ -0,0 +1,342 @@
+"""
+Layout Engine - Server-side force-directed 3D layout
+ForceAtlas2-style forces (degree-weighted repulsion, linear edge
+attraction, gravity, adaptive per-node speed) computed with NumPy in a
+process pool, so the browser receives converged coordinates instead of
+running the whole simulation for thousands of nodes itself.
+
+Each node is also pulled gently toward its seed position from
+GraphGenerator, so cluster circles and the statistical axes survive the
+relaxation. Layouts are cached per schema fingerprint and cluster
+assignment; when the schema changes, the previous layout of the same
+connection is the starting point and only a short relaxation runs.
+"""
+import asyncio
+import hashlib
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+LAYOUT_WORKERS = int(os.getenv("LAYOUT_WORKERS", 2))
+# Iteration caps for a layout from seeds and for one warm-started from a previous layout
+LAYOUT_MAX_ITERATIONS = int(os.getenv("LAYOUT_MAX_ITERATIONS", 300))
+LAYOUT_WARM_ITERATIONS = int(os.getenv("LAYOUT_WARM_ITERATIONS", 80))
+# Above this many nodes repulsion is approximated Barnes-Hut style (cell centroids)
+LAYOUT_BARNES_HUT_THRESHOLD = int(os.getenv("LAYOUT_BARNES_HUT_THRESHOLD", 1500))
+# Layouts kept in memory (schema fingerprint x cluster assignment)
+LAYOUT_CACHE_SIZE = int(os.getenv("LAYOUT_CACHE_SIZE", 32))
+
+# Force constants, in units where the seed layout has RMS radius 1
+REPULSION = 0.05
+GRAVITY = 0.05
+ANCHOR = 0.3
+# FA2 speed tolerance (higher = faster but more swinging)
+TOLERANCE = 1.0
+# Converged when the mean step is below this fraction of the layout radius
+CONVERGENCE_STEP = 2e-4
+_EXACT_CHUNK_PAIRS = 4_000_000
+
+
+def _group_pairs(sizes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """All (a, b), a < b, of positions within the same run of a grouped array"""
+    ends = np.repeat(np.cumsum(sizes), sizes)
+    after = ends - np.arange(int(sizes.sum())) - 1
+    first = np.repeat(np.arange(len(after)), after)
+    second = first + 1 + (np.arange(int(after.sum())) - np.repeat(np.cumsum(after) - after, after))
+    return first, second
+
+
+def _scatter_add(forces: np.ndarray, index: np.ndarray, values: np.ndarray):
+    """forces[index] += values with repeated indices (np.add.at, but via bincount which is much faster)"""
+    for k in range(forces.shape[1]):
+        forces[:, k] += np.bincount(index, weights=values[:, k], minlength=len(forces))
+
+
+def _repel_from(pos: np.ndarray, mass: np.ndarray, sources: np.ndarray, source_mass: np.ndarray,
+                softening: float, skip: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Sum over sources of m_i * m_j * (p_i - p_j) / d^2, written as
+    m_i * (p_i * sum_j w_ij - sum_j w_ij * p_j) with w_ij = m_j / d^2 so
+    the heavy part is two matrix products instead of an N x M x 3 tensor.
+    `skip[i]` names one source column to leave out for row i.
+    """
+    forces = np.empty_like(pos)
+    source_sq = np.einsum('ij,ij->i', sources, sources)
+    chunk = max(1, _EXACT_CHUNK_PAIRS // max(len(sources), 1))
+    for start in range(0, len(pos), chunk):
+        rows = pos[start:start + chunk]
+        dist2 = np.einsum('ij,ij->i', rows, rows)[:, None] + source_sq[None, :] - 2.0 * (rows @ sources.T)
+        np.maximum(dist2, 0.0, out=dist2)
+        weight = source_mass[None, :] / (dist2 + softening)
+        if skip is not None:
+            weight[np.arange(len(rows)), skip[start:start + chunk]] = 0.0
+        forces[start:start + chunk] = rows * weight.sum(axis=1)[:, None] - weight @ sources
+    return forces * mass[:, None]
+
+
+def _repulsion_exact(pos: np.ndarray, mass: np.ndarray, softening: float) -> np.ndarray:
+    """k * m_i * m_j / d between every pair (a node's pull on itself cancels out)"""
+    return _repel_from(pos, mass, pos, mass, softening)
+
+
+# Offsets to the cell itself and its 6 face neighbours
+_NEIGHBOURS = np.array([(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+                        if abs(dx) + abs(dy) + abs(dz) <= 1])
+
+
+def _repulsion_barnes_hut(pos: np.ndarray, mass: np.ndarray, softening: float) -> np.ndarray:
+    """
+    One-level Barnes-Hut: nodes are bucketed into a grid of cells. Cells
+    that aren't adjacent act through their total mass at their centroid;
+    nodes in the same or an adjacent cell repel exactly.
+    """
+    count = len(pos)
+    per_axis = int(np.clip(round((count / 16) ** (1 / 3)), 2, 16))
+    # Cell edges at per-axis quantiles, so dense clusters get small cells
+    edges = np.quantile(pos, np.linspace(0, 1, per_axis + 1)[1:-1], axis=0)
+    coords = np.stack([np.searchsorted(edges[:, k], pos[:, k], side='right') for k in range(3)], axis=1)
+    cell = (coords[:, 0] * per_axis + coords[:, 1]) * per_axis + coords[:, 2]
+
+    num_cells = per_axis ** 3
+    cell_mass = np.bincount(cell, weights=mass, minlength=num_cells)
+    cell_count = np.bincount(cell, minlength=num_cells)
+    centroids = np.stack([np.bincount(cell, weights=mass * pos[:, k], minlength=num_cells) for k in range(3)], axis=1)
+    occupied = np.flatnonzero(cell_count)
+    centroids[occupied] /= cell_mass[occupied, None]
+
+    # Far field from every occupied cell, then take the near cells back out
+    forces = _repel_from(pos, mass, centroids[occupied], cell_mass[occupied], softening)
+    for offset in _NEIGHBOURS:
+        near = coords + offset
+        valid = np.all((near >= 0) & (near < per_axis), axis=1)
+        rows = np.flatnonzero(valid)
+        near_cell = (near[rows, 0] * per_axis + near[rows, 1]) * per_axis + near[rows, 2]
+        rows, near_cell = rows[cell_count[near_cell] > 0], near_cell[cell_count[near_cell] > 0]
+        diff = pos[rows] - centroids[near_cell]
+        dist2 = np.einsum('ij,ij->i', diff, diff) + softening
+        forces[rows] -= (mass[rows] * cell_mass[near_cell] / dist2)[:, None] * diff
+
+    # Near field: exact pairs within a cell and between face-adjacent cells
+    order = np.argsort(cell, kind='stable')
+    starts = np.cumsum(cell_count) - cell_count
+    cell_coords = np.stack(np.unravel_index(occupied, (per_axis,) * 3), axis=1)
+    pair_a, pair_b = [], []
+    sizes = cell_count[occupied]
+    first, second = _group_pairs(sizes)
+    pair_a.append(order[first])
+    pair_b.append(order[second])
+    # Each unordered pair of adjacent cells once: the lexicographically positive offsets
+    for offset in _NEIGHBOURS[len(_NEIGHBOURS) // 2 + 1:]:
+        near = cell_coords + offset
+        valid = np.all((near >= 0) & (near < per_axis), axis=1)
+        here = occupied[valid]
+        there = (near[valid, 0] * per_axis + near[valid, 1]) * per_axis + near[valid, 2]
+        keep = cell_count[there] > 0
+        here, there = here[keep], there[keep]
+        if not len(here):
+            continue
+        span_here, span_there = cell_count[here], cell_count[there]
+        per_pair = span_here * span_there
+        k = np.arange(int(per_pair.sum())) - np.repeat(np.cumsum(per_pair) - per_pair, per_pair)
+        width = np.repeat(span_there, per_pair)
+        pair_a.append(order[np.repeat(starts[here], per_pair) + k // width])
+        pair_b.append(order[np.repeat(starts[there], per_pair) + k % width])
+
+    a, b = np.concatenate(pair_a), np.concatenate(pair_b)
+    diff = pos[a] - pos[b]
+    dist2 = np.einsum('ij,ij->i', diff, diff) + softening
+    pair_forces = (mass[a] * mass[b] / dist2)[:, None] * diff
+    _scatter_add(forces, a, pair_forces)
+    _scatter_add(forces, b, -pair_forces)
+    return forces
+
+
+def force_layout(
+    seeds: np.ndarray,
+    edges: np.ndarray,
+    weights: np.ndarray,
+    fixed: np.ndarray,
+    initial: Optional[np.ndarray] = None,
+    max_iterations: int = LAYOUT_MAX_ITERATIONS,
+    barnes_hut_threshold: int = LAYOUT_BARNES_HUT_THRESHOLD,
+) -> Tuple[np.ndarray, int, bool]:
+    """
+    Relax a 3D layout. `seeds` (N x 3) are the semantic target positions,
+    `initial` the starting positions (seeds if None), `edges` (E x 2) node
+    index pairs with attraction `weights`, `fixed` a mask of pinned nodes.
+    Returns (positions, iterations run, converged). Runs in a worker
+    process, so it only takes and returns plain arrays.
+    """
+    count = len(seeds)
+    if count == 0:
+        return seeds.copy(), 0, True
+
+    # Work in units where the seed layout has RMS radius 1
+    scale = float(np.sqrt(np.mean(np.einsum('ij,ij->i', seeds, seeds)))) or 1.0
+    anchors = seeds / scale
+    pos = (seeds if initial is None else initial) / scale
+    movable = ~fixed
+
+    mass = np.bincount(edges.ravel(), minlength=count) + 1.0
+    repulsion = REPULSION / count
+    softening = 1e-4
+    repel = _repulsion_barnes_hut if count > barnes_hut_threshold else _repulsion_exact
+
+    previous = np.zeros_like(pos)
+    speed = 1.0
+    iterations, converged = 0, False
+    for iterations in range(1, max_iterations + 1):
+        forces = repel(pos, mass, softening) * repulsion
+        if len(edges):
+            # Linear attraction along edges (FA2), weighted by link strength
+            pull = (pos[edges[:, 1]] - pos[edges[:, 0]]) * weights[:, None]
+            _scatter_add(forces, edges[:, 0], pull)
+            _scatter_add(forces, edges[:, 1], -pull)
+        # Gravity toward the hub at the origin and a spring back to the seed
+        forces -= GRAVITY * mass[:, None] * pos
+        forces += ANCHOR * mass[:, None] * (anchors - pos)
+        forces[fixed] = 0.0
+
+        # FA2 adaptive speed: swinging nodes slow down, steadily moving ones speed up
+        swing = np.linalg.norm(forces - previous, axis=1)
+        traction = np.linalg.norm(forces + previous, axis=1) / 2
+        global_swing = float(mass @ swing)
+        global_traction = float(mass @ traction)
+        if global_swing > 0:
+            speed = min(TOLERANCE * global_traction / global_swing, 1.5 * speed)
+        node_speed = speed / (1.0 + speed * np.sqrt(swing))
+        # No node moves more than a tenth of the layout radius per step
+        node_speed = np.minimum(node_speed / mass, 0.1 / np.maximum(np.linalg.norm(forces, axis=1), 1e-12))
+        step = forces * node_speed[:, None]
+        pos += step
+        previous = forces
+
+        if np.mean(np.linalg.norm(step[movable], axis=1)) < CONVERGENCE_STEP:
+            converged = True
+            break
+
+    return pos * scale, iterations, converged
+
+
+class LayoutEngine:
+    """Runs force_layout in a process pool and caches the results"""
+
+    def __init__(self):
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # (scope, schema key, cluster key) -> {node_id: [x, y, z]}, LRU
+        self.layouts: "OrderedDict[tuple, Dict[str, List[float]]]" = OrderedDict()
+        # connection_id -> (cluster key, last layout), the warm start for the next schema change
+        self.latest: Dict[str, Tuple[str, Dict[str, List[float]]]] = {}
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.stats = {"hits": 0, "cold": 0, "warm": 0}
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: workers only need this module and NumPy, not a fork of the server's threads
+            self._pool = ProcessPoolExecutor(max_workers=LAYOUT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @staticmethod
+    def cache_key(nodes: List[dict], edges: List[dict], fingerprint: Optional[str],
+                  cluster_assignments: Optional[Dict[str, str]]) -> Tuple[str, str]:
+        """(schema part, cluster part); the schema part falls back to a digest of the graph"""
+        clusters = hashlib.md5(repr(sorted((cluster_assignments or {}).items(), key=str)).encode()).hexdigest()
+        shape = hashlib.md5()
+        if fingerprint is None:
+            for node in nodes:
+                shape.update(f"{node['id']}\n".encode())
+        for edge in edges:
+            shape.update(f"{edge['source']}>{edge['target']}:{edge.get('link_strength')}\n".encode())
+        schema = f"{fingerprint or ''}:{len(nodes)}:{shape.hexdigest()}"
+        return schema, clusters
+
+    async def layout(self, connection_id: str, nodes: List[dict], edges: List[dict], fingerprint: Optional[str],
+                     cluster_assignments: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Converged positions {node_id: [x, y, z]} for the graph, with how
+        they were obtained ('cached', 'warm' or 'cold'). Node seeds are
+        read from target_x/y/z; nodes with 'fixed' stay where they are.
+        """
+        from app.services.state_cache import state_cache
+
+        scope = state_cache.scope(connection_id)
+        schema_key, cluster_key = self.cache_key(nodes, edges, fingerprint, cluster_assignments)
+        key = (scope or connection_id, schema_key, cluster_key)
+
+        cached = self.layouts.get(key)
+        if cached is None:
+            cached = await asyncio.to_thread(state_cache.get, "layout", scope, schema_key, cluster_key)
+            if cached is not None:
+                self._remember(key, cached)
+        if cached is not None:
+            self.layouts.move_to_end(key)
+            self.latest[connection_id] = (cluster_key, cached)
+            self.stats["hits"] += 1
+            return {"positions": cached, "mode": "cached", "iterations": 0, "converged": True}
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._compute(connection_id, key, scope, nodes, edges))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._inflight.pop(key, None)
+                                     if self._inflight.get(key) is done else None)
+        return await asyncio.shield(future)
+
+    async def _compute(self, connection_id: str, key: tuple, scope: Optional[str],
+                       nodes: List[dict], edges: List[dict]) -> Dict[str, Any]:
+        from app.services.state_cache import state_cache
+
+        index = {node['id']: i for i, node in enumerate(nodes)}
+        seeds = np.array([[node.get('target_x', node.get('x', 0)), node.get('target_y', node.get('y', 0)),
+                           node.get('target_z', node.get('z', 0))] for node in nodes], dtype=np.float64)
+        fixed = np.array([bool(node.get('fixed')) for node in nodes], dtype=bool)
+        # Hub links only keep nodes from drifting; gravity already does that here
+        pairs = [(index[e['source']], index[e['target']], float(e.get('link_strength', 0.1)))
+                 for e in edges
+                 if e['source'] in index and e['target'] in index and 'hub' not in (e['source'], e['target'])]
+        edge_array = np.array([(a, b) for a, b, _ in pairs], dtype=np.int64).reshape(-1, 2)
+        weights = np.array([w for _, _, w in pairs], dtype=np.float64)
+
+        # Warm start: with the same clusters, tables that were laid out before keep their position
+        previous_clusters, previous = self.latest.get(connection_id, (None, {}))
+        if previous_clusters != key[2]:
+            previous = {}
+        reused = [i for i, node in enumerate(nodes) if node['id'] in previous]
+        initial, mode, max_iterations = None, "cold", LAYOUT_MAX_ITERATIONS
+        if previous and len(reused) >= len(nodes) // 2:
+            initial = seeds.copy()
+            initial[reused] = [previous[nodes[i]['id']] for i in reused]
+            mode, max_iterations = "warm", LAYOUT_WARM_ITERATIONS
+
+        loop = asyncio.get_running_loop()
+        positions, iterations, converged = await loop.run_in_executor(
+            self._executor(), force_layout, seeds, edge_array, weights, fixed, initial, max_iterations
+        )
+        layout = {node['id']: [round(float(c), 2) for c in positions[i]] for i, node in enumerate(nodes)}
+
+        self._remember(key, layout)
+        self.latest[connection_id] = (key[2], layout)
+        self.stats[mode] += 1
+        await state_cache.aput("layout", scope, key[1], layout, key=key[2])
+        print(f"🧭 Layout ({mode}) for {connection_id}: {len(nodes)} nodes, {iterations} iterations"
+              f"{'' if converged else ' (not converged)'}")
+        return {"positions": layout, "mode": mode, "iterations": iterations, "converged": converged}
+
+    def _remember(self, key: tuple, layout: Dict[str, List[float]]):
+        self.layouts[key] = layout
+        self.layouts.move_to_end(key)
+        while len(self.layouts) > LAYOUT_CACHE_SIZE:
+            self.layouts.popitem(last=False)
+
+
+# Global instance
+layout_engine = LayoutEngine()
@@ -7,10 +7,69 @@ to build relationship graphs and calculate complexity metrics in real-time.
 """
 
 import asyncio
-from typing import List, Dict, Any
+import hashlib
+import os
+from collections import OrderedDict, deque
+from typing import List, Dict, Any, Optional
 import math
 from datetime import datetime, timedelta
 
+# Predicted links at or below this confidence are dropped by predict_all_links
+LINK_CONFIDENCE_THRESHOLD = float(os.getenv("NEURAL_LINK_CONFIDENCE_THRESHOLD", 0.6))
+# Schemas (fingerprints) whose predicted links are kept in memory
+LINK_CACHE_SIZE = int(os.getenv("NEURAL_LINK_CACHE_SIZE", 32))
+SEMANTIC_LINK_CONFIDENCE = 0.75
+
+
+class _RootMatcher:
+    """
+    Aho-Corasick automaton over table-name roots: one pass over a string
+    reports every root it contains, so finding all containment pairs is
+    linear in the total name length plus the number of matches.
+    """
+
+    def __init__(self, roots):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for root in roots:
+            state = 0
+            for char in root:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(root)
+
+        # Breadth-first so every fail link points at an already finished state
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def contained_in(self, text: str) -> set:
+        """Every root that occurs somewhere in text"""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state]:
+                found.update(self.output[state])
+        return found
+
 class NeuralCore:
     def __init__(self):
         self.model_state = "initializing"
@@ -34,6 +93,9 @@ class NeuralCore:
         # Insights
         self.gravity_store = {} # node_id -> importance_score
         self.agent_status = "IDLE"
+        
+        # (schema fingerprint, table count, threshold) -> predicted links, LRU
+        self.link_cache = OrderedDict()
 
     async def initialize(self):
         """Prepare the core for schema analysis"""
@@ -316,10 +378,10 @@ class NeuralCore:
             root_b = other.rstrip('s')
             
             if len(root_a) > 3 and root_a in root_b:
-                confidence = 0.75
+                confidence = SEMANTIC_LINK_CONFIDENCE
                 reason = f"Semantic match: '{node_id}' appears in '{other}'"
             elif len(root_b) > 3 and root_b in root_a:
-                confidence = 0.75
+                confidence = SEMANTIC_LINK_CONFIDENCE
                 reason = f"Semantic match: '{other}' appears in '{node_id}'"
             
             if confidence > 0:
@@ -332,5 +394,70 @@ class NeuralCore:
                 
         return predictions
 
+    async def predict_all_links(self, table_names: List[str], fingerprint: Optional[str] = None,
+                                min_confidence: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        predict_links() for every table at once: each unordered pair whose
+        name roots contain one another, as {source_id, target_id, ...} with
+        the source being the earlier name in table_names. Results above
+        min_confidence (default NEURAL_LINK_CONFIDENCE_THRESHOLD) are
+        memoized per schema fingerprint.
+        """
+        if not self.schema_snapshot: return []
+        threshold = LINK_CONFIDENCE_THRESHOLD if min_confidence is None else min_confidence
+
+        schema_key = fingerprint or hashlib.md5("\n".join(table_names).encode()).hexdigest()
+        key = (schema_key, len(table_names), threshold)
+        cached = self.link_cache.get(key)
+        if cached is not None:
+            self.link_cache.move_to_end(key)
+            return cached
+
+        predictions = await asyncio.to_thread(self._semantic_links, table_names, threshold)
+        self.link_cache[key] = predictions
+        while len(self.link_cache) > LINK_CACHE_SIZE:
+            self.link_cache.popitem(last=False)
+        return predictions
+
+    def _semantic_links(self, table_names: List[str], threshold: float) -> List[Dict[str, Any]]:
+        """Name-containment links for all pairs, via one automaton over the roots"""
+        if SEMANTIC_LINK_CONFIDENCE <= threshold:
+            return []
+
+        # Remove 's' for simple plural check (as in predict_links)
+        roots = [name.rstrip('s') for name in table_names]
+        positions_by_root: Dict[str, List[int]] = {}
+        for position, root in enumerate(roots):
+            positions_by_root.setdefault(root, []).append(position)
+
+        # Only roots longer than 3 characters may match inside another name
+        matcher = _RootMatcher(root for root in positions_by_root if len(root) > 3)
+        # (i, j) -> True if root i appears in root j
+        contains = {}
+        for root, positions in positions_by_root.items():
+            for inner in matcher.contained_in(root):
+                for i in positions_by_root[inner]:
+                    for j in positions:
+                        if i != j and table_names[i] != table_names[j]:
+                            contains[(i, j)] = True
+
+        pairs = sorted({(min(i, j), max(i, j)) for i, j in contains})
+        predictions = []
+        for a, b in pairs:
+            node_id, other = table_names[a], table_names[b]
+            # Same precedence as predict_links(node_id, ...) for the earlier table
+            if (a, b) in contains:
+                reason = f"Semantic match: '{node_id}' appears in '{other}'"
+            else:
+                reason = f"Semantic match: '{other}' appears in '{node_id}'"
+            predictions.append({
+                "source_id": node_id,
+                "target_id": other,
+                "relationship": "semantic_inference",
+                "confidence": SEMANTIC_LINK_CONFIDENCE,
+                "reasoning": reason
+            })
+        return predictions
+
 # Global Instance
 neural_core = NeuralCore()
@@ -1,19 +1,228 @@
 import asyncio
+import hashlib
+import os
+import time
 from app.services.db_connector import db_connector
 from app.services.ai_classifier import ai_classifier
+from app.services.state_cache import state_cache
 from app.models.schemas import Schema, Table, Column, ForeignKey, Relationship
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+# A cached analysis is trusted without touching the catalog for this long
+FINGERPRINT_CHECK_INTERVAL_SECONDS = float(os.getenv("SCHEMA_FINGERPRINT_CHECK_INTERVAL", 10))
+# Row-count estimates on an unchanged schema are refreshed after this long
+ROW_COUNT_MAX_AGE_SECONDS = float(os.getenv("SCHEMA_ROW_COUNT_MAX_AGE", 300))
+
+# One row: md5 over every user column (name, type, nullability, position)
+# and every PK/FK definition. Any DDL that changes the analysis changes it.
+PG_FINGERPRINT_QUERY = """
+    SELECT md5(coalesce(string_agg(entry, ',' ORDER BY entry), '')) AS fingerprint
+    FROM (
+        SELECT format('%s.%s.%s:%s:%s:%s', n.nspname, c.relname, a.attname,
+                      format_type(a.atttypid, a.atttypmod), a.attnotnull, a.attnum) AS entry
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind = 'r' AND a.attnum > 0 AND NOT a.attisdropped
+          AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+        UNION ALL
+        SELECT format('con:%s.%s:%s:%s', n.nspname, c.relname, con.conname, pg_get_constraintdef(con.oid))
+        FROM pg_constraint con
+        JOIN pg_class c ON c.oid = con.conrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE con.contype IN ('p', 'f')
+          AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+    ) entries;
+"""
+
+# GROUP_CONCAT truncates at group_concat_max_len, so MySQL folds per-row
+# 64-bit hashes with BIT_XOR instead (plus the row count)
+MYSQL_FINGERPRINT_QUERY = """
+    SELECT COUNT(*) AS entries,
+           BIT_XOR(CAST(CONV(LEFT(MD5(entry), 16), 16, 10) AS UNSIGNED)) AS digest
+    FROM (
+        SELECT CONCAT_WS('|', TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, ORDINAL_POSITION, COLUMN_KEY) AS entry
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = %s
+        UNION ALL
+        SELECT CONCAT_WS('|', 'con', TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME,
+                         REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME)
+        FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = %s
+    ) entries
+"""
+
 
 class SchemaAnalyzer:
     def __init__(self):
         self.analysis_results: Dict[str, Schema] = {}
+        # Per connection: catalog fingerprint of the cached analysis, when
+        # it was last checked, when row counts were last refreshed, and the
+        # analysis/check currently running (shared by concurrent callers)
+        self.fingerprints: Dict[str, Optional[str]] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._counted_at: Dict[str, float] = {}
+        self._inflight: Dict[str, Tuple[asyncio.Task, bool]] = {}  # connection_id -> (task, forced)
+        self.stats = {"cache_hits": 0, "disk_hits": 0, "fingerprint_checks": 0, "analyses": 0, "shared_waits": 0}
 
     def get_analysis_result(self, connection_id: str) -> Schema:
         """Get cached analysis result"""
         return self.analysis_results.get(connection_id)
 
+    async def get_or_analyze(self, connection_id: str, force: bool = False) -> Schema:
+        """
+        Cached schema for the connection, re-analysed only when the catalog
+        fingerprint has changed (or force=True). Concurrent callers share
+        one in-flight check/analysis instead of each running their own.
+        """
+        cached = self.analysis_results.get(connection_id)
+        if (
+            cached is not None and not force
+            and time.monotonic() - self._checked_at.get(connection_id, 0) < FINGERPRINT_CHECK_INTERVAL_SECONDS
+        ):
+            self.stats["cache_hits"] += 1
+            return cached
+
+        inflight = self._inflight.get(connection_id)
+        if inflight is not None and (inflight[1] or not force):
+            task = inflight[0]
+            self.stats["shared_waits"] += 1
+        else:
+            # A forced refresh never settles for a running check that may
+            # return the cached schema; it runs a full analysis after it
+            previous = inflight[0] if inflight is not None else None
+            task = asyncio.create_task(self._refresh(connection_id, force, after=previous))
+            self._inflight[connection_id] = (task, force)
+            task.add_done_callback(lambda done: self._inflight.pop(connection_id, None)
+                                   if self._inflight.get(connection_id, (None,))[0] is done else None)
+        # Shield so one caller being cancelled doesn't cancel the shared analysis
+        return await asyncio.shield(task)
+
+    async def _refresh(self, connection_id: str, force: bool, after: Optional[asyncio.Task] = None) -> Schema:
+        if after is not None:
+            # Its result or error belongs to its own callers
+            await asyncio.wait([after])
+        try:
+            fingerprint = await self.fingerprint(connection_id)
+        except Exception as e:
+            print(f"⚠️ Schema fingerprint failed for {connection_id}: {e}")
+            fingerprint = None
+        self.stats["fingerprint_checks"] += 1
+
+        cached = self.analysis_results.get(connection_id)
+        if cached is None and fingerprint is not None and not force:
+            cached = await self._restore(connection_id, fingerprint)
+        unchanged = fingerprint is not None and fingerprint == self.fingerprints.get(connection_id)
+        if cached is not None and unchanged and not force:
+            self._checked_at[connection_id] = time.monotonic()
+            if time.monotonic() - self._counted_at.get(connection_id, 0) >= ROW_COUNT_MAX_AGE_SECONDS:
+                await self._refresh_row_counts(connection_id, cached)
+            return cached
+
+        schema = await self.analyze_schema(connection_id)
+        self.fingerprints[connection_id] = fingerprint
+        self._checked_at[connection_id] = self._counted_at[connection_id] = time.monotonic()
+        await self._persist(connection_id)
+        return schema
+
+    async def _restore(self, connection_id: str, fingerprint: str) -> Optional[Schema]:
+        """
+        Load the analysis stored for this database and fingerprint by an
+        earlier process, and warm the services that derive from it.
+        """
+        scope = state_cache.scope(connection_id)
+        schema = await asyncio.to_thread(state_cache.get, "schema", scope, fingerprint)
+        if schema is None:
+            return None
+        self.analysis_results[connection_id] = schema
+        self.fingerprints[connection_id] = fingerprint
+        # Row counts were current when stored; refresh them on this check
+        self._counted_at[connection_id] = 0
+        self.stats["disk_hits"] += 1
+        print(f"💾 Restored schema for {connection_id} from disk ({len(schema.tables)} tables)")
+
+        from app.services.temporal_analyzer import temporal_analyzer
+        from app.services.data_flow_analyzer import data_flow_analyzer
+        from app.services.cluster_store import cluster_store
+        for service in (temporal_analyzer, data_flow_analyzer, cluster_store):
+            try:
+                await asyncio.to_thread(service.warm_from_disk, connection_id, scope, fingerprint)
+            except Exception as e:
+                print(f"⚠️ Warming {type(service).__name__} failed for {connection_id}: {e}")
+        # Gravity and signals live only in memory; seed them as a fresh analysis would
+        self._seed_agents(schema)
+        return schema
+
+    def _seed_agents(self, schema: Schema):
+        """Trigger Agentic AI Analysis for Neural Core seeding (in-memory, so once per process)"""
+        from app.services.agent_service import agent_service
+        try:
+            schema_dict = schema.dict() if hasattr(schema, 'dict') else schema.model_dump()
+            asyncio.create_task(agent_service.analyze_new_connection(schema_dict))
+        except Exception as e:
+            print(f"⚠️ Agent seeding failed: {e}")
+
+    async def _persist(self, connection_id: str):
+        """Write the cached analysis to disk under its fingerprint"""
+        schema = self.analysis_results.get(connection_id)
+        if schema is not None:
+            await state_cache.aput(
+                "schema", state_cache.scope(connection_id), self.fingerprints.get(connection_id), schema
+            )
+
+    async def fingerprint(self, connection_id: str) -> Optional[str]:
+        """Hash of the tables/columns/keys the analysis depends on; one catalog query"""
+        connection = db_connector.get_connection(connection_id)
+        db_type = connection['type']
+
+        if db_type == 'mock':
+            return "mock"
+        if db_type in ['postgresql', 'postgres', 'neon', 'neon_db']:
+            rows = await db_connector.query(connection_id, PG_FINGERPRINT_QUERY)
+            return rows[0]['fingerprint'] if rows else None
+        if db_type == 'mysql':
+            database = connection['config']['database']
+            rows = await db_connector.query(connection_id, MYSQL_FINGERPRINT_QUERY, (database, database))
+            return f"{rows[0]['entries']}:{rows[0]['digest']}" if rows else None
+        if db_type in ['mongodb', 'mongo']:
+            db = connection['client'][connection['config']['database']]
+            names = await asyncio.to_thread(db.list_collection_names)
+            return hashlib.md5(",".join(sorted(names)).encode()).hexdigest()
+        return None
+
+    async def _refresh_row_counts(self, connection_id: str, schema: Schema):
+        """Update row-count estimates on a cached schema without re-analysing it"""
+        connection = db_connector.get_connection(connection_id)
+        db_type = connection['type']
+        try:
+            if db_type in ['postgresql', 'postgres', 'neon', 'neon_db']:
+                rows = await db_connector.query(connection_id, """
+                    SELECT relname as table_name, reltuples::bigint as row_count
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname NOT IN ('pg_catalog', 'information_schema') AND c.relkind = 'r';
+                """)
+            elif db_type == 'mysql':
+                rows = await db_connector.query(connection_id, """
+                    SELECT TABLE_NAME as table_name, TABLE_ROWS as row_count
+                    FROM information_schema.TABLES
+                    WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'
+                """, (connection['config']['database'],))
+            else:
+                return
+        except Exception as e:
+            print(f"⚠️ Row count refresh failed for {connection_id}: {e}")
+            return
+
+        counts = {r['table_name']: r['row_count'] for r in rows}
+        for table in schema.tables:
+            if table.name in counts:
+                table.row_count = max(0, int(counts[table.name] or 0))
+        self._counted_at[connection_id] = time.monotonic()
+
     async def analyze_schema(self, connection_id: str) -> Schema:
-        """Analyze database schema"""
+        """Analyze database schema (always runs; callers normally want get_or_analyze)"""
+        self.stats["analyses"] += 1
         connection = db_connector.get_connection(connection_id)
         db_type = connection['type']
         
@@ -37,25 +246,22 @@ class SchemaAnalyzer:
         
         # 2. Parallel AI & agent tasks
         # Background slow Gemini classification
-        asyncio.create_task(self._background_classification(schema))
+        asyncio.create_task(self._background_classification(connection_id, schema))
         
-        # Trigger Agentic AI Analysis for Neural Core seeding
-        from app.services.agent_service import agent_service
-        try:
-            schema_dict = schema.dict() if hasattr(schema, 'dict') else schema.model_dump()
-            asyncio.create_task(agent_service.analyze_new_connection(schema_dict))
-        except Exception as e:
-            print(f"⚠️ Agent seeding failed: {e}")
+        self._seed_agents(schema)
             
         print(f"✅ Fast Schema analysis complete: {len(schema.tables)} tables mapped")
         return schema
 
-    async def _background_classification(self, schema: Schema):
+    async def _background_classification(self, connection_id: str, schema: Schema):
         """Run deep AI classification in background"""
         try:
             print("🧠 Background: Starting deep AI classification...")
             await ai_classifier.classify_tables(schema)
             print("🧠 Background: AI classification complete.")
+            # Store the classified version so a restart doesn't redo it
+            if self.analysis_results.get(connection_id) is schema:
+                await self._persist(connection_id)
         except Exception as e:
             print(f"⚠️ Background classification failed: {e}")
 
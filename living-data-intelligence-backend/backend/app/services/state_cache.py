@@ -0,0 +1,220 @@
+"""
+State Cache - Persists analysis results across restarts
+Schema analyses, evolution timelines, data flows and cluster assignments
+are kept in SQLite under backend/neural_state, so a restart (or a
+uvicorn reload) doesn't force a full re-introspection of the database.
+
+Connection ids are per-process counters, so entries are keyed by a scope
+(database type/host/port/name) and only served while the database's
+catalog fingerprint still matches the one they were stored with.
+Timelines and clusters depend on the rows too, so they get a shorter TTL.
+"""
+import asyncio
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_PATH = Path(__file__).resolve().parents[2] / "neural_state" / "state_cache.sqlite3"
+CACHE_PATH = os.getenv("STATE_CACHE_PATH", str(DEFAULT_PATH))
+# Entries older than this are dropped instead of served
+CACHE_TTL_SECONDS = float(os.getenv("STATE_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+# Namespaces derived from the data rather than the catalog: the fingerprint
+# doesn't change when rows do, so these expire much sooner
+DATA_TTL_SECONDS = float(os.getenv("STATE_CACHE_DATA_TTL_SECONDS", 3600))
+DATA_NAMESPACES = ("evolution", "clusters")
+# Least recently used entries are evicted past this many bytes on disk
+CACHE_MAX_BYTES = int(os.getenv("STATE_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+# Bump when a cached structure (e.g. the Schema model) changes shape
+FORMAT_VERSION = 1
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        namespace   TEXT NOT NULL,
+        scope       TEXT NOT NULL,
+        key         TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        version     INTEGER NOT NULL,
+        value       BLOB NOT NULL,
+        size        INTEGER NOT NULL,
+        created_at  REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        PRIMARY KEY (namespace, scope, key)
+    );
+    CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class StateCache:
+    """SQLite-backed store of pickled values keyed by (namespace, scope, key)"""
+
+    def __init__(self, path: str = CACHE_PATH, ttl_seconds: float = CACHE_TTL_SECONDS,
+                 max_bytes: int = CACHE_MAX_BYTES, data_ttl_seconds: float = DATA_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.namespace_ttls = {namespace: data_ttl_seconds for namespace in DATA_NAMESPACES}
+        self.max_bytes = max_bytes
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "writes": 0, "evictions": 0}
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SCHEMA)
+            self._db = db
+        return self._db
+
+    def ttl(self, namespace: str) -> float:
+        return self.namespace_ttls.get(namespace, self.ttl_seconds)
+
+    def open(self) -> Dict[str, Any]:
+        """Open the store and drop expired/over-budget entries; called on startup"""
+        with self._lock:
+            db = self._conn()
+            now = time.time()
+            expired = db.execute("DELETE FROM entries WHERE created_at < ? OR version != ?",
+                                 (now - self.ttl_seconds, FORMAT_VERSION)).rowcount
+            for namespace, ttl in self.namespace_ttls.items():
+                expired += db.execute("DELETE FROM entries WHERE namespace = ? AND created_at < ?",
+                                      (namespace, now - ttl)).rowcount
+            self._evict(db)
+            count, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        print(f"💾 State cache: {count} entries ({size / 1024:.0f} KB) at {self.path}, {expired} expired")
+        return {"entries": count, "bytes": size, "expired": expired}
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @staticmethod
+    def scope(connection_id: str) -> Optional[str]:
+        """Stable key for the database behind a connection id, or None if it isn't connected"""
+        from app.services.db_connector import db_connector
+
+        connection = db_connector.connections.get(connection_id)
+        if connection is None:
+            return None
+        config = connection['config']
+        identity = f"{connection['type']}|{config.get('host')}|{config.get('port')}|{config.get('database')}"
+        return hashlib.md5(identity.lower().encode()).hexdigest()
+
+    def get(self, namespace: str, scope: Optional[str], fingerprint: Optional[str], key: str = "") -> Any:
+        """Cached value, or None if missing, expired or stored under another fingerprint"""
+        if scope is None or fingerprint is None:
+            return None
+        with self._lock:
+            db = self._conn()
+            row = db.execute(
+                "SELECT fingerprint, version, value, created_at FROM entries "
+                "WHERE namespace = ? AND scope = ? AND key = ?",
+                (namespace, scope, key)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            stored_fingerprint, version, blob, created_at = row
+            value = None
+            if (stored_fingerprint == fingerprint and version == FORMAT_VERSION
+                    and time.time() - created_at < self.ttl(namespace)):
+                try:
+                    value = pickle.loads(blob)
+                except Exception as e:
+                    print(f"⚠️ State cache entry {namespace}/{key} unreadable: {e}")
+            if value is None:
+                self.stats["stale"] += 1
+                db.execute("DELETE FROM entries WHERE namespace = ? AND scope = ? AND key = ?",
+                           (namespace, scope, key))
+                return None
+            db.execute("UPDATE entries SET accessed_at = ? WHERE namespace = ? AND scope = ? AND key = ?",
+                       (time.time(), namespace, scope, key))
+            self.stats["hits"] += 1
+            return value
+
+    def get_all(self, namespace: str, scope: Optional[str], fingerprint: Optional[str]) -> Dict[str, Any]:
+        """Every live entry of a namespace for one scope, as {key: value}"""
+        if scope is None or fingerprint is None:
+            return {}
+        with self._lock:
+            keys = [row[0] for row in self._conn().execute(
+                "SELECT key FROM entries WHERE namespace = ? AND scope = ?", (namespace, scope)
+            )]
+        values = {key: self.get(namespace, scope, fingerprint, key) for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
+
+    def put(self, namespace: str, scope: Optional[str], fingerprint: Optional[str], value: Any, key: str = ""):
+        """Store a value; skipped when the scope or fingerprint is unknown"""
+        if scope is None or fingerprint is None:
+            return
+        self._write(namespace, scope, fingerprint, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    async def aput(self, namespace: str, scope: Optional[str], fingerprint: Optional[str], value: Any, key: str = ""):
+        """put() for the event loop: pickled here (so the value can't change mid-dump), written in a thread"""
+        if scope is None or fingerprint is None:
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        await asyncio.to_thread(self._write, namespace, scope, fingerprint, key, blob)
+
+    def _write(self, namespace: str, scope: str, fingerprint: str, key: str, blob: bytes):
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                db = self._conn()
+                db.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(namespace, scope, key, fingerprint, version, value, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (namespace, scope, key, fingerprint, FORMAT_VERSION, blob, len(blob), now, now)
+                )
+                self.stats["writes"] += 1
+                self._evict(db)
+        except sqlite3.Error as e:
+            # The cache is an optimisation; never fail the request over it
+            print(f"⚠️ State cache write failed for {namespace}/{key}: {e}")
+
+    def delete(self, namespace: str, scope: Optional[str], key: Optional[str] = None):
+        """Drop one entry, or every entry of the namespace for the scope when key is None"""
+        if scope is None:
+            return
+        with self._lock:
+            if key is None:
+                self._conn().execute("DELETE FROM entries WHERE namespace = ? AND scope = ?", (namespace, scope))
+            else:
+                self._conn().execute("DELETE FROM entries WHERE namespace = ? AND scope = ? AND key = ?",
+                                     (namespace, scope, key))
+
+    def _evict(self, db: sqlite3.Connection):
+        """Delete least recently used entries until the store fits max_bytes"""
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for namespace, scope, key, size in db.execute(
+            "SELECT namespace, scope, key, size FROM entries ORDER BY accessed_at"
+        ).fetchall():
+            db.execute("DELETE FROM entries WHERE namespace = ? AND scope = ? AND key = ?", (namespace, scope, key))
+            self.stats["evictions"] += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, size = self._conn().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {**self.stats, "entries": count, "bytes": size, "maxBytes": self.max_bytes,
+                "ttlSeconds": self.ttl_seconds, "namespaceTtlSeconds": self.namespace_ttls}
+
+
+# Global instance
+state_cache = StateCache()
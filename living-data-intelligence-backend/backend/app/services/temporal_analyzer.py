@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, date
 from typing import Dict, List, Any, Optional, Tuple
 from app.services.db_connector import db_connector
 from app.services.schema_analyzer import schema_analyzer
+from app.services.state_cache import state_cache
 
 class TemporalAnalyzer:
     """
@@ -36,9 +37,7 @@ class TemporalAnalyzer:
         """
         print(f"🎬 Starting Database Evolution Analysis for {connection_id}...")
         
-        schema = schema_analyzer.get_analysis_result(connection_id)
-        if not schema:
-            schema = await schema_analyzer.analyze_schema(connection_id)
+        schema = await schema_analyzer.get_or_analyze(connection_id)
         
         table_timelines = []
         
@@ -98,6 +97,9 @@ class TemporalAnalyzer:
         }
         
         self.evolution_results[connection_id] = evolution_data
+        await state_cache.aput(
+            "evolution", state_cache.scope(connection_id), schema_analyzer.fingerprints.get(connection_id), evolution_data
+        )
         print(f"✅ Evolution analysis complete for {connection_id}. {len(table_timelines)} tables analyzed.")
         
         return evolution_data
@@ -227,5 +229,11 @@ class TemporalAnalyzer:
         """Get cached evolution result."""
         return self.evolution_results.get(connection_id)
 
+    def warm_from_disk(self, connection_id: str, scope: str, fingerprint: str):
+        """Load a timeline stored by an earlier process for the same database"""
+        result = state_cache.get("evolution", scope, fingerprint)
+        if result is not None:
+            self.evolution_results[connection_id] = {**result, "connection_id": connection_id}
+
 # Global instance
 temporal_analyzer = TemporalAnalyzer()
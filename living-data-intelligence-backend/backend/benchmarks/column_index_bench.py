@@ -0,0 +1,114 @@
+"""
+Shared-column pairs: ColumnIndex vs the old all-pairs scan.
+
+    python -m benchmarks.column_index_bench [--tables 5000] [--columns 12] [--seed 7] [--skip-naive]
+                                            [--ubiquitous 3000,5000]
+
+Builds a synthetic schema where tables draw columns from a large pool of
+domain-specific names plus a few common ones, runs the nested loop that
+GraphGenerator and graph_optimizer_nx used to run, and checks that
+ColumnIndex finds exactly the same pairs and shared columns, also when
+it has to split the work into many small chunks. The ubiquitous case
+gives every table one extra column (think tenant_id), so every pair of
+tables shares it, and reports the process's peak RSS after walking all
+the pairs (sizes run in the order given, so list them ascending).
+"""
+import argparse
+import random
+import resource
+import time
+
+from app.services.column_index import ColumnIndex, IGNORED_COLUMNS
+
+
+def synthetic_schema(num_tables: int, columns_per_table: int, seed: int):
+    rng = random.Random(seed)
+    common = ['name', 'status', 'description']
+    pool = [f"col_{i}" for i in range(num_tables * 2)]
+    tables = []
+    for t in range(num_tables):
+        # Most columns are local to a few neighbours; some FK-ish ones point anywhere
+        local = [f"col_{(t * 2 + rng.randint(-6, 6)) % len(pool)}" for _ in range(columns_per_table - 3)]
+        names = ['id', 'created_at', f"ref_{rng.randint(0, num_tables // 4)}_id", *local]
+        if rng.random() < 0.05:
+            names.append(rng.choice(common))
+        names = list(dict.fromkeys(names))
+        tables.append({'name': f"table_{t}", 'columns': [{'name': n} for n in names]})
+    return tables
+
+
+def naive_pairs(tables, min_shared: int = 1):
+    """The nested loop that used to run per render"""
+    pairs = {}
+    for i in range(len(tables)):
+        for j in range(i + 1, len(tables)):
+            cols1 = {c['name'] for c in tables[i].get('columns', []) if c['name'] not in IGNORED_COLUMNS}
+            cols2 = {c['name'] for c in tables[j].get('columns', []) if c['name'] not in IGNORED_COLUMNS}
+            matches = cols1.intersection(cols2)
+            if len(matches) >= min_shared:
+                pairs[(i, j)] = matches
+    return pairs
+
+
+def ubiquitous_case(num_tables: int, columns_per_table: int, seed: int):
+    tables = synthetic_schema(num_tables, columns_per_table, seed)
+    for table in tables:
+        table['columns'].append({'name': 'tenant_id'})
+
+    started = time.perf_counter()
+    count = sum(1 for _ in ColumnIndex(tables).shared_pairs())
+    elapsed = time.perf_counter() - started
+    # ru_maxrss is in KB on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    expected = num_tables * (num_tables - 1) // 2
+    status = "✅" if count == expected else f"❌ expected {expected} pairs"
+    print(f"{num_tables} tables + tenant_id: {elapsed:6.2f}s  {count} pairs  peak RSS {peak / 2 ** 20:6.1f}MB  {status}")
+    if count != expected:
+        raise SystemExit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tables", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-naive", action="store_true", help="only time ColumnIndex")
+    parser.add_argument("--ubiquitous", default="3000,5000", help="schema sizes for the shared-column case")
+    args = parser.parse_args()
+
+    tables = synthetic_schema(args.tables, args.columns, args.seed)
+    print(f"{args.tables} tables x ~{args.columns} columns")
+
+    for min_shared in (1, 2):
+        started = time.perf_counter()
+        indexed = {(i, j): shared for i, j, shared in ColumnIndex(tables).shared_pairs(min_shared)}
+        index_time = time.perf_counter() - started
+        print(f"min_shared={min_shared}: ColumnIndex {index_time * 1000:8.1f}ms  {len(indexed)} pairs")
+
+        chunked = {(i, j): shared for i, j, shared in ColumnIndex(tables, pair_budget=1000).shared_pairs(min_shared)}
+        if list(chunked.items()) != list(indexed.items()):
+            print(f"{'':14}❌ small pair budget changes the result")
+            raise SystemExit(1)
+
+        if args.skip_naive:
+            continue
+        started = time.perf_counter()
+        expected = naive_pairs(tables, min_shared)
+        naive_time = time.perf_counter() - started
+        print(f"{'':14}nested loop {naive_time * 1000:8.1f}ms  ({naive_time / index_time:.0f}x slower)")
+
+        same = expected.keys() == indexed.keys() and all(
+            set(indexed[pair]) == matches and len(indexed[pair]) == len(matches)
+            for pair, matches in expected.items()
+        )
+        print(f"{'':14}{'✅ identical pairs' if same else '❌ pairs differ'}")
+        if not same:
+            raise SystemExit(1)
+
+    for size in (int(n) for n in args.ubiquitous.split(",") if n):
+        ubiquitous_case(size, args.columns, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Parallel query throughput through DatabaseConnector.
+
+    python -m benchmarks.db_connector_bench --db-type postgresql \\
+        --host localhost --port 5432 --database postgres \\
+        --username postgres --password secret \\
+        [--queries 200] [--concurrency 20] [--sleep-ms 50]
+
+Each query sleeps on the server (pg_sleep / SLEEP) so the numbers measure
+how many queries one connection_id keeps in flight, not raw server speed.
+The run is repeated with the connection's semaphore forced to 1, which is
+how the connector behaved with its old per-connection lock.
+"""
+import argparse
+import asyncio
+import time
+
+from app.services.db_connector import db_connector, POOL_MAX_SIZE
+
+
+def _sleep_sql(db_type: str, seconds: float) -> str:
+    if db_type == "mysql":
+        return f"SELECT SLEEP({seconds}) AS slept"
+    return f"SELECT pg_sleep({seconds}) AS slept"
+
+
+async def _run(connection_id: str, sql: str, queries: int, concurrency: int):
+    gate = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with gate:
+            started = time.perf_counter()
+            await db_connector.query(connection_id, sql)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(queries)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "qps": queries / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+def _report(label: str, result: dict):
+    print(
+        f"{label:<22} {result['elapsed']:7.2f}s  {result['qps']:8.1f} q/s  "
+        f"p50 {result['p50_ms']:7.1f}ms  p99 {result['p99_ms']:7.1f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--db-type", default="postgresql", choices=["postgresql", "neon", "mysql"])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--database", default="postgres")
+    parser.add_argument("--username", default="postgres")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--sleep-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    port = args.port or (3306 if args.db_type == "mysql" else 5432)
+    info = await db_connector.connect({
+        "db_type": args.db_type,
+        "host": args.host,
+        "port": port,
+        "database": args.database,
+        "username": args.username,
+        "password": args.password,
+    })
+    connection_id = info["id"]
+    sql = _sleep_sql(info["type"], args.sleep_ms / 1000.0)
+
+    print(f"{args.queries} queries x {args.sleep_ms:.0f}ms, {args.concurrency} callers, pool size {POOL_MAX_SIZE}")
+    try:
+        # Warm the pool so both runs start with open connections
+        await _run(connection_id, "SELECT 1", POOL_MAX_SIZE, POOL_MAX_SIZE)
+
+        pooled = db_connector.semaphores[connection_id]
+        db_connector.semaphores[connection_id] = asyncio.Semaphore(1)
+        _report("serialized (lock)", await _run(connection_id, sql, args.queries, args.concurrency))
+
+        db_connector.semaphores[connection_id] = pooled
+        _report("pooled (semaphore)", await _run(connection_id, sql, args.queries, args.concurrency))
+    finally:
+        await db_connector.close(connection_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""
+GraphGenerator node layout: vectorized targets vs the old per-table loop.
+
+    python -m benchmarks.graph_layout_bench [--sizes 1000,2000,5000,10000] [--clusters 12] [--legacy-max 10000]
+
+For each schema size, times GraphGenerator._layout_targets (cluster
+layout and statistical layout) against the loop it replaced, which
+rebuilt each table's cluster member list and searched it with
+list.index(). The deterministic coordinates must match; only the
+random z jitter within a cluster differs.
+"""
+import argparse
+import math
+import random
+import time
+
+import numpy as np
+
+from app.services.graph_generator import graph_generator
+
+
+def synthetic_tables(num_tables: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [{
+        'name': f"table_{i}",
+        'row_count': int(10 ** rng.uniform(0, 7)),
+        'columns': [{'name': f"c{j}", 'data_type': 'text'} for j in range(rng.randint(2, 30))],
+        'foreign_keys': [{'column': f"c{j}", 'referenced_table': f"table_{rng.randrange(num_tables)}"}
+                         for j in range(rng.randint(0, 4))],
+    } for i in range(num_tables)]
+
+
+def cluster_layout(tables, num_clusters: int):
+    assignments = {t['name']: f"cluster_{i % num_clusters}" for i, t in enumerate(tables) if i % 10}
+    unique_clusters = list(dict.fromkeys(assignments.values()))
+    positions = {}
+    for i, cluster_id in enumerate(unique_clusters):
+        angle = (i / len(unique_clusters)) * 2 * math.pi
+        positions[cluster_id] = {'x': 400 * math.cos(angle), 'y': 400 * math.sin(angle), 'z': (i % 3 - 1) * 100}
+    return assignments, positions
+
+
+def legacy_targets(tables, gravities, cluster_assignments, cluster_positions):
+    """The per-table loop generate_graph used to run"""
+    targets = []
+    for table, neural_gravity in zip(tables, gravities):
+        name = table['name']
+        if cluster_assignments and name in cluster_assignments:
+            cluster_id = cluster_assignments[name]
+            cluster_center = cluster_positions.get(cluster_id, {'x': 0, 'y': 0, 'z': 0})
+            cluster_tables = [t for t in tables if cluster_assignments.get(t['name']) == cluster_id]
+            local_index = cluster_tables.index(table)
+            num_in_cluster = len(cluster_tables)
+            local_angle = (local_index / max(num_in_cluster, 1)) * 2 * math.pi
+            local_radius = 80 + (num_in_cluster * 5)
+            targets.append((cluster_center['x'] + local_radius * math.cos(local_angle),
+                            cluster_center['y'] + local_radius * math.sin(local_angle),
+                            cluster_center['z'] + (random.random() - 0.5) * 30))
+        else:
+            pos_x = max(-800, min(800, (math.log10(max(table.get('row_count', 0), 1)) - 3.0) * 200))
+            complexity = len(table.get('columns', [])) + len(table.get('foreign_keys', [])) * 2
+            pos_y = max(-500, min(500, (complexity - 10) * 40))
+            pos_z = max(-200, min(600, (neural_gravity - 1.0) * 150))
+            targets.append((pos_x, pos_y, pos_z))
+    return np.array(targets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,2000,5000,10000")
+    parser.add_argument("--clusters", type=int, default=12)
+    parser.add_argument("--legacy-max", type=int, default=10000, help="skip the old loop above this many tables")
+    args = parser.parse_args()
+
+    print(f"{'tables':>7} {'layout':<12} {'vectorized':>11} {'old loop':>11}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        tables = synthetic_tables(size)
+        gravities = np.random.default_rng(1).uniform(1.0, 5.0, size)
+        for label, (assignments, positions) in (
+            ("statistical", ({}, {})),
+            ("cluster", cluster_layout(tables, args.clusters)),
+        ):
+            started = time.perf_counter()
+            targets = graph_generator._layout_targets(tables, gravities, assignments, positions, np.random.default_rng())
+            vectorized = time.perf_counter() - started
+
+            if size > args.legacy_max:
+                print(f"{size:>7} {label:<12} {vectorized * 1000:9.1f}ms {'-':>11}")
+                continue
+            started = time.perf_counter()
+            expected = legacy_targets(tables, gravities.tolist(), assignments, positions)
+            legacy = time.perf_counter() - started
+
+            clustered = np.array([t['name'] in assignments for t in tables], dtype=bool)
+            same_xy = np.allclose(targets[:, :2], expected[:, :2])
+            same_z = np.allclose(targets[~clustered, 2], expected[~clustered, 2])
+            z_in_band = np.all(np.abs(targets[clustered, 2] - expected[clustered, 2]) <= 30)
+            status = "✅" if same_xy and same_z and z_in_band else "❌ positions differ"
+            print(f"{size:>7} {label:<12} {vectorized * 1000:9.1f}ms {legacy * 1000:9.1f}ms  {status}")
+            if status != "✅":
+                raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
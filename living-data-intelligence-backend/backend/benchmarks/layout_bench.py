@@ -0,0 +1,92 @@
+"""
+Server-side force layout: cold vs warm-started runs of force_layout.
+
+    python -m benchmarks.layout_bench [--sizes 1000,4000,10000] [--changed 0.01]
+
+Builds a clustered synthetic graph (seed positions on cluster circles,
+80% of edges inside a cluster), lays it out from the seeds, then adds
+`--changed` x N new tables and warm-starts from the first layout the
+way LayoutEngine does after a small schema change. "edge/random" is the
+mean edge length over the mean distance between random node pairs; it
+should drop from the seeds to the converged layout.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.services.layout_engine import force_layout, LAYOUT_MAX_ITERATIONS, LAYOUT_WARM_ITERATIONS
+
+
+def synthetic_graph(count: int, rng: np.random.Generator):
+    num_clusters = max(2, count // 100)
+    cluster = rng.integers(0, num_clusters, count)
+    angle = 2 * np.pi * np.arange(num_clusters) / num_clusters
+    seeds = np.c_[400 * np.cos(angle)[cluster], 400 * np.sin(angle)[cluster], np.zeros(count)]
+    seeds += rng.normal(0, 60, (count, 3))
+    seeds[0] = 0.0  # hub
+
+    members = [np.flatnonzero(cluster == c) for c in range(num_clusters)]
+    sources = rng.integers(1, count, count * 2)
+    targets = np.where(
+        rng.random(len(sources)) < 0.8,
+        [rng.choice(members[cluster[s]]) for s in sources],
+        rng.integers(1, count, len(sources)),
+    )
+    keep = (sources != targets) & (targets != 0)
+    edges = np.c_[sources[keep], targets[keep]]
+    weights = rng.uniform(0.3, 0.95, len(edges))
+    fixed = np.zeros(count, dtype=bool)
+    fixed[0] = True
+    return seeds, edges, weights, fixed
+
+
+def edge_ratio(pos: np.ndarray, edges: np.ndarray, rng: np.random.Generator) -> float:
+    pairs = rng.integers(0, len(pos), (2000, 2))
+    edge_length = np.linalg.norm(pos[edges[:, 0]] - pos[edges[:, 1]], axis=1).mean()
+    random_length = np.linalg.norm(pos[pairs[:, 0]] - pos[pairs[:, 1]], axis=1).mean()
+    return edge_length / random_length
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,4000,10000")
+    parser.add_argument("--changed", type=float, default=0.01)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>6} {'run':<5} {'iters':>6} {'time':>8}  edge/random")
+    for size in (int(s) for s in args.sizes.split(",")):
+        rng = np.random.default_rng(0)
+        seeds, edges, weights, fixed = synthetic_graph(size, rng)
+        print(f"{size:>6} {'seed':<5} {'':>6} {'':>8}  {edge_ratio(seeds, edges, rng):.3f}")
+
+        started = time.perf_counter()
+        pos, iterations, converged = force_layout(seeds, edges, weights, fixed, None, LAYOUT_MAX_ITERATIONS)
+        elapsed = time.perf_counter() - started
+        print(f"{size:>6} {'cold':<5} {iterations:>6} {elapsed:7.2f}s  {edge_ratio(pos, edges, rng):.3f}"
+              f"{'' if converged else '  (not converged)'}")
+
+        # A few new tables, each linked into an existing cluster
+        added = max(1, int(size * args.changed))
+        new_ids = np.arange(size, size + added)
+        anchors = rng.integers(1, size, added)
+        grown_seeds = np.vstack([seeds, seeds[anchors] + rng.normal(0, 30, (added, 3))])
+        grown_edges = np.vstack([edges, np.c_[new_ids, anchors]])
+        grown_weights = np.concatenate([weights, np.full(added, 0.95)])
+        grown_fixed = np.concatenate([fixed, np.zeros(added, dtype=bool)])
+        initial = grown_seeds.copy()
+        initial[:size] = pos
+
+        started = time.perf_counter()
+        warm, iterations, converged = force_layout(
+            grown_seeds, grown_edges, grown_weights, grown_fixed, initial, LAYOUT_WARM_ITERATIONS
+        )
+        elapsed = time.perf_counter() - started
+        moved = np.linalg.norm(warm[:size] - pos, axis=1).mean()
+        print(f"{size + added:>6} {'warm':<5} {iterations:>6} {elapsed:7.2f}s  {edge_ratio(warm, grown_edges, rng):.3f}"
+              f"  (+{added} tables, existing nodes moved {moved:.1f} on average)"
+              f"{'' if converged else '  (not converged)'}")
+
+
+if __name__ == "__main__":
+    main()
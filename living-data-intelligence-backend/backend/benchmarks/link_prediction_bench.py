@@ -0,0 +1,76 @@
+"""
+Semantic link prediction: NeuralCore.predict_all_links vs per-table predict_links.
+
+    python -m benchmarks.link_prediction_bench [--sizes 500,2000,5000] [--seed 3]
+
+Generates table names from a small vocabulary (so many roots nest inside
+each other), runs the per-table loop generate_graph used to run, and
+checks the batch call returns the same edges in the same order.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from app.services.neural_core import neural_core, LINK_CONFIDENCE_THRESHOLD
+
+WORDS = ["user", "order", "product", "invoice", "payment", "customer", "account", "address",
+         "shipment", "item", "log", "audit", "event", "session", "role", "permission",
+         "tag", "category", "review", "cart"]
+
+
+def synthetic_names(count: int, seed: int):
+    rng = random.Random(seed)
+    names = []
+    for i in range(count):
+        parts = [rng.choice(WORDS) + ("s" if rng.random() < 0.5 else "") for _ in range(rng.randint(1, 3))]
+        names.append("_".join(parts) + ("" if rng.random() < 0.5 else f"_{i}"))
+    return list(dict.fromkeys(names))
+
+
+async def per_table_links(names):
+    """The loop generate_graph used to run, with add_edge's de-duplication"""
+    seen, links = set(), []
+    for name in names:
+        for pred in await neural_core.predict_links(name, names):
+            if pred['confidence'] > LINK_CONFIDENCE_THRESHOLD:
+                key = tuple(sorted([name, pred['target_id']]))
+                if key not in seen:
+                    seen.add(key)
+                    links.append((name, pred['target_id'], pred['reasoning']))
+    return links
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="500,2000,5000")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    # predict_* only run once the core has seen a schema
+    neural_core.schema_snapshot = {'tables': [{'name': 'bench'}]}
+
+    print(f"{'tables':>7} {'links':>7} {'batch':>9} {'memoized':>9} {'per table':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        names = synthetic_names(size, args.seed)
+
+        started = time.perf_counter()
+        batch = await neural_core.predict_all_links(names, fingerprint=f"bench-{size}")
+        batch_time = time.perf_counter() - started
+        started = time.perf_counter()
+        await neural_core.predict_all_links(names, fingerprint=f"bench-{size}")
+        memo_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        expected = await per_table_links(names)
+        loop_time = time.perf_counter() - started
+
+        same = [(p['source_id'], p['target_id'], p['reasoning']) for p in batch] == expected
+        print(f"{len(names):>7} {len(batch):>7} {batch_time * 1000:7.1f}ms {memo_time * 1000:7.2f}ms "
+              f"{loop_time * 1000:8.1f}ms  {'✅' if same else '❌ links differ'}")
+        if not same:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -22,11 +22,18 @@ connection_manager = ConnectionManager()
 async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Living Data Intelligence Platform starting...")
+    # Prune the on-disk analysis cache; reconnecting to a known database
+    # then restores its schema, timeline, flows and clusters from it
+    from app.services.state_cache import state_cache
+    await asyncio.to_thread(state_cache.open)
     yield
     # Shutdown
     print("👋 Shutting down...")
     from app.services.db_connector import db_connector
     await db_connector.close_all()
+    from app.services.layout_engine import layout_engine
+    layout_engine.shutdown()
+    state_cache.close()
 
 app = FastAPI(
     title="Living Data Intelligence Platform",
@@ -0,0 +1,87 @@
+"""
+Async Driver Parity Check
+-------------------------
+Connects to the same Postgres (or MySQL) database through the threaded
+driver (psycopg2/pymysql) and the async driver (asyncpg/aiomysql) and
+checks that db_connector.query() returns identical rows for both.
+
+Works against any local instance, e.g.
+    docker run --rm -p 5432:5432 -e POSTGRES_PASSWORD=postgres postgres:16
+
+Usage (from backend/):
+    python ../tests/check_async_driver.py [host] [port] [database] [user] [password] [db_type]
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from app.services.db_connector import db_connector  # noqa: E402
+
+
+POSTGRES_CHECKS = [
+    ("catalog, one param",
+     "SELECT table_name, column_name, ordinal_position FROM information_schema.columns "
+     "WHERE table_schema = %s ORDER BY table_name, ordinal_position LIMIT 50", ("pg_catalog",)),
+    ("escaped percent", "SELECT '100%%' AS pct, %s::int + 1 AS n, %s::text AS t", (41, "v")),
+    ("no params", "SELECT 1 AS one, 'a' AS two", ()),
+    ("jsonb in and out", "SELECT %s::jsonb AS doc, now() - now() AS gap", ('{"a": [1, 2]}',)),
+    ("script", "CREATE TEMP TABLE IF NOT EXISTS _driver_check (id int); DROP TABLE IF EXISTS _driver_check", ()),
+]
+
+MYSQL_CHECKS = [
+    ("catalog, one param",
+     "SELECT table_name, column_name, ordinal_position FROM information_schema.columns "
+     "WHERE table_schema = %s ORDER BY table_name, ordinal_position LIMIT 50", ("information_schema",)),
+    ("escaped percent", "SELECT '100%%' AS pct, %s + 1 AS n", (41,)),
+    ("no params", "SELECT 1 AS one, 'a' AS two", ()),
+]
+
+
+async def main():
+    args = sys.argv[1:] + [None] * 6
+    db_type = args[5] or "postgresql"
+    config = {
+        "db_type": db_type,
+        "host": args[0] or "localhost",
+        "port": int(args[1] or (3306 if db_type == "mysql" else 5432)),
+        "database": args[2] or "postgres",
+        "username": args[3] or "postgres",
+        "password": args[4] or "postgres",
+    }
+
+    print("=" * 70)
+    print(f"🔬 Driver parity check: {db_type} at {config['host']}:{config['port']}")
+    print("=" * 70)
+
+    threaded = (await db_connector.connect({**config, "driver": "threaded"}))["id"]
+    native = (await db_connector.connect({**config, "driver": "async"}))["id"]
+
+    failures = 0
+    checks = MYSQL_CHECKS if db_type == "mysql" else POSTGRES_CHECKS
+    try:
+        for label, sql, params in checks:
+            expected = await db_connector.query(threaded, sql, params)
+            actual = await db_connector.query(native, sql, params)
+            # Run twice so the second call is served from the statement cache
+            cached = await db_connector.query(native, sql, params)
+            if expected == actual == cached:
+                print(f"✅ {label}: {len(actual)} rows")
+            else:
+                failures += 1
+                print(f"❌ {label}")
+                print(f"   threaded: {expected[:3]}")
+                print(f"   async:    {actual[:3]}")
+        print(f"\n📊 {db_connector.get_connection(native)['client'].metrics()}")
+    finally:
+        await db_connector.close(threaded)
+        await db_connector.close(native)
+
+    print("\n" + ("✅ All checks passed" if not failures else f"❌ {failures} check(s) failed"))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())